@@ -1,8 +1,9 @@
 import pygame
 import os
+from assets.sprites.surface_optimizer import optimize_surface
 
-def load_background_image(filename, target_width=1024, target_height=768, scene_folder=None):
-    """Load and scale a background image to fit the screen"""
+def load_background_image(filename, target_width=1024, target_height=768, scene_folder=None, optimize=True):
+    """Load and scale a background image to fit the screen (optimize converts it to the fastest blit format)"""
     try:
         # Get the path to the images directory
         current_dir = os.path.dirname(__file__)
@@ -23,6 +24,10 @@ def load_background_image(filename, target_width=1024, target_height=768, scene_
         # Scale to target resolution
         background = pygame.transform.scale(background, (target_width, target_height))
 
+        # Drop an unused alpha channel / convert once instead of on every blit
+        if optimize:
+            background = optimize_surface(background)
+
         print(f"Successfully loaded background: {filename}")
         return background
 
@@ -1,5 +1,10 @@
 import pygame
 import math
+from .prop_cache import prop_cache
+from .surface_optimizer import optimize_surface
+
+# Bullets alive at once per pool - at one shot every 0.2s a bullet crosses the screen long before this fills up
+BULLET_POOL_SIZE = 64
 
 class Bullet:
     def __init__(self, x, y, direction_x, direction_y, speed=300):
@@ -8,16 +13,17 @@ class Bullet:
         self.direction_x = direction_x
         self.direction_y = direction_y
         self.speed = speed
-        self.sprite = self.create_bullet_sprite()
+        self.sprite = prop_cache.get("bullet", create_bullet_sprite)  # Shared by all bullets
         self.active = True
 
-    def create_bullet_sprite(self):
-        """Create a small yellow bullet sprite"""
-        sprite = pygame.Surface((4, 4), pygame.SRCALPHA)
-        # Yellow bullet with slight orange center
-        pygame.draw.circle(sprite, (255, 255, 0), (2, 2), 2)
-        pygame.draw.circle(sprite, (255, 200, 0), (2, 2), 1)
-        return sprite
+    def reset(self, x, y, direction_x, direction_y, speed=300):
+        """Reuse this bullet for a new shot"""
+        self.x = x
+        self.y = y
+        self.direction_x = direction_x
+        self.direction_y = direction_y
+        self.speed = speed
+        self.active = True
 
     def update(self, dt):
         """Update bullet position"""
@@ -35,6 +41,68 @@ class Bullet:
         return (self.x < -10 or self.x > screen_width + 10 or
                 self.y < -10 or self.y > screen_height + 10)
 
+class BulletPool:
+    def __init__(self, capacity=BULLET_POOL_SIZE):
+        """
+        Preallocated bullets - firing and culling reuse the same objects
+
+        Live bullets are packed at the front of the pool; a bullet that leaves the
+        screen is swapped with the last live one, so nothing is created or removed
+        while shooting.
+
+        Args:
+            capacity: Maximum number of bullets alive at once
+        """
+        self.bullets = [Bullet(0, 0, 0, 0) for _ in range(capacity)]
+        for bullet in self.bullets:
+            bullet.active = False
+        self.count = 0
+        self.sprite = prop_cache.get("bullet", create_bullet_sprite)  # Shared by all bullets
+
+    def fire(self, x, y, direction_x, direction_y, speed=300):
+        """
+        Fire a bullet from the pool
+
+        Returns:
+            The bullet, or None if every pooled bullet is still in flight
+        """
+        if self.count == len(self.bullets):
+            return None
+        bullet = self.bullets[self.count]
+        bullet.reset(x, y, direction_x, direction_y, speed)
+        self.count += 1
+        return bullet
+
+    def update(self, dt, screen_width, screen_height):
+        """Move every live bullet and recycle the ones that left the screen"""
+        bullets = self.bullets
+        index = 0
+        while index < self.count:
+            bullet = bullets[index]
+            bullet.update(dt)
+            if bullet.is_off_screen(screen_width, screen_height):
+                # Swap-remove: the last live bullet takes this slot and is updated next
+                self.count -= 1
+                bullet.active = False
+                bullets[index], bullets[self.count] = bullets[self.count], bullet
+            else:
+                index += 1
+
+    def submit(self, render_queue, layer):
+        """Queue all live bullets as one batch of the shared sprite"""
+        if self.count:
+            render_queue.submit_batch(self.sprite,
+                                      [(int(bullet.x), int(bullet.y)) for bullet in self.bullets[:self.count]],
+                                      layer)
+
+def create_bullet_sprite(variant="normal"):
+    """Create a small yellow bullet sprite"""
+    sprite = pygame.Surface((4, 4), pygame.SRCALPHA)
+    # Yellow bullet with slight orange center
+    pygame.draw.circle(sprite, (255, 255, 0), (2, 2), 2)
+    pygame.draw.circle(sprite, (255, 200, 0), (2, 2), 1)
+    return optimize_surface(sprite)
+
 def get_direction_from_keys(keys):
     """Get shooting direction based on arrow keys or WASD"""
     direction_x = 0
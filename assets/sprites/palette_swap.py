@@ -0,0 +1,170 @@
+"""Palette-swapped sprite sheets for enemy variants, cached in memory and on disk"""
+
+import pygame
+import os
+import math
+import hashlib
+import weakref
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    print("NumPy not available, palette swaps fall back to a flat tint")
+
+from .sprite_sheet_loader import SpriteSheet
+
+# Recolored sheets in use this session, by (sheet, palette) hash - weak, so a sheet
+# unloaded by the clip cache is freed instead of being kept alive here
+_recolored_sheets = weakref.WeakValueDictionary()
+
+def get_cache_dir():
+    """Folder for recolored sheets that survive between runs"""
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    return os.path.join(project_root, "cache", "palette_swaps")
+
+def palette_key(palette):
+    """Stable, hashable form of a palette dict"""
+    return tuple(sorted((name, tuple(value) if isinstance(value, (list, tuple)) else value)
+                        for name, value in palette.items()))
+
+def get_swap_hash(sheet_path, palette):
+    """Hash identifying a recolored sheet - changes when the source file or palette changes"""
+    stat = os.stat(sheet_path)
+    identity = f"{os.path.abspath(sheet_path)}|{stat.st_mtime_ns}|{stat.st_size}|{palette_key(palette)}"
+    return hashlib.sha1(identity.encode("utf-8")).hexdigest()
+
+def get_hue_rotation_matrix(degrees):
+    """RGB matrix rotating hue around the grey axis (luminance preserving)"""
+    angle = math.radians(degrees)
+    cos_a = math.cos(angle)
+    sin_a = math.sin(angle)
+    return np.array([
+        [0.213 + cos_a * 0.787 - sin_a * 0.213, 0.715 - cos_a * 0.715 - sin_a * 0.715, 0.072 - cos_a * 0.072 + sin_a * 0.928],
+        [0.213 - cos_a * 0.213 + sin_a * 0.143, 0.715 + cos_a * 0.285 + sin_a * 0.140, 0.072 - cos_a * 0.072 - sin_a * 0.283],
+        [0.213 - cos_a * 0.213 - sin_a * 0.787, 0.715 - cos_a * 0.715 + sin_a * 0.715, 0.072 + cos_a * 0.928 + sin_a * 0.072]
+    ], dtype=np.float32)
+
+def recolor_surface(surface, palette):
+    """
+    Recolor a surface in place
+
+    Args:
+        surface: Surface to recolor (alpha is left untouched)
+        palette: Dict with optional keys
+                 hue_shift  - degrees to rotate the hue
+                 saturation - saturation multiplier (1.0 = unchanged)
+                 brightness - brightness multiplier (1.0 = unchanged)
+                 tint       - (r, g, b) multiplier, 255 = unchanged
+    """
+    tint = palette.get('tint', (255, 255, 255))
+
+    if not NUMPY_AVAILABLE:
+        # Without NumPy only the tint can be applied
+        surface.fill(tint, special_flags=pygame.BLEND_RGB_MULT)
+        return surface
+
+    # Work directly on the surface pixels through a locked view
+    pixels = pygame.surfarray.pixels3d(surface)
+    rgb = pixels.astype(np.float32)
+
+    hue_shift = palette.get('hue_shift', 0)
+    if hue_shift:
+        rgb = rgb @ get_hue_rotation_matrix(hue_shift).T
+
+    saturation = palette.get('saturation', 1.0)
+    if saturation != 1.0:
+        grey = (rgb @ np.array([0.299, 0.587, 0.114], dtype=np.float32))[..., np.newaxis]
+        rgb = grey + (rgb - grey) * saturation
+
+    rgb *= palette.get('brightness', 1.0)
+    rgb *= np.array(tint, dtype=np.float32) / 255.0
+
+    pixels[...] = np.clip(rgb, 0, 255).astype(np.uint8)
+    del pixels  # Unlock the surface
+    return surface
+
+def load_recolored_sheet(sheet_path, palette):
+    """
+    Get a palette-swapped copy of a sprite sheet
+
+    Built once from the source sheet, then served from memory while any sheet
+    still uses it, or from the disk cache (raw RGBA pixels, so later runs skip
+    PNG decoding entirely).
+    """
+    swap_hash = get_swap_hash(sheet_path, palette)
+
+    # Already loaded this session
+    sheet = _recolored_sheets.get(swap_hash)
+    if sheet is not None:
+        return sheet
+
+    # Built on a previous run
+    cache_dir = get_cache_dir()
+    if os.path.isdir(cache_dir):
+        for filename in os.listdir(cache_dir):
+            if filename.startswith(swap_hash) and filename.endswith(".rgba"):
+                try:
+                    size_text = filename[len(swap_hash) + 1:-len(".rgba")]
+                    width, height = (int(value) for value in size_text.split("x"))
+                    with open(os.path.join(cache_dir, filename), "rb") as cache_file:
+                        pixels = cache_file.read()
+                    sheet = pygame.image.frombytes(pixels, (width, height), "RGBA").convert_alpha()
+                    print(f"Loaded palette swap from cache: {filename}")
+                    _recolored_sheets[swap_hash] = sheet
+                    return sheet
+                except (ValueError, OSError, pygame.error) as e:
+                    print(f"Ignoring bad palette swap cache file {filename}: {e}")
+
+    # Build it from the source sheet
+    sheet = pygame.image.load(sheet_path).convert_alpha()
+    recolor_surface(sheet, palette)
+    _recolored_sheets[swap_hash] = sheet
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        width, height = sheet.get_size()
+        cache_path = os.path.join(cache_dir, f"{swap_hash}_{width}x{height}.rgba")
+        with open(cache_path, "wb") as cache_file:
+            cache_file.write(pygame.image.tobytes(sheet, "RGBA"))
+        print(f"Saved palette swap to cache: {cache_path}")
+    except OSError as e:
+        print(f"Could not save palette swap cache: {e}")
+
+    return sheet
+
+class PaletteSwapSheet(SpriteSheet):
+    def __init__(self, filename, frame_width, frame_height, palette, scale_factor=1, lazy=False):
+        """
+        Sprite sheet whose image is a palette-swapped copy of another sheet
+
+        Args:
+            filename: Path to the source sprite sheet image
+            frame_width: Width of each frame in pixels
+            frame_height: Height of each frame in pixels
+            palette: Recolor settings (see recolor_surface)
+            scale_factor: How much to scale the sprites (1 = original size)
+            lazy: Defer building the recolored image until the first frame is requested
+        """
+        self.palette = palette
+        super().__init__(filename, frame_width, frame_height, scale_factor=scale_factor, lazy=lazy)
+
+    def load_sheet(self):
+        """Load the recolored sheet image"""
+        self.load_attempted = True
+        sheet_path = self.get_sheet_path()
+
+        if not os.path.exists(sheet_path):
+            print(f"Sprite sheet not found: {sheet_path}")
+            self.sheet = None
+            return
+
+        try:
+            self.sheet = load_recolored_sheet(sheet_path, self.palette)
+            sheet_width, sheet_height = self.sheet.get_size()
+            self.cols = sheet_width // self.frame_width
+            self.rows = sheet_height // self.frame_height
+            print(f"Loaded palette-swapped sheet: {self.filename} ({self.cols}x{self.rows} frames)")
+        except pygame.error as e:
+            print(f"Error loading palette-swapped sheet {self.filename}: {e}")
+            self.sheet = None
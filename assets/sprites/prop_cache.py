@@ -0,0 +1,37 @@
+"""Cache for procedurally drawn props - each variant is drawn once and shared"""
+
+
+class PropCache:
+    def __init__(self):
+        """Procedural prop sprites keyed by (prop name, variant)"""
+        self.sprites = {}
+
+        # Statistics
+        self.builds = 0
+
+    def get(self, name, builder, variant="normal"):
+        """
+        Get a prop sprite, drawing it the first time it is asked for
+
+        The sprite is shared - blit it, but do not draw on it.
+
+        Args:
+            name: Prop name, or a tuple like ('hatch', width, height) when size varies
+            builder: Function builder(variant) that draws and returns the sprite
+            variant: Prop variant, e.g. 'normal', 'highlighted', 'open'
+        """
+        key = (name, variant)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = builder(variant)
+            self.sprites[key] = sprite
+            self.builds += 1
+        return sprite
+
+    def clear(self):
+        """Drop all cached prop sprites"""
+        self.sprites.clear()
+
+
+# Shared prop cache used by all scenes
+prop_cache = PropCache()
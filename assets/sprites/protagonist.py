@@ -1,5 +1,6 @@
 import pygame
-from .sprite_sheet_loader import load_protagonist_from_sprite_sheet
+from .sprite_sheet_loader import load_protagonist_from_sprite_sheet, MIRRORED_DIRECTIONS
+from .surface_optimizer import optimize_surface
 
 def create_protagonist_sprite():
     """Create a small FF9-style protagonist sprite with blue pants and red sweater"""
@@ -74,7 +75,8 @@ def create_protagonist_sprite():
     # Scale up the sprite 4x with nearest neighbor for pixel-perfect scaling
     scaled_sprite = pygame.transform.scale(base_sprite, (sprite_width, sprite_height))
 
-    return scaled_sprite
+    # Hard-edged pixel art - blit as an RLE colorkey surface
+    return optimize_surface(scaled_sprite)
 
 def create_protagonist_animation_system():
     """
@@ -93,20 +95,22 @@ def create_protagonist_animation_system():
     from .sprite_sheet_loader import AnimationManager
     animation_manager = AnimationManager()
 
-    # Create procedural frames
+    # Create procedural frames (drawn facing right - the gun is in the right hand)
     frames = create_protagonist_walking_frames()
 
     # Add procedural animations with directional idle poses
     animation_manager.add_animation('idle', [frames[0]], speed=1000)
     animation_manager.add_animation('idle_down', [frames[0]], speed=1000)
-    animation_manager.add_animation('idle_left', [frames[0]], speed=1000)
     animation_manager.add_animation('idle_right', [frames[0]], speed=1000)
     animation_manager.add_animation('idle_up', [frames[0]], speed=1000)
     animation_manager.add_animation('walk_down', frames, speed=150)
-    animation_manager.add_animation('walk_left', frames, speed=150)
     animation_manager.add_animation('walk_right', frames, speed=150)
     animation_manager.add_animation('walk_up', frames, speed=150)
 
+    # Left-facing poses are flipped from their right-facing counterparts once
+    for prefix in ('idle', 'walk'):
+        animation_manager.add_mirrored_animation(f'{prefix}_left', f"{prefix}_{MIRRORED_DIRECTIONS['left']}")
+
     # Set default
     animation_manager.play_animation('idle')
 
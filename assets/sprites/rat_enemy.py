@@ -1,18 +1,27 @@
 import pygame
 import os
 import random
-from .sprite_sheet_loader import SpriteSheet, AnimationManager
+from .sprite_sheet_loader import AnimationManager, ClipCache
 from .smart_frame_detector import get_smart_frame_size
+from .surface_optimizer import optimize_surface
 
 def create_rat_animation_system():
     """Create enemy animation system - randomly choose single or dual enemies"""
     try:
         project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 
-        # Random choice: 1/3 chance each for cockroach, frog, or both
-        choice = random.choice(["cockroach", "frog", "both"])
+        # New fight - evict enemy clips that have not been played for a while
+        enemy_clip_cache.begin_fight()
 
-        if choice == "cockroach":
+        # Random choice: cockroach, frog, both, or one of the palette-swapped variants
+        choice = random.choice(["cockroach", "frog", "both"] + list(ENEMY_VARIANTS))
+
+        if choice in ENEMY_VARIANTS:
+            variant = ENEMY_VARIANTS[choice]
+            enemy_data, success = create_variant_animation_system(project_root, choice)
+            if success:
+                return enemy_data, success, choice, variant['damage'], variant['attack']
+        elif choice == "cockroach":
             enemy_data, success = create_cockroach_animation_system(project_root)
             if success:
                 return enemy_data, success, "cockroach", 3, "BITE"
@@ -32,267 +41,136 @@ def create_rat_animation_system():
         print(f"Error loading enemy sprite sheet: {e}")
         return create_fallback_rat_animation(), False, "rat", 5, "CLAWS"
 
-def create_rat_sprite_animation_system(project_root):
+# Enemy sheets and clips are shared between fights and only extracted when played.
+# Clips that have not been played for this many fights are evicted.
+ENEMY_CLIP_IDLE_FIGHTS = 3
+enemy_clip_cache = ClipCache(max_idle_fights=ENEMY_CLIP_IDLE_FIGHTS)
+
+# Enemy variants recolored from existing sheets (see palette_swap.recolor_surface)
+ENEMY_VARIANTS = {
+    "plague_rat": {
+        "base": "rat",
+        "label": "Plague rat",
+        "palette": {"hue_shift": 40, "saturation": 0.55, "brightness": 0.8, "tint": (200, 230, 180)},
+        "hp": 12,
+        "damage": 4,
+        "attack": "PLAGUE BITE"
+    },
+    "toxic_frog": {
+        "base": "frog",
+        "label": "Toxic frog",
+        "palette": {"hue_shift": 70, "saturation": 1.3, "brightness": 1.05},
+        "hp": 9,
+        "damage": 5,
+        "attack": "TOXIN"
+    }
+}
+
+def get_enemy_base_type(enemy_type):
+    """Get the hand-drawn enemy a (possibly variant) enemy type is based on"""
+    if enemy_type in ENEMY_VARIANTS:
+        return ENEMY_VARIANTS[enemy_type]['base']
+    return enemy_type
+
+def create_variant_animation_system(project_root, variant_name):
+    """Create a palette-swapped variant of one of the sheet-based enemies"""
+    variant = ENEMY_VARIANTS[variant_name]
+    builders = {
+        "rat": create_rat_sprite_animation_system,
+        "cockroach": create_cockroach_animation_system,
+        "frog": create_frog_animation_system
+    }
+    return builders[variant['base']](project_root, palette=variant['palette'], label=variant['label'])
+
+def create_sheet_enemy_animation(sheet_path, frame_width, frame_height, clips, label, palette=None):
+    """
+    Create an enemy animation manager whose clips extract frames on first play
+
+    Args:
+        sheet_path: Path to the enemy sprite sheet
+        frame_width: Width of each frame in pixels
+        frame_height: Height of each frame in pixels
+        clips: List of (animation name, [(col, row), ...], speed, loop)
+        label: Enemy name for log messages
+        palette: Optional recolor settings for a palette-swapped variant
+    """
+    sheet = enemy_clip_cache.get_sheet(sheet_path, frame_width, frame_height, palette)
+
+    # Only check the file is there - decoding waits until a clip is played
+    if not sheet.exists():
+        print(f"Failed to load {label} sprite sheet, using fallback")
+        return create_fallback_rat_animation(), False
+
+    animation_manager = AnimationManager()
+    for name, cells, speed, loop in clips:
+        animation_manager.add_animation(name, enemy_clip_cache.get_clip(sheet, cells), speed=speed, loop=loop)
+
+    # Set default animation to initial selection (extracts just this clip)
+    animation_manager.play_animation('initial_selection')
+
+    print(f"{label} animation system created with {len(clips)} lazy clips")
+    return animation_manager, True
+
+def create_rat_sprite_animation_system(project_root, palette=None, label="Rat"):
     """Create rat animation system from rat.png sprite sheet"""
     try:
         rat_path = os.path.join(project_root, "assets", "images", "sprites", "enemies", "rat.png")
 
-        # Create sprite sheet with correct frame size for 2x4 grid
+        # Sprite sheet is a 2x4 grid (2 columns, 4 rows)
         # The sprite sheet is 1024x1536, so each frame is 512x384
         # But we need more height to include the feet - let's try 512x400
-        frame_width = 512
-        frame_height = 400
-        rat_sheet = SpriteSheet(rat_path, frame_width, frame_height)
-
-        if not rat_sheet.sheet:
-            print("Failed to load rat sprite sheet, using fallback")
-            return create_fallback_rat_animation(), False
-
-        sheet_width, sheet_height = rat_sheet.sheet.get_size()
-        cols = 2  # Known to be 2 columns
-        rows = 4  # Known to be 4 rows
-        print(f"Rat sprite sheet: {sheet_width}x{sheet_height}")
-        print(f"Grid: {cols}x{rows} frames of {frame_width}x{frame_height}")
-
-        # Test frame extraction
-        test_frame = rat_sheet.get_frame(0, 0)
-        if test_frame:
-            print(f"Test frame extracted successfully: {test_frame.get_size()}")
-        else:
-            print("Failed to extract test frame")
-
-        # Extract all 8 frames in 2x4 pattern (2 columns, 4 rows)
-        all_frames = []
-        for row in range(rows):
-            for col in range(cols):
-                frame = rat_sheet.get_frame(col, row)
-                if frame:
-                    all_frames.append(frame)
-                    # Save debug frames to verify extraction
-                    if len(all_frames) <= 8:
-                        rat_sheet.save_debug_frame(col, row, f"debug_rat_2x4_{row}_{col}.png")
-
-        print(f"Extracted {len(all_frames)} rat frames from 2x4 grid")
-
-        if len(all_frames) < 8:
-            print(f"Warning: Only extracted {len(all_frames)} frames, expected 8")
-
-        # Create animation manager
-        animation_manager = AnimationManager()
-
-        # With 8 frames in 2x4 grid, organize as follows:
-        # Row 0 (Frames 0-1): Initial anticipation/idle
-        # Row 1 (Frames 2-3): Attack wind-up
-        # Row 2 (Frames 4-5): Attack impact
-        # Row 3 (Frames 6-7): Recovery/waiting
-
-        # Initial selection phase - gentle idle breathing
-        if len(all_frames) >= 2:
-            initial_frames = [all_frames[0], all_frames[1]]  # Row 0
-            animation_manager.add_animation('initial_selection', initial_frames, speed=800, loop=True)
-        else:
-            animation_manager.add_animation('initial_selection', [all_frames[0]], speed=800, loop=True)
-
-        # Rat attack sequence - wind-up to impact
-        if len(all_frames) >= 6:
-            attack_sequence = [
-                all_frames[2],  # Wind up start (row 1, col 0)
-                all_frames[3],  # Wind up end (row 1, col 1)
-                all_frames[4],  # IMPACT! (row 2, col 0)
-                all_frames[5]   # Impact end (row 2, col 1)
-            ]
-            animation_manager.add_animation('rat_attack', attack_sequence, speed=300, loop=False)
-        elif len(all_frames) >= 4:
-            animation_manager.add_animation('rat_attack', all_frames[2:6], speed=300, loop=False)
-        else:
-            animation_manager.add_animation('rat_attack', all_frames[:2], speed=300, loop=False)
-
-        # Waiting phase - recovery and neutral pose
-        if len(all_frames) >= 8:
-            waiting_frames = [all_frames[6], all_frames[7]]  # Row 3
-            animation_manager.add_animation('waiting', waiting_frames, speed=900, loop=True)
-        else:
-            animation_manager.add_animation('waiting', [all_frames[-1]], speed=900, loop=True)
-
-        # Set default animation to initial selection
-        animation_manager.play_animation('initial_selection')
-
-        print("Rat animation system created with 2x4 sprite sheet")
-        return animation_manager, True
+        # Row 0: Initial anticipation/idle
+        # Row 1: Attack wind-up
+        # Row 2: Attack impact
+        # Row 3: Recovery/waiting
+        clips = [
+            ('initial_selection', [(0, 0), (1, 0)], 800, True),                   # Gentle idle breathing
+            ('rat_attack', [(0, 1), (1, 1), (0, 2), (1, 2)], 300, False),         # Wind-up to impact
+            ('waiting', [(0, 3), (1, 3)], 900, True),                             # Recovery and neutral pose
+        ]
+        return create_sheet_enemy_animation(rat_path, 512, 400, clips, label, palette)
 
     except Exception as e:
         print(f"Error loading rat sprite sheet: {e}")
         return create_fallback_rat_animation(), False
 
-def create_cockroach_animation_system(project_root):
+def create_cockroach_animation_system(project_root, palette=None, label="Cockroach"):
     """Create cockroach animation system from cockroach.png sprite sheet"""
     try:
         cockroach_path = os.path.join(project_root, "assets", "images", "sprites", "enemies", "cockroach.png")
 
         # Cockroach sprite sheet is 3x3 grid (3 columns, 3 rows) = 9 frames
         # 1024x1024 sheet divided by 3x3 = 341x341 per frame
-        frame_width = 341
-        frame_height = 341
-        cockroach_sheet = SpriteSheet(cockroach_path, frame_width, frame_height)
-
-        if not cockroach_sheet.sheet:
-            print("Failed to load cockroach sprite sheet, using fallback")
-            return create_fallback_rat_animation(), False
-
-        sheet_width, sheet_height = cockroach_sheet.sheet.get_size()
-        cols = 3  # Known to be 3 columns
-        rows = 3  # Known to be 3 rows
-        print(f"Cockroach sprite sheet: {sheet_width}x{sheet_height}")
-        print(f"Grid: {cols}x{rows} frames of {frame_width}x{frame_height}")
-
-        # Test frame extraction
-        test_frame = cockroach_sheet.get_frame(0, 0)
-        if test_frame:
-            print(f"Test cockroach frame extracted successfully: {test_frame.get_size()}")
-        else:
-            print("Failed to extract test cockroach frame")
-
-        # Extract all 9 frames in 3x3 pattern
-        all_frames = []
-        for row in range(rows):
-            for col in range(cols):
-                frame = cockroach_sheet.get_frame(col, row)
-                if frame:
-                    all_frames.append(frame)
-                    # Save debug frames to verify extraction
-                    if len(all_frames) <= 9:
-                        cockroach_sheet.save_debug_frame(col, row, f"debug_cockroach_3x3_{row}_{col}.png")
-
-        print(f"Extracted {len(all_frames)} cockroach frames from 3x3 grid")
-
-        if len(all_frames) < 9:
-            print(f"Warning: Only extracted {len(all_frames)} frames, expected 9")
-
-        # Create animation manager
-        animation_manager = AnimationManager()
-
-        # With 9 frames in 3x3 grid, organize as follows:
-        # Row 0 (Frames 0-2): Initial anticipation/idle
-        # Row 1 (Frames 3-5): Attack sequence
-        # Row 2 (Frames 6-8): Recovery/waiting
-
-        # Initial selection phase - gentle idle movement
-        if len(all_frames) >= 3:
-            initial_frames = [all_frames[0], all_frames[1], all_frames[2]]  # Row 0
-            animation_manager.add_animation('initial_selection', initial_frames, speed=600, loop=True)
-        else:
-            animation_manager.add_animation('initial_selection', [all_frames[0]], speed=600, loop=True)
-
-        # Cockroach attack sequence
-        if len(all_frames) >= 6:
-            attack_sequence = [
-                all_frames[3],  # Attack start (row 1, col 0)
-                all_frames[4],  # Attack mid (row 1, col 1)
-                all_frames[5]   # Attack end (row 1, col 2)
-            ]
-            animation_manager.add_animation('rat_attack', attack_sequence, speed=250, loop=False)
-        else:
-            animation_manager.add_animation('rat_attack', all_frames[3:6] if len(all_frames) >= 6 else all_frames[:3], speed=250, loop=False)
-
-        # Waiting phase - recovery and neutral pose
-        if len(all_frames) >= 9:
-            waiting_frames = [all_frames[6], all_frames[7], all_frames[8]]  # Row 2
-            animation_manager.add_animation('waiting', waiting_frames, speed=800, loop=True)
-        else:
-            animation_manager.add_animation('waiting', [all_frames[-1]], speed=800, loop=True)
-
-        # Set default animation to initial selection
-        animation_manager.play_animation('initial_selection')
-
-        print("Cockroach animation system created with 3x3 sprite sheet")
-        return animation_manager, True
+        # Row 0: Initial anticipation/idle
+        # Row 1: Attack sequence
+        # Row 2: Recovery/waiting
+        clips = [
+            ('initial_selection', [(0, 0), (1, 0), (2, 0)], 600, True),  # Gentle idle movement
+            ('rat_attack', [(0, 1), (1, 1), (2, 1)], 250, False),        # Attack start, mid, end
+            ('waiting', [(0, 2), (1, 2), (2, 2)], 800, True),            # Recovery and neutral pose
+        ]
+        return create_sheet_enemy_animation(cockroach_path, 341, 341, clips, label, palette)
 
     except Exception as e:
         print(f"Error loading cockroach sprite sheet: {e}")
         return create_fallback_rat_animation(), False
 
-def create_frog_animation_system(project_root):
+def create_frog_animation_system(project_root, palette=None, label="Poison frog"):
     """Create poison frog animation system from poison_frog.png sprite sheet"""
     try:
         frog_path = os.path.join(project_root, "assets", "images", "sprites", "enemies", "poison_frog.png")
 
         # Poison frog sprite sheet is also 3x3 grid (3 columns, 3 rows) = 9 frames
         # Same frame size as cockroach
-        frame_width = 341
-        frame_height = 341
-        frog_sheet = SpriteSheet(frog_path, frame_width, frame_height)
-
-        if not frog_sheet.sheet:
-            print("Failed to load poison frog sprite sheet, using fallback")
-            return create_fallback_rat_animation(), False
-
-        sheet_width, sheet_height = frog_sheet.sheet.get_size()
-        cols = 3  # Known to be 3 columns
-        rows = 3  # Known to be 3 rows
-        print(f"Poison frog sprite sheet: {sheet_width}x{sheet_height}")
-        print(f"Grid: {cols}x{rows} frames of {frame_width}x{frame_height}")
-
-        # Test frame extraction
-        test_frame = frog_sheet.get_frame(0, 0)
-        if test_frame:
-            print(f"Test frog frame extracted successfully: {test_frame.get_size()}")
-        else:
-            print("Failed to extract test frog frame")
-
-        # Extract all 9 frames in 3x3 pattern
-        all_frames = []
-        for row in range(rows):
-            for col in range(cols):
-                frame = frog_sheet.get_frame(col, row)
-                if frame:
-                    all_frames.append(frame)
-                    # Save debug frames to verify extraction
-                    if len(all_frames) <= 9:
-                        frog_sheet.save_debug_frame(col, row, f"debug_frog_3x3_{row}_{col}.png")
-
-        print(f"Extracted {len(all_frames)} frog frames from 3x3 grid")
-
-        if len(all_frames) < 9:
-            print(f"Warning: Only extracted {len(all_frames)} frames, expected 9")
-
-        # Create animation manager
-        animation_manager = AnimationManager()
-
-        # With 9 frames in 3x3 grid for poison frog:
-        # Row 0 (Frames 0-2): Initial idle/anticipation
-        # Row 1 (Frames 3-5): Poison spewing attack sequence (mouth opening, spewing)
-        # Row 2 (Frames 6-8): Recovery/waiting (mouth closing, return to idle)
-
-        # Initial selection phase - gentle idle breathing
-        if len(all_frames) >= 3:
-            initial_frames = [all_frames[0], all_frames[1], all_frames[2]]  # Row 0
-            animation_manager.add_animation('initial_selection', initial_frames, speed=700, loop=True)
-        else:
-            animation_manager.add_animation('initial_selection', [all_frames[0]], speed=700, loop=True)
-
-        # Poison frog attack sequence - spewing poison
-        if len(all_frames) >= 6:
-            attack_sequence = [
-                all_frames[3],  # Mouth opening (row 1, col 0)
-                all_frames[4],  # Spewing poison (row 1, col 1)
-                all_frames[5]   # Full poison spray (row 1, col 2)
-            ]
-            animation_manager.add_animation('rat_attack', attack_sequence, speed=300, loop=False)
-        else:
-            animation_manager.add_animation('rat_attack', all_frames[3:6] if len(all_frames) >= 6 else all_frames[:3], speed=300, loop=False)
-
-        # Waiting phase - recovery and return to neutral
-        if len(all_frames) >= 9:
-            waiting_frames = [all_frames[6], all_frames[7], all_frames[8]]  # Row 2
-            animation_manager.add_animation('waiting', waiting_frames, speed=850, loop=True)
-        else:
-            animation_manager.add_animation('waiting', [all_frames[-1]], speed=850, loop=True)
-
-        # Set default animation to initial selection
-        animation_manager.play_animation('initial_selection')
-
-        print("Poison frog animation system created with 3x3 sprite sheet")
-        return animation_manager, True
+        # Row 0: Initial idle/anticipation
+        # Row 1: Poison spewing attack sequence (mouth opening, spewing)
+        # Row 2: Recovery/waiting (mouth closing, return to idle)
+        clips = [
+            ('initial_selection', [(0, 0), (1, 0), (2, 0)], 700, True),  # Gentle idle breathing
+            ('rat_attack', [(0, 1), (1, 1), (2, 1)], 300, False),        # Mouth opening, spewing, full spray
+            ('waiting', [(0, 2), (1, 2), (2, 2)], 850, True),            # Recovery and return to neutral
+        ]
+        return create_sheet_enemy_animation(frog_path, 341, 341, clips, label, palette)
 
     except Exception as e:
         print(f"Error loading poison frog sprite sheet: {e}")
@@ -365,4 +243,5 @@ def create_basic_rat_sprite():
     pygame.draw.line(rat_surface, (0, 0, 0), (0, 24), (8, 24), 1)
     pygame.draw.line(rat_surface, (0, 0, 0), (0, 26), (8, 28), 1)
 
-    return rat_surface
\ No newline at end of file
+    # Hard-edged drawing - blit as an RLE colorkey surface
+    return optimize_surface(rat_surface)
\ No newline at end of file
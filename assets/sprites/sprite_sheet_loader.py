@@ -1,9 +1,29 @@
 import pygame
 import os
 from .smart_frame_detector import get_smart_frame_size
+from .surface_optimizer import optimize_surface
+
+# Sheet row holding each facing direction of the protagonist.
+# Map a direction to None when the sheet does not store it.
+PROTAGONIST_DIRECTION_ROWS = {
+    'down': 0,
+    'right': 1,
+    'left': 2,
+    'up': 3
+}
+
+# Directions that can be derived by flipping their horizontal counterpart
+MIRRORED_DIRECTIONS = {
+    'left': 'right',
+    'right': 'left'
+}
+
+def mirror_frames(frames):
+    """Return horizontally flipped copies of a list of frames"""
+    return [pygame.transform.flip(frame, True, False) for frame in frames]
 
 class SpriteSheet:
-    def __init__(self, filename, frame_width, frame_height, scale_factor=1):
+    def __init__(self, filename, frame_width, frame_height, scale_factor=1, optimize=False, lazy=False):
         """
         Load a sprite sheet and set up frame extraction
 
@@ -12,22 +32,36 @@ class SpriteSheet:
             frame_width: Width of each frame in pixels
             frame_height: Height of each frame in pixels
             scale_factor: How much to scale the sprites (1 = original size)
+            optimize: Convert frames with hard (1-bit) transparency to RLE colorkey surfaces
+            lazy: Defer decoding the image until the first frame is requested
         """
         self.filename = filename
         self.frame_width = frame_width
         self.frame_height = frame_height
         self.scale_factor = scale_factor
+        self.optimize = optimize
         self.sheet = None
         self.frames = {}
+        self.load_attempted = False
 
-        self.load_sheet()
+        if not lazy:
+            self.load_sheet()
+
+    def get_sheet_path(self):
+        """Full path of the sprite sheet image"""
+        project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        return os.path.join(project_root, "assets", "images", "sprites", self.filename)
+
+    def exists(self):
+        """Check the sheet image is on disk without decoding it"""
+        return self.sheet is not None or os.path.exists(self.get_sheet_path())
 
     def load_sheet(self):
         """Load the sprite sheet image"""
+        self.load_attempted = True
         try:
             # Try to load the sprite sheet
-            project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-            sheet_path = os.path.join(project_root, "assets", "images", "sprites", self.filename)
+            sheet_path = self.get_sheet_path()
 
             if os.path.exists(sheet_path):
                 self.sheet = pygame.image.load(sheet_path).convert_alpha()
@@ -58,8 +92,20 @@ class SpriteSheet:
             print(f"Error loading sprite sheet {self.filename}: {e}")
             self.sheet = None
 
+    def unload(self):
+        """Drop the decoded sheet and every extracted frame (reloaded on next use)"""
+        self.sheet = None
+        self.frames = {}
+        self.load_attempted = False
+
+    def release_frame(self, col, row):
+        """Drop a cached frame"""
+        self.frames.pop(f"{col}_{row}", None)
+
     def get_frame(self, col, row):
         """Extract a single frame from the sprite sheet"""
+        if not self.sheet and not self.load_attempted:
+            self.load_sheet()  # Lazy sheets decode on first use
         if not self.sheet:
             return None
 
@@ -85,6 +131,9 @@ class SpriteSheet:
             new_height = int(self.frame_height * self.scale_factor)
             frame = pygame.transform.scale(frame, (new_width, new_height))
 
+        if self.optimize:
+            frame = optimize_surface(frame)
+
         # Cache the frame
         self.frames[cache_key] = frame
         return frame
@@ -125,6 +174,103 @@ class SpriteSheet:
             pygame.image.save(frame, os.path.join(debug_path, filename))
             print(f"Saved debug frame: {filename}")
 
+class SheetClip:
+    def __init__(self, sprite_sheet, cells, cache=None):
+        """
+        Animation frames that stay on the sheet until the clip is first played
+
+        Args:
+            sprite_sheet: SpriteSheet holding the frames (can be lazy)
+            cells: List of (col, row) sheet cells, in playback order
+            cache: ClipCache tracking when the clip was last played
+        """
+        self.sprite_sheet = sprite_sheet
+        self.cells = list(cells)
+        self.cache = cache
+        self.frames = None  # Extracted on first play
+        self.last_played_fight = cache.fight_number if cache else 0
+
+    def is_loaded(self):
+        """Check if the frames have been extracted"""
+        return self.frames is not None
+
+    def load(self):
+        """
+        Extract the frames (decoding the sheet if needed) and return them
+
+        Every access counts as a play, so clips in use are never evicted.
+        """
+        if self.cache:
+            self.last_played_fight = self.cache.fight_number
+        if self.frames is None:
+            frames = [self.sprite_sheet.get_frame(col, row) for col, row in self.cells]
+            self.frames = [frame for frame in frames if frame]
+        return self.frames
+
+    def mark_played(self):
+        """Record that the clip was played in the current fight"""
+        self.load()
+
+    def evict(self):
+        """Drop the extracted frames - they are extracted again on next play"""
+        for col, row in self.cells:
+            self.sprite_sheet.release_frame(col, row)
+        self.frames = None
+
+    def __len__(self):
+        return len(self.load())
+
+    def __getitem__(self, index):
+        return self.load()[index]
+
+class ClipCache:
+    def __init__(self, max_idle_fights=3):
+        """
+        Share lazy sprite sheets and clips between fights
+
+        Args:
+            max_idle_fights: Evict clips that were not played for this many fights
+        """
+        self.max_idle_fights = max_idle_fights
+        self.fight_number = 0
+        self.sheets = {}
+        self.clips = {}
+
+    def get_sheet(self, filename, frame_width, frame_height, palette=None):
+        """Get a shared lazy SpriteSheet (palette-swapped if a palette is given) - nothing is decoded until a clip plays"""
+        if palette:
+            from .palette_swap import PaletteSwapSheet, palette_key
+            key = (filename, frame_width, frame_height, palette_key(palette))
+            if key not in self.sheets:
+                self.sheets[key] = PaletteSwapSheet(filename, frame_width, frame_height, palette, lazy=True)
+        else:
+            key = (filename, frame_width, frame_height, None)
+            if key not in self.sheets:
+                self.sheets[key] = SpriteSheet(filename, frame_width, frame_height, lazy=True)
+        return self.sheets[key]
+
+    def get_clip(self, sprite_sheet, cells):
+        """Get a shared clip for a list of (col, row) cells on a sheet"""
+        key = (id(sprite_sheet), tuple(cells))
+        if key not in self.clips:
+            self.clips[key] = SheetClip(sprite_sheet, cells, cache=self)
+        return self.clips[key]
+
+    def begin_fight(self):
+        """Start a new fight and evict clips that have sat unplayed for too long"""
+        self.fight_number += 1
+
+        for clip in self.clips.values():
+            if clip.is_loaded() and self.fight_number - clip.last_played_fight > self.max_idle_fights:
+                clip.evict()
+
+        # Drop decoded sheets that no loaded clip uses anymore
+        for sheet in self.sheets.values():
+            in_use = any(clip.is_loaded() for clip in self.clips.values() if clip.sprite_sheet is sheet)
+            if sheet.sheet and not in_use:
+                print(f"Evicting unused sprite sheet: {sheet.filename}")
+                sheet.unload()
+
 class AnimationManager:
     def __init__(self):
         self.animations = {}
@@ -142,6 +288,20 @@ class AnimationManager:
             'loop': loop
         }
 
+    def add_mirrored_animation(self, name, source_name, speed=None, loop=None):
+        """Add an animation by flipping an existing one horizontally (done once, at load)"""
+        if source_name not in self.animations:
+            return False
+
+        source = self.animations[source_name]
+        self.add_animation(
+            name,
+            mirror_frames(source['frames']),
+            speed=source['speed'] if speed is None else speed,
+            loop=source['loop'] if loop is None else loop
+        )
+        return True
+
     def play_animation(self, name, restart=False):
         """Start playing an animation"""
         if name in self.animations:
@@ -155,6 +315,10 @@ class AnimationManager:
                 self.animation_speed = anim['speed']
                 self.loop = anim['loop']
 
+                # Lazy clips extract their frames the first time they play
+                if isinstance(anim['frames'], SheetClip):
+                    anim['frames'].mark_played()
+
     def update(self, dt):
         """Update animation frame"""
         if not self.current_animation or self.current_animation not in self.animations:
@@ -182,11 +346,21 @@ class AnimationManager:
             return frames[self.current_frame]
         return None
 
-def load_protagonist_from_sprite_sheet():
+def load_protagonist_from_sprite_sheet(direction_rows=None, mirror_directions=None):
     """
     Load protagonist animations from sprite sheet
     This function will look for common sprite sheet filenames
+
+    Args:
+        direction_rows: Sheet row per direction (defaults to PROTAGONIST_DIRECTION_ROWS)
+        mirror_directions: Direction -> counterpart used to derive directions
+                           missing from the sheet (defaults to MIRRORED_DIRECTIONS)
     """
+    if direction_rows is None:
+        direction_rows = PROTAGONIST_DIRECTION_ROWS
+    if mirror_directions is None:
+        mirror_directions = MIRRORED_DIRECTIONS
+
     # Common sprite sheet filenames to try
     possible_files = [
         "protagonist.png",
@@ -241,66 +415,50 @@ def load_protagonist_from_sprite_sheet():
                 except:
                     print("Could not save debug frames")
 
-                # Extract common animation sequences
-                # Assuming typical RPG sprite sheet layout:
-                # Row 0: Down-facing walk cycle
-                # Row 1: Left-facing walk cycle
-                # Row 2: Right-facing walk cycle
-                # Row 3: Up-facing walk cycle
 
+                # Extract common animation sequences
+                # Assuming typical RPG sprite sheet layout (see PROTAGONIST_DIRECTION_ROWS)
                 # Walking animations - assume first frame is idle, next 3 are walking
                 # For 4x4 grid: idle + 3 walking frames per row
-                if sprite_sheet.cols >= 4:
-                    # Extract idle frame (first in each row) - Fix left direction
-                    idle_down = sprite_sheet.get_animation_frames(0, 0, 1, 'horizontal')
-                    idle_left = sprite_sheet.get_animation_frames(0, 2, 1, 'horizontal')  # Try row 2 for left
-                    idle_right = sprite_sheet.get_animation_frames(0, 1, 1, 'horizontal')  # Try row 1 for right
-                    idle_up = sprite_sheet.get_animation_frames(0, 3, 1, 'horizontal')  # Row 3 for up
-
-                    # Extract walking frames (frames 1, 2, 3 in each row)
-                    walk_down = sprite_sheet.get_animation_frames(1, 0, 3, 'horizontal')
-                    walk_left = sprite_sheet.get_animation_frames(1, 2, 3, 'horizontal')  # Try row 2 for left
-                    walk_right = sprite_sheet.get_animation_frames(1, 1, 3, 'horizontal')  # Try row 1 for right
-                    walk_up = sprite_sheet.get_animation_frames(1, 3, 3, 'horizontal')  # Row 3 for up
-                else:
-                    # Fallback for smaller grids
-                    walk_down = sprite_sheet.get_animation_frames(0, 0, min(4, sprite_sheet.cols), 'horizontal')
-                    walk_left = sprite_sheet.get_animation_frames(0, 2, min(4, sprite_sheet.cols), 'horizontal')  # Try row 2 for left
-                    walk_right = sprite_sheet.get_animation_frames(0, 1, min(4, sprite_sheet.cols), 'horizontal')  # Try row 1 for right
-                    walk_up = sprite_sheet.get_animation_frames(0, 3, min(4, sprite_sheet.cols), 'horizontal')  # Row 3 for up
-
-                    idle_down = [walk_down[0]] if walk_down else []
-                    idle_left = [walk_left[0]] if walk_left else []
-                    idle_right = [walk_right[0]] if walk_right else []
-                    idle_up = [walk_up[0]] if walk_up else []
-
-                print(f"Extracted animations: down={len(walk_down)}, left={len(walk_left)}, right={len(walk_right)}, up={len(walk_up)}")
+                idle_frames = {}
+                walk_frames = {}
+
+                for direction, row in direction_rows.items():
+                    if row is None or row >= sprite_sheet.rows:
+                        continue  # Not stored on the sheet - derived by mirroring below
+
+                    if sprite_sheet.cols >= 4:
+                        idle_frames[direction] = sprite_sheet.get_animation_frames(0, row, 1, 'horizontal')
+                        walk_frames[direction] = sprite_sheet.get_animation_frames(1, row, 3, 'horizontal')
+                    else:
+                        # Fallback for smaller grids
+                        walk = sprite_sheet.get_animation_frames(0, row, min(4, sprite_sheet.cols), 'horizontal')
+                        walk_frames[direction] = walk
+                        idle_frames[direction] = [walk[0]] if walk else []
+
+                # Derive missing directions by flipping their counterpart once, at load
+                for direction in direction_rows:
+                    source = mirror_directions.get(direction)
+                    if walk_frames.get(direction) or not source or not walk_frames.get(source):
+                        continue
+
+                    idle_frames[direction] = mirror_frames(idle_frames.get(source, []))
+                    walk_frames[direction] = mirror_frames(walk_frames[source])
+                    print(f"Derived {direction} animations by mirroring {source}")
+
+                print("Extracted animations: " + ", ".join(
+                    f"{direction}={len(frames)}" for direction, frames in walk_frames.items()))
 
                 # Add animations with proper idle and walking frames
-                if idle_down:
-                    animation_manager.add_animation('idle_down', idle_down, speed=1000)
-                    animation_manager.add_animation('idle', idle_down, speed=1000)  # Default idle
-
-                if idle_left:
-                    animation_manager.add_animation('idle_left', idle_left, speed=1000)
-
-                if idle_right:
-                    animation_manager.add_animation('idle_right', idle_right, speed=1000)
-
-                if idle_up:
-                    animation_manager.add_animation('idle_up', idle_up, speed=1000)
-
-                if walk_down:
-                    animation_manager.add_animation('walk_down', walk_down, speed=200)
-
-                if walk_left:
-                    animation_manager.add_animation('walk_left', walk_left, speed=200)
+                if idle_frames.get('down'):
+                    animation_manager.add_animation('idle', idle_frames['down'], speed=1000)  # Default idle
 
-                if walk_right:
-                    animation_manager.add_animation('walk_right', walk_right, speed=200)
+                for direction in direction_rows:
+                    if idle_frames.get(direction):
+                        animation_manager.add_animation(f'idle_{direction}', idle_frames[direction], speed=1000)
 
-                if walk_up:
-                    animation_manager.add_animation('walk_up', walk_up, speed=200)
+                    if walk_frames.get(direction):
+                        animation_manager.add_animation(f'walk_{direction}', walk_frames[direction], speed=200)
 
                 # Set default animation
                 animation_manager.play_animation('idle')
@@ -308,4 +466,4 @@ def load_protagonist_from_sprite_sheet():
                 return animation_manager, sprite_sheet
 
     print("No sprite sheet found, falling back to procedural sprite")
-    return None, None
\ No newline at end of file
+    return None, None
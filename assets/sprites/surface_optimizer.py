@@ -0,0 +1,82 @@
+"""Convert loaded or procedural surfaces to the cheapest format to blit"""
+
+import pygame
+
+# Alpha classes reported by classify_alpha()
+ALPHA_OPAQUE = 'opaque'            # Every pixel fully opaque - alpha channel is wasted
+ALPHA_BINARY = 'binary'            # Hard transparency only (alpha is 0 or 255)
+ALPHA_TRANSLUCENT = 'translucent'  # Truly varying alpha - keep per-pixel alpha
+
+# Colorkeys to try, in order - the first one not used by a visible pixel wins
+COLORKEY_CANDIDATES = [
+    (255, 0, 255),  # Magenta
+    (0, 255, 255),  # Cyan
+    (1, 2, 3),
+    (254, 1, 253),
+    (3, 254, 1),
+]
+
+def classify_alpha(surface):
+    """Return ALPHA_OPAQUE, ALPHA_BINARY or ALPHA_TRANSLUCENT for a surface"""
+    if not surface.get_flags() & pygame.SRCALPHA:
+        return ALPHA_OPAQUE
+
+    width, height = surface.get_size()
+    total_pixels = width * height
+
+    # Masks compare alpha against a threshold: > 0 is visible, > 254 is solid
+    visible = pygame.mask.from_surface(surface, 0).count()
+    solid = pygame.mask.from_surface(surface, 254).count()
+
+    if solid == total_pixels:
+        return ALPHA_OPAQUE
+    if solid == visible:
+        return ALPHA_BINARY
+    return ALPHA_TRANSLUCENT
+
+def find_unused_colorkey(surface):
+    """Pick a colorkey that no visible pixel of the surface uses"""
+    visible = pygame.mask.from_surface(surface, 0)
+
+    for color in COLORKEY_CANDIDATES:
+        # Exact RGB match, any alpha
+        matches = pygame.mask.from_threshold(surface, color, (1, 1, 1, 255))
+        if not matches.overlap_area(visible, (0, 0)):
+            return color
+
+    return None
+
+def optimize_surface(surface, rle=True):
+    """
+    Convert a surface to the fastest blit format for its alpha usage
+
+    Opaque surfaces lose their alpha channel, surfaces with hard (1-bit)
+    transparency become colorkeyed (RLE accelerated), and surfaces with
+    truly varying alpha keep per-pixel alpha.
+
+    Args:
+        surface: Surface to convert
+        rle: Use RLEACCEL for colorkeyed surfaces
+    """
+    if surface is None:
+        return None
+
+    # convert() needs a display mode to match
+    display_ready = pygame.display.get_surface() is not None
+    alpha_class = classify_alpha(surface)
+
+    if alpha_class == ALPHA_OPAQUE:
+        return surface.convert() if display_ready else surface
+
+    if alpha_class == ALPHA_BINARY:
+        colorkey = find_unused_colorkey(surface)
+        if colorkey:
+            keyed = pygame.Surface(surface.get_size())
+            if display_ready:
+                keyed = keyed.convert()
+            keyed.fill(colorkey)
+            keyed.blit(surface, (0, 0))
+            keyed.set_colorkey(colorkey, pygame.RLEACCEL if rle else 0)
+            return keyed
+
+    return surface.convert_alpha() if display_ready else surface
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark blit throughput for each asset class, as loaded vs. optimized
+(opaque -> convert(), hard transparency -> RLE colorkey, soft alpha -> convert_alpha())
+"""
+import pygame
+import sys
+import os
+import time
+
+# Add project to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+SCREEN_SIZE = (1024, 768)
+BLIT_SECONDS = 0.5  # Time spent blitting each surface variant
+
+def measure_blits_per_second(screen, surface, seconds=BLIT_SECONDS):
+    """Blit a surface repeatedly and return blits per second"""
+    max_x = max(1, screen.get_width() - surface.get_width())
+    max_y = max(1, screen.get_height() - surface.get_height())
+    positions = [((i * 37) % max_x, (i * 53) % max_y) for i in range(64)]
+
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        for pos in positions:
+            screen.blit(surface, pos)
+        count += len(positions)
+
+    return count / (time.perf_counter() - start)
+
+def load_backgrounds():
+    """Background images, loaded and scaled the way the states do it"""
+    backgrounds = []
+    backgrounds_dir = os.path.join("assets", "images", "backgrounds")
+    for scene_folder in sorted(os.listdir(backgrounds_dir)):
+        folder = os.path.join(backgrounds_dir, scene_folder)
+        if not os.path.isdir(folder):
+            continue
+        for filename in sorted(os.listdir(folder)):
+            if filename.endswith(".png"):
+                image = pygame.image.load(os.path.join(folder, filename))
+                image = pygame.transform.scale(image, SCREEN_SIZE)
+                backgrounds.append((f"{scene_folder}/{filename}", image))
+    return backgrounds
+
+def load_procedural_sprites():
+    """Procedural fallback sprites, before optimization"""
+    from assets.sprites import protagonist, rat_enemy
+
+    # Build the raw SRCALPHA versions by skipping the optimizer
+    original = protagonist.optimize_surface
+    protagonist.optimize_surface = lambda surface: surface
+    rat_enemy.optimize_surface = lambda surface: surface
+    try:
+        sprites = [
+            ("protagonist fallback", protagonist.create_protagonist_sprite()),
+            ("rat fallback", rat_enemy.create_basic_rat_sprite()),
+        ]
+    finally:
+        protagonist.optimize_surface = original
+        rat_enemy.optimize_surface = original
+    return sprites
+
+def load_sheet_frames():
+    """A frame from each sprite sheet, extracted the way SpriteSheet does it"""
+    from assets.sprites.sprite_sheet_loader import SpriteSheet
+
+    sheets = [
+        ("protagonist.png", 256, 320),
+        ("enemies/cockroach.png", 341, 341),
+        ("enemies/poison_frog.png", 341, 341),
+        ("enemies/rat.png", 512, 400),
+    ]
+
+    frames = []
+    for filename, frame_width, frame_height in sheets:
+        sheet = SpriteSheet(filename, frame_width, frame_height)
+        frame = sheet.get_frame(0, 0)
+        if frame:
+            frames.append((filename, frame))
+    return frames
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+
+    from assets.sprites.surface_optimizer import classify_alpha, optimize_surface
+
+    asset_classes = [
+        ("Backgrounds", load_backgrounds()),
+        ("Procedural sprites", load_procedural_sprites()),
+        ("Sprite sheet frames", load_sheet_frames()),
+    ]
+
+    print(f"\n{'asset':<28} {'alpha':<12} {'loaded/s':>10} {'optimized/s':>12} {'speedup':>8}")
+    for class_name, assets in asset_classes:
+        print(f"\n{class_name}")
+        for name, surface in assets:
+            alpha_class = classify_alpha(surface)
+            before = measure_blits_per_second(screen, surface)
+            after = measure_blits_per_second(screen, optimize_surface(surface))
+            print(f"  {name:<26} {alpha_class:<12} {before:>10.0f} {after:>12.0f} {after / before:>7.2f}x")
+
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -8,11 +8,19 @@ import pygame
 import sys
 import argparse
 from src.game import Game
+from src.rendering.presenter import SCALE_STRATEGIES, SCALE_NEAREST
+from src.effects.weather_quality import WEATHER_LEVELS, DEFAULT_WEATHER_LEVEL
 
 def main():
     parser = argparse.ArgumentParser(description='Ligne Maudite - Underground Bunker RPG')
     parser.add_argument('--scene',
                        help='Start directly in a specific scene (0=story, 1=forest path, 2=field, 3=behind bunker, 4=dragonteeth, 5=bunker interior, fight0=battle arena)')
+    parser.add_argument('--dirty-rects', action='store_true',
+                       help='Only redraw the parts of static screens (door, box, puzzle) that changed - windowed mode only')
+    parser.add_argument('--scale-mode', choices=SCALE_STRATEGIES, default=SCALE_NEAREST,
+                       help='How fullscreen scales the game (integer=letterboxed whole-number scale, nearest, smooth, scaled=SDL GPU scaling)')
+    parser.add_argument('--weather-quality', choices=WEATHER_LEVELS + ['auto'], default=DEFAULT_WEATHER_LEVEL,
+                       help='Rain, puddle and lightning detail (auto=step down/up to hold 60 FPS)')
 
     args = parser.parse_args()
 
@@ -34,7 +42,8 @@ def main():
         start_scene = None
 
     pygame.init()
-    game = Game(start_scene=start_scene)
+    game = Game(start_scene=start_scene, dirty_rects=args.dirty_rects, scale_mode=args.scale_mode,
+                weather_level=args.weather_quality)
     game.run()
     pygame.quit()
     sys.exit()
@@ -15,6 +15,10 @@ class AudioManager:
         self.music_channel = pygame.mixer.Channel(1)
         self.sfx_channel = pygame.mixer.Channel(2)
 
+        # Weather sounds (thunder) get a few channels so overlapping rumbles don't cut each other off
+        self.weather_channels = [pygame.mixer.Channel(3), pygame.mixer.Channel(4), pygame.mixer.Channel(5)]
+        self.next_weather_channel = 0
+
         # Loaded sounds
         self.sounds = {}
         self.ambient_sound = None
@@ -120,6 +124,23 @@ class AudioManager:
             print(f"SFX sound not found: {sound_name}")
             return False
 
+    def play_weather(self, sound, volume=1.0):
+        """Play a generated weather sound (thunder) on a free weather channel at ambient volume"""
+        try:
+            # First idle channel - if all are busy, take over the one started longest ago
+            channel = next((channel for channel in self.weather_channels if not channel.get_busy()), None)
+            if channel is None:
+                channel = self.weather_channels[self.next_weather_channel]
+            self.next_weather_channel = (self.weather_channels.index(channel) + 1) % len(self.weather_channels)
+
+            # Volume goes on the channel, so the same variant can overlap itself at another loudness
+            channel.play(sound)
+            channel.set_volume(self.ambient_volume * self.master_volume * volume)
+            return True
+        except Exception as e:
+            print(f"Error playing weather sound: {e}")
+            return False
+
     def stop_ambient(self, fade_out_ms=1000):
         """Stop ambient sound with optional fade out"""
         if self.ambient_channel.get_busy():
@@ -0,0 +1,169 @@
+"""Procedural thunder - filtered noise rumbles synthesized at startup"""
+
+import random
+import pygame
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    print("NumPy not available, lightning strikes are silent")
+
+# Speed of sound in kilometres per second - thunder arrives 3 seconds per km after the flash
+SPEED_OF_SOUND = 0.343
+
+# Strikes closer than this (km) use the sharp cracking variants
+CLOSE_DISTANCE = 1.5
+
+# Pre-synthesized variants per kind of strike
+THUNDER_VARIANTS = 3
+
+# Synthesis settings for each kind of strike
+THUNDER_STYLES = {
+    "close": {
+        "duration": (3.5, 5.0),   # seconds
+        "cutoff": (500, 900),     # Hz - brighter rumble
+        "attack": (0.01, 0.03),   # seconds
+        "decay": (1.0, 1.6),      # seconds
+        "crack": 0.8,             # Strength of the initial crack
+        "rolls": (2, 4),          # Number of extra rumble swells
+    },
+    "far": {
+        "duration": (4.0, 6.0),
+        "cutoff": (120, 250),
+        "attack": (0.2, 0.5),
+        "decay": (1.5, 2.5),
+        "crack": 0.0,
+        "rolls": (3, 6),
+    },
+}
+
+
+def filtered_noise(samples, sample_rate, low_cut, high_cut):
+    """
+    White noise band-limited in the frequency domain
+
+    Args:
+        samples: Number of samples
+        sample_rate: Samples per second
+        low_cut, high_cut: Soft edges of the pass band in Hz
+    """
+    size = 1 << (samples - 1).bit_length()  # Power-of-two FFTs are many times faster
+    spectrum = np.fft.rfft(np.random.standard_normal(size))
+    freqs = np.fft.rfftfreq(size, 1.0 / sample_rate)
+    gain = (freqs / (freqs + low_cut)) / (1.0 + (freqs / high_cut) ** 4)
+    return np.fft.irfft(spectrum * gain, size)[:samples]
+
+
+class ThunderGenerator:
+    def __init__(self, audio_manager=None, variants=THUNDER_VARIANTS):
+        """
+        Thunder for lightning strikes, synthesized from filtered noise instead of shipped as files
+
+        A few variants of each style are synthesized once and kept as Sounds;
+        each strike then schedules one to play after the sound travel delay.
+
+        Args:
+            audio_manager: AudioManager that plays the thunder (None for silent)
+            variants: Number of variants synthesized per style
+        """
+        self.audio = audio_manager
+        self.sounds = {style: [] for style in THUNDER_STYLES}
+        self.pending = []  # [seconds until heard, distance in km]
+
+        if audio_manager is None or not NUMPY_AVAILABLE:
+            return
+
+        mixer_format = pygame.mixer.get_init()
+        if mixer_format is None:
+            print("Mixer not initialized, lightning strikes are silent")
+            return
+
+        sample_rate, sample_size, channels = mixer_format
+        if sample_size not in (-16, 16, 32):
+            print(f"Unsupported mixer format {sample_size}, lightning strikes are silent")
+            return
+
+        for style, settings in THUNDER_STYLES.items():
+            for _ in range(variants):
+                wave = self.synthesize(sample_rate, settings)
+                self.sounds[style].append(self.make_sound(wave, sample_size, channels))
+        print(f"Synthesized {variants * len(THUNDER_STYLES)} thunder variants")
+
+    def synthesize(self, sample_rate, settings):
+        """
+        Build one thunder clap as a float array in -1.0..1.0
+
+        A low-passed rumble rises and decays with a few random swells,
+        and close strikes start with a short bright crack.
+        """
+        duration = random.uniform(*settings["duration"])
+        samples = int(duration * sample_rate)
+        t = np.arange(samples) / sample_rate
+
+        rumble = filtered_noise(samples, sample_rate, 20, random.uniform(*settings["cutoff"]))
+        rumble /= np.abs(rumble).max()
+
+        attack = random.uniform(*settings["attack"])
+        decay = random.uniform(*settings["decay"])
+        envelope = (1.0 - np.exp(-t / attack)) * np.exp(-t / decay)
+
+        # Rolling swells as the sound arrives from different parts of the bolt
+        for _ in range(random.randint(*settings["rolls"])):
+            center = random.uniform(0.1, 0.7) * duration
+            width = random.uniform(0.15, 0.5)
+            envelope += random.uniform(0.2, 0.6) * np.exp(-((t - center) / width) ** 2) * np.exp(-t / (decay * 2))
+
+        wave = rumble * envelope
+        if settings["crack"] > 0:
+            crack = filtered_noise(samples, sample_rate, 1500, 6000)
+            crack /= np.abs(crack).max()
+            wave += settings["crack"] * crack * np.exp(-t / 0.08)
+
+        # Fade the tail so the sound ends in silence
+        fade = min(samples, int(0.3 * sample_rate))
+        wave[-fade:] *= np.linspace(1.0, 0.0, fade)
+        return wave / np.abs(wave).max() * 0.9
+
+    def make_sound(self, wave, sample_size, channels):
+        """Convert a float wave to a Sound in the mixer's sample format"""
+        if sample_size == 32:
+            samples = wave.astype(np.float32)
+        elif sample_size == -16:
+            samples = (wave * 32767).astype(np.int16)
+        else:
+            samples = ((wave + 1.0) * 32767.5).astype(np.uint16)
+
+        if channels > 1:
+            # Slightly offset copy per channel for some width
+            delayed = np.roll(samples, 40)
+            samples = np.column_stack([samples if channel % 2 == 0 else delayed for channel in range(channels)])
+        return pygame.sndarray.make_sound(np.ascontiguousarray(samples))
+
+    def schedule(self, distance):
+        """
+        Queue thunder for a strike
+
+        Args:
+            distance: Distance to the strike in km - sets the delay, loudness and variant
+        """
+        if self.sounds["close"]:
+            self.pending.append([distance / SPEED_OF_SOUND, distance])
+
+    def update(self, dt):
+        """Play thunder whose delay has run out"""
+        for thunder in self.pending:
+            thunder[0] -= dt
+        for _, distance in [thunder for thunder in self.pending if thunder[0] <= 0]:
+            self.play(distance)
+        self.pending = [thunder for thunder in self.pending if thunder[0] > 0]
+
+    def play(self, distance):
+        """Play a random variant for a strike at a distance"""
+        style = "close" if distance < CLOSE_DISTANCE else "far"
+        volume = max(0.25, min(1.0, 1.5 / (1.0 + distance)))
+        self.audio.play_weather(random.choice(self.sounds[style]), volume)
+
+    def clear(self):
+        """Forget thunder that has not been heard yet"""
+        self.pending = []
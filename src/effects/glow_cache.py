@@ -0,0 +1,117 @@
+"""Pre-rendered radial glow textures for lights, drawn with additive blending"""
+
+import pygame
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    print("NumPy not available, glow textures are drawn with circles")
+
+# Quantization so flickering lights reuse a handful of textures
+RADIUS_STEP = 2         # Glow radius rounded to this many pixels
+FALLOFF_STEP = 0.1      # Falloff exponent rounded to this step
+BRIGHTNESS_LEVELS = 16  # Flicker brightness (alpha) levels per glow
+
+
+class GlowCache:
+    def __init__(self):
+        """Radial glow textures keyed by quantized (radius, color, falloff, brightness)"""
+        # (radius, color, falloff) -> full brightness glow
+        self.base_textures = {}
+        # (radius, color, falloff, level) -> glow dimmed to a brightness level
+        self.textures = {}
+
+    def quantize(self, radius, color, falloff):
+        """Round glow parameters so nearby values share a texture"""
+        radius = max(RADIUS_STEP, int(round(radius / RADIUS_STEP)) * RADIUS_STEP)
+        falloff = round(round(falloff / FALLOFF_STEP) * FALLOFF_STEP, 2)
+        return radius, tuple(int(c) for c in color[:3]), falloff
+
+    def create_glow(self, radius, color, falloff):
+        """
+        Render a glow whose color fades from full at the center to black at the radius
+
+        Black is transparent under additive blending, so no alpha channel is needed.
+        """
+        size = radius * 2
+        if NUMPY_AVAILABLE:
+            xs, ys = np.indices((size, size), dtype=np.float32)
+            distance = np.sqrt((xs + 0.5 - radius) ** 2 + (ys + 0.5 - radius) ** 2) / radius
+            intensity = np.clip(1.0 - distance, 0.0, 1.0) ** falloff
+            pixels = (intensity[..., None] * np.array(color, dtype=np.float32)).astype(np.uint8)
+            glow = pygame.surfarray.make_surface(pixels)
+        else:
+            glow = pygame.Surface((size, size))
+            glow.fill((0, 0, 0))
+            # Largest (dimmest) ring first, brighter rings on top
+            for ring in range(radius, 0, -1):
+                intensity = (1.0 - ring / radius) ** falloff
+                pygame.draw.circle(glow, tuple(int(c * intensity) for c in color), (radius, radius), ring)
+
+        if pygame.display.get_surface() is not None:
+            glow = glow.convert()
+        return glow
+
+    def get_glow(self, radius, color, falloff=1.0, brightness=1.0):
+        """
+        Get a glow texture for BLEND_RGB_ADD blitting
+
+        Args:
+            radius: Glow radius in pixels
+            color: RGB color at the glow center
+            falloff: Falloff exponent (higher = tighter glow)
+            brightness: Flicker brightness 0.0-1.0
+
+        Returns:
+            Surface of size (2 * radius, 2 * radius), or None when too dim to see
+        """
+        level = int(round(max(0.0, min(1.0, brightness)) * BRIGHTNESS_LEVELS))
+        if level == 0:
+            return None
+
+        key = self.quantize(radius, color, falloff)
+        texture_key = key + (level,)
+        texture = self.textures.get(texture_key)
+        if texture is not None:
+            return texture
+
+        base = self.base_textures.get(key)
+        if base is None:
+            base = self.create_glow(*key)
+            self.base_textures[key] = base
+
+        if level == BRIGHTNESS_LEVELS:
+            texture = base
+        else:
+            # Dim a copy - additive blits ignore surface alpha, so flicker is baked in
+            value = 255 * level // BRIGHTNESS_LEVELS
+            texture = base.copy()
+            texture.fill((value, value, value), special_flags=pygame.BLEND_RGB_MULT)
+
+        self.textures[texture_key] = texture
+        return texture
+
+    def get_blit(self, x, y, radius, color, falloff=1.0, brightness=1.0):
+        """Get a (texture, position, area, flags) tuple centered on (x, y) for Surface.blits, or None"""
+        texture = self.get_glow(radius, color, falloff, brightness)
+        if texture is None:
+            return None
+        half = texture.get_width() // 2
+        return (texture, (int(x) - half, int(y) - half), None, pygame.BLEND_RGB_ADD)
+
+    def draw(self, surface, x, y, radius, color, falloff=1.0, brightness=1.0):
+        """Add a glow centered on (x, y) to a surface"""
+        glow_blit = self.get_blit(x, y, radius, color, falloff, brightness)
+        if glow_blit:
+            texture, pos, _, flags = glow_blit
+            surface.blit(texture, pos, special_flags=flags)
+
+    def clear(self):
+        """Drop all cached glow textures"""
+        self.base_textures.clear()
+        self.textures.clear()
+
+
+# Shared glow cache used by all lights
+glow_cache = GlowCache()
@@ -3,6 +3,10 @@
 import pygame
 import random
 import math
+from .glow_cache import glow_cache
+
+# Glow brightness at full flicker, relative to the light color
+GLOW_STRENGTH = 0.55
 
 class FlickeringLight:
     def __init__(self, x, y, base_radius=8, color=(255, 200, 100)):
@@ -53,42 +57,28 @@ class FlickeringLight:
         if random.random() < 0.02:  # 2% chance per frame
             self.flicker_speed = random.uniform(0.1, 0.3)
 
-    def draw(self, surface):
-        """Draw the flickering light with glow effect"""
-        # Calculate current position
+    def get_glow_blit(self):
+        """Get this light's glow as a Surface.blits entry (None when too dim)"""
+        # Cached radial glow, dimmed to the current flicker brightness
+        return glow_cache.get_blit(self.x + self.offset_x, self.y + self.offset_y,
+                                   self.radius * 1.5, self.color,
+                                   falloff=1.0, brightness=self.brightness * GLOW_STRENGTH)
+
+    def draw_core(self, surface):
+        """Draw the core light (brightest)"""
         current_x = int(self.x + self.offset_x)
         current_y = int(self.y + self.offset_y)
-
-        # Create color with current brightness
-        current_color = tuple(int(c * self.brightness) for c in self.color)
-
-        # Draw multiple circles for glow effect
-        for i in range(3):
-            glow_radius = int(self.radius * (1.5 - i * 0.3))
-            glow_alpha = int(80 * self.brightness * (1 - i * 0.3))
-
-            if glow_radius > 0 and glow_alpha > 0:
-                # Create a surface for the glow circle with alpha
-                glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-                pygame.draw.circle(
-                    glow_surface,
-                    (*current_color, glow_alpha),
-                    (glow_radius, glow_radius),
-                    glow_radius
-                )
-
-                # Blit with proper positioning
-                surface.blit(
-                    glow_surface,
-                    (current_x - glow_radius, current_y - glow_radius),
-                    special_flags=pygame.BLEND_ALPHA_SDL2
-                )
-
-        # Draw the core light (brightest)
         core_radius = max(1, int(self.radius * 0.5))
         core_color = tuple(min(255, int(c * self.brightness * 1.2)) for c in self.color)
         pygame.draw.circle(surface, core_color, (current_x, current_y), core_radius)
 
+    def draw(self, surface):
+        """Draw the flickering light with glow effect"""
+        glow_blit = self.get_glow_blit()
+        if glow_blit:
+            surface.blits([glow_blit], doreturn=False)
+        self.draw_core(surface)
+
 class LightManager:
     """Manages multiple light effects"""
 
@@ -107,9 +97,13 @@ class LightManager:
             light.update(dt)
 
     def draw(self, surface):
-        """Draw all lights"""
+        """Draw all lights - every glow goes out in a single blits() call"""
+        glow_blits = [glow for glow in (light.get_glow_blit() for light in self.lights) if glow]
+        if glow_blits:
+            surface.blits(glow_blits, doreturn=False)
+
         for light in self.lights:
-            light.draw(surface)
+            light.draw_core(surface)
 
     def clear(self):
         """Remove all lights"""
@@ -0,0 +1,353 @@
+"""Particle engine - emitters, struct-of-arrays storage and batched stamp drawing"""
+
+import math
+import random
+import pygame
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    print("NumPy not available, particles are simulated one at a time")
+
+# Maximum live particles per effect - raise or lower to trade detail for speed
+PARTICLE_BUDGETS = {
+    "poison_cloud": 64,
+    "splash": 64,
+    "wind": 64,
+    "sparkles": 32,
+}
+
+# Fading particles reuse this many alpha steps per stamp
+ALPHA_LEVELS = 32
+
+# Largest particle radius in pixels (bigger particles are clamped)
+MAX_PARTICLE_SIZE = 63
+
+# Particle shapes
+SHAPE_CIRCLE = "circle"
+SHAPE_SQUARE = "square"
+
+
+class ParticleStamps:
+    def __init__(self):
+        """Pre-rendered particles keyed by (shape, color, size, alpha level)"""
+        self.stamps = {}
+
+    def create_stamp(self, shape, color, size, level):
+        """Draw one particle of radius size onto a (2 * size) square surface"""
+        alpha = 255 * level // ALPHA_LEVELS
+        stamp = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        if shape == SHAPE_SQUARE:
+            stamp.fill((*color, alpha))
+        else:
+            pygame.draw.circle(stamp, (*color, alpha), (size, size), size)
+        if pygame.display.get_surface() is not None:
+            stamp = stamp.convert_alpha()
+        return stamp
+
+    def get(self, shape, color, size, level):
+        """Get the stamp for a particle, drawing it on first use"""
+        key = (shape, color, size, level)
+        stamp = self.stamps.get(key)
+        if stamp is None:
+            stamp = self.create_stamp(shape, color, size, level)
+            self.stamps[key] = stamp
+        return stamp
+
+    def clear(self):
+        """Drop all cached stamps"""
+        self.stamps.clear()
+
+
+# Shared particle stamps used by every particle system
+particle_stamps = ParticleStamps()
+
+
+class ParticleSystem:
+    def __init__(self, capacity, colors, shape=SHAPE_CIRCLE, gravity=0.0,
+                 fade_out=True, fade_rate=0.0, shrink=False):
+        """
+        Fixed-capacity particle simulation for one kind of effect
+
+        Live particles are packed at the front of each array; dead ones are
+        compacted away in one pass, and everything is drawn with one blits() call.
+
+        Args:
+            capacity: Maximum number of live particles (see PARTICLE_BUDGETS)
+            colors: Palette of RGB colors particles pick from
+            shape: SHAPE_CIRCLE or SHAPE_SQUARE
+            gravity: Downward acceleration in pixels per second squared
+            fade_out: Fade alpha to zero over each particle's lifetime
+            fade_rate: Alpha lost per second on top of fade_out
+            shrink: Shrink particles to nothing over their lifetime
+        """
+        self.capacity = capacity
+        self.colors = list(colors)
+        self.shape = shape
+        self.gravity = gravity
+        self.fade_out = fade_out
+        self.fade_rate = fade_rate
+        self.shrink = shrink
+        self.count = 0
+
+        if NUMPY_AVAILABLE:
+            self.x = np.zeros(capacity, dtype=np.float32)
+            self.y = np.zeros(capacity, dtype=np.float32)
+            self.vx = np.zeros(capacity, dtype=np.float32)
+            self.vy = np.zeros(capacity, dtype=np.float32)
+            self.age = np.zeros(capacity, dtype=np.float32)
+            self.lifetime = np.zeros(capacity, dtype=np.float32)
+            self.size = np.zeros(capacity, dtype=np.float32)
+            self.alpha = np.zeros(capacity, dtype=np.float32)
+            self.wind_speed = np.zeros(capacity, dtype=np.float32)  # Speed in the average wind
+            self.color = np.zeros(capacity, dtype=np.int16)
+        else:
+            # One [x, y, vx, vy, age, lifetime, size, alpha, wind_speed, color] list per particle
+            self.particles = []
+
+    def is_active(self):
+        """Whether any particle is still alive"""
+        return self.count > 0
+
+    def add(self, xs, ys, vxs, vys, lifetimes, sizes, alphas, wind_speeds, colors):
+        """Add particles from equal-length sequences (particles past capacity are skipped)"""
+        count = min(len(xs), self.capacity - self.count)
+        if count <= 0:
+            return
+
+        if NUMPY_AVAILABLE:
+            new = slice(self.count, self.count + count)
+            self.x[new] = xs[:count]
+            self.y[new] = ys[:count]
+            self.vx[new] = vxs[:count]
+            self.vy[new] = vys[:count]
+            self.age[new] = 0.0
+            self.lifetime[new] = lifetimes[:count]
+            self.size[new] = sizes[:count]
+            self.alpha[new] = alphas[:count]
+            self.wind_speed[new] = wind_speeds[:count]
+            self.color[new] = colors[:count]
+        else:
+            for i in range(count):
+                self.particles.append([xs[i], ys[i], vxs[i], vys[i], 0.0, lifetimes[i],
+                                       sizes[i], alphas[i], wind_speeds[i], colors[i]])
+        self.count += count
+
+    def update(self, dt, wind=None):
+        """
+        Move, age and fade every particle, then drop the dead ones
+
+        Args:
+            dt: Seconds since the last frame
+            wind: Optional WindField - particles move by their wind_speed scaled to the local wind
+        """
+        if self.count == 0:
+            return
+
+        if not NUMPY_AVAILABLE:
+            self.update_fallback(dt, wind)
+            return
+
+        live = slice(0, self.count)
+        self.x[live] += self.vx[live] * dt
+        self.y[live] += self.vy[live] * dt
+        self.vy[live] += self.gravity * dt
+        if wind:
+            wind_u, wind_v = wind.sample(self.x[live], self.y[live])
+            carry = self.wind_speed[live] * dt / wind.base_strength
+            self.x[live] += carry * wind_u
+            self.y[live] += carry * wind_v
+        self.age[live] += dt
+        if self.fade_rate:
+            self.alpha[live] -= self.fade_rate * dt
+
+        keep = (self.age[live] < self.lifetime[live]) & (self.alpha[live] > 0)
+        self.compact(keep)
+
+    def update_fallback(self, dt, wind):
+        """Update particles one at a time without NumPy"""
+        wind_u, wind_v = (wind.u, wind.v) if wind else (0.0, 0.0)
+        alive = []
+        for particle in self.particles:
+            particle[0] += particle[2] * dt
+            particle[1] += particle[3] * dt
+            particle[3] += self.gravity * dt
+            if wind:
+                carry = particle[8] * dt / wind.base_strength
+                particle[0] += carry * wind_u
+                particle[1] += carry * wind_v
+            particle[4] += dt
+            particle[7] -= self.fade_rate * dt
+            if particle[4] < particle[5] and particle[7] > 0:
+                alive.append(particle)
+        self.particles = alive
+        self.count = len(alive)
+
+    def compact(self, keep):
+        """Keep only the live particles flagged in keep"""
+        kept = int(np.count_nonzero(keep))
+        if kept == self.count:
+            return
+        live = slice(0, self.count)
+        for values in (self.x, self.y, self.vx, self.vy, self.age, self.lifetime,
+                       self.size, self.alpha, self.wind_speed, self.color):
+            values[:kept] = values[live][keep]
+        self.count = kept
+
+    def kill_outside(self, rect):
+        """
+        Remove particles that left a rect
+
+        Returns:
+            Number of particles removed (so they can be respawned)
+        """
+        before = self.count
+        if NUMPY_AVAILABLE:
+            live = slice(0, self.count)
+            x, y = self.x[live], self.y[live]
+            self.compact((x >= rect.left) & (x <= rect.right) & (y >= rect.top) & (y <= rect.bottom))
+        else:
+            self.particles = [particle for particle in self.particles
+                              if rect.left <= particle[0] <= rect.right and rect.top <= particle[1] <= rect.bottom]
+            self.count = len(self.particles)
+        return before - self.count
+
+    def clear(self):
+        """Remove every particle"""
+        self.count = 0
+        if not NUMPY_AVAILABLE:
+            self.particles = []
+
+    def draw(self, surface):
+        """Draw every live particle with a single blits() call"""
+        if self.count == 0:
+            return
+
+        if not NUMPY_AVAILABLE:
+            self.draw_fallback(surface)
+            return
+
+        live = slice(0, self.count)
+        life = 1.0 - self.age[live] / self.lifetime[live]
+        alpha = self.alpha[live] * life if self.fade_out else self.alpha[live]
+        size = self.size[live] * life if self.shrink else self.size[live]
+
+        levels = np.clip(alpha * ALPHA_LEVELS / 255, 0, ALPHA_LEVELS).astype(np.int32)
+        sizes = np.clip(size, 0, MAX_PARTICLE_SIZE).astype(np.int32)
+        visible = np.flatnonzero((levels > 0) & (sizes > 0))
+        if len(visible) == 0:
+            return
+
+        # One stamp lookup per distinct (color, size, alpha) instead of per particle
+        levels = levels[visible]
+        sizes = sizes[visible]
+        codes = (self.color[visible].astype(np.int32) * (MAX_PARTICLE_SIZE + 1) + sizes) * (ALPHA_LEVELS + 1) + levels
+        unique_codes, inverse = np.unique(codes, return_inverse=True)
+        stamps = np.empty(len(unique_codes), dtype=object)
+        for index, code in enumerate(unique_codes.tolist()):
+            level, code = code % (ALPHA_LEVELS + 1), code // (ALPHA_LEVELS + 1)
+            color, stamp_size = code // (MAX_PARTICLE_SIZE + 1), code % (MAX_PARTICLE_SIZE + 1)
+            stamps[index] = particle_stamps.get(self.shape, self.colors[color], stamp_size, level)
+
+        xs = self.x[visible].astype(np.int32) - sizes
+        ys = self.y[visible].astype(np.int32) - sizes
+        surface.blits(zip(stamps[inverse], zip(xs.tolist(), ys.tolist())), doreturn=False)
+
+    def draw_fallback(self, surface):
+        """Draw particles from stamps without NumPy"""
+        blits = []
+        for x, y, _, _, age, lifetime, size, alpha, _, color in self.particles:
+            life = 1.0 - age / lifetime
+            if self.fade_out:
+                alpha *= life
+            if self.shrink:
+                size *= life
+            level = min(ALPHA_LEVELS, int(alpha * ALPHA_LEVELS / 255))
+            size = min(MAX_PARTICLE_SIZE, int(size))
+            if level > 0 and size > 0:
+                stamp = particle_stamps.get(self.shape, self.colors[color], size, level)
+                blits.append((stamp, (int(x) - size, int(y) - size)))
+        surface.blits(blits, doreturn=False)
+
+
+class ParticleEmitter:
+    def __init__(self, system, area=(0, 0, 0, 0), velocity=((0, 0), (0, 0)), speed=(0, 0),
+                 angle=(0, 0), lifetime=(math.inf, math.inf), size=(1, 1), alpha=(255, 255),
+                 wind_speed=(0, 0), whole_sizes=False):
+        """
+        Spawns particles into a ParticleSystem with randomized properties
+
+        Every (min, max) range is sampled uniformly per particle.
+
+        Args:
+            system: ParticleSystem to emit into
+            area: (min_dx, max_dx, min_dy, max_dy) spread around the emit position
+            velocity: ((min_vx, max_vx), (min_vy, max_vy)) in pixels per second
+            speed, angle: Extra velocity in a random direction (angle in radians)
+            lifetime: Seconds each particle lives (infinite by default)
+            size: Particle radius in pixels
+            alpha: Starting opacity 0-255
+            wind_speed: Speed the particle drifts at in the average wind
+            whole_sizes: Round sizes down to whole pixels when spawned
+        """
+        self.system = system
+        self.area = area
+        self.velocity = velocity
+        self.speed = speed
+        self.angle = angle
+        self.lifetime = lifetime
+        self.size = size
+        self.alpha = alpha
+        self.wind_speed = wind_speed
+        self.whole_sizes = whole_sizes
+
+    def emit(self, count, x, y, area=None):
+        """
+        Spawn particles around (x, y)
+
+        Args:
+            count: Number of particles (clipped to the system's budget)
+            x, y: Emit position
+            area: Optional spread overriding the emitter's own
+        """
+        if count <= 0:
+            return
+        min_dx, max_dx, min_dy, max_dy = area or self.area
+        (min_vx, max_vx), (min_vy, max_vy) = self.velocity
+
+        if NUMPY_AVAILABLE:
+            uniform = np.random.uniform
+            angles = uniform(*self.angle, count)
+            speeds = uniform(*self.speed, count)
+            sizes = uniform(*self.size, count)
+            if self.whole_sizes:
+                sizes = np.floor(sizes)
+            self.system.add(x + uniform(min_dx, max_dx, count),
+                            y + uniform(min_dy, max_dy, count),
+                            uniform(min_vx, max_vx, count) + np.cos(angles) * speeds,
+                            uniform(min_vy, max_vy, count) + np.sin(angles) * speeds,
+                            uniform(*self.lifetime, count) if self.lifetime[0] != math.inf else np.full(count, np.inf),
+                            sizes,
+                            uniform(*self.alpha, count),
+                            uniform(*self.wind_speed, count),
+                            np.random.randint(0, len(self.system.colors), count))
+            return
+
+        columns = ([], [], [], [], [], [], [], [], [])
+        for _ in range(count):
+            angle = random.uniform(*self.angle)
+            speed = random.uniform(*self.speed)
+            size = random.uniform(*self.size)
+            values = (x + random.uniform(min_dx, max_dx),
+                      y + random.uniform(min_dy, max_dy),
+                      random.uniform(min_vx, max_vx) + math.cos(angle) * speed,
+                      random.uniform(min_vy, max_vy) + math.sin(angle) * speed,
+                      random.uniform(*self.lifetime) if self.lifetime[0] != math.inf else math.inf,
+                      math.floor(size) if self.whole_sizes else size,
+                      random.uniform(*self.alpha),
+                      random.uniform(*self.wind_speed),
+                      random.randrange(len(self.system.colors)))
+            for column, value in zip(columns, values):
+                column.append(value)
+        self.system.add(*columns)
@@ -0,0 +1,69 @@
+"""Pre-rendered puddle and ripple textures, shared by every puddle"""
+
+import pygame
+
+# Puddle color (alpha baked into the texture)
+PUDDLE_COLOR = (60, 80, 120)
+RIPPLE_COLOR = (100, 120, 160)
+RIPPLE_MAX_ALPHA = 60
+RIPPLE_ALPHA_LEVELS = 8  # Fading ripples reuse this many alpha steps per radius
+
+
+class PuddleTextures:
+    def __init__(self):
+        """Puddle ellipses keyed by (width, alpha) and ripple rings keyed by (radius, alpha level)"""
+        self.puddles = {}
+        self.ripples = {}
+
+    def get_puddle(self, size, alpha):
+        """
+        Get the puddle ellipse for a size, bucketed to whole pixels
+
+        Args:
+            size: Puddle width in pixels (the ellipse is half as tall)
+            alpha: Puddle opacity 0-255
+        """
+        key = (int(size), alpha)
+        texture = self.puddles.get(key)
+        if texture is None:
+            texture = pygame.Surface((key[0], int(size / 2)), pygame.SRCALPHA)
+            pygame.draw.ellipse(texture, (*PUDDLE_COLOR, alpha), texture.get_rect())
+            if pygame.display.get_surface() is not None:
+                texture = texture.convert_alpha()
+            self.puddles[key] = texture
+        return texture
+
+    def get_ripple(self, radius, strength):
+        """
+        Get an alpha-correct ripple ring
+
+        Args:
+            radius: Ring radius in pixels (the ring is half as tall)
+            strength: Ripple strength 0.0-1.0, fading the ring out
+
+        Returns:
+            Surface of size (2 * radius, radius), or None when fully faded
+        """
+        level = int(round(max(0.0, min(1.0, strength)) * RIPPLE_ALPHA_LEVELS))
+        if level == 0:
+            return None
+
+        key = (radius, level)
+        texture = self.ripples.get(key)
+        if texture is None:
+            alpha = RIPPLE_MAX_ALPHA * level // RIPPLE_ALPHA_LEVELS
+            texture = pygame.Surface((radius * 2, radius), pygame.SRCALPHA)
+            pygame.draw.ellipse(texture, (*RIPPLE_COLOR, alpha), texture.get_rect(), 2)
+            if pygame.display.get_surface() is not None:
+                texture = texture.convert_alpha()
+            self.ripples[key] = texture
+        return texture
+
+    def clear(self):
+        """Drop all cached puddle textures"""
+        self.puddles.clear()
+        self.ripples.clear()
+
+
+# Shared puddle textures used by all weather
+puddle_textures = PuddleTextures()
@@ -0,0 +1,250 @@
+"""Rain drops stored as NumPy arrays and drawn from pre-rendered streak stamps"""
+
+import pygame
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    print("NumPy not available, rain drops are simulated one object at a time")
+
+# Maximum number of drops alive at once
+RAIN_CAPACITY = 8192
+
+# Streak colors by depth layer (1=far, 2=mid, 3=close) - darker blue-grays
+LAYER_COLORS = {
+    1: (45, 55, 75),
+    2: (65, 75, 95),
+    3: (85, 95, 115),
+}
+
+# Speed multiplier by depth layer (index 0 unused)
+LAYER_SPEEDS = (0.0, 0.7, 1.0, 1.3)
+
+# Stamp variant bits
+VARIANT_FUZZ = 1       # Fuzzy side lines (far drops only)
+VARIANT_HIGHLIGHT = 2  # Lighter line next to the streak
+
+# Steepest streak slant in pixels (strong gusts are clamped)
+MAX_SLANT = 24
+
+# Splash animation when a drop hits a roof
+SPLASH_SHAPES = [(2, 0), (4, 1), (6, 0)]  # (spread, rise) in pixels per frame
+SPLASH_FRAMES = len(SPLASH_SHAPES)
+SPLASH_DURATION = 0.2  # seconds
+SPLASH_COLOR = (105, 115, 135)
+
+# Chance per frame that a drop is drawn with each variant
+FUZZ_CHANCE = 0.7
+HIGHLIGHT_CHANCE = 0.2
+
+
+class RainStamps:
+    def __init__(self):
+        """Pre-rendered rain streaks keyed by (layer, length, slant, variant)"""
+        self.stamps = {}
+
+    def create_stamp(self, layer, length, slant, variant):
+        """
+        Draw a streak from (0, 0) to (slant, length) onto a colorkeyed stamp
+
+        Returns:
+            (surface, offset_x, offset_y) - blit at (x - offset_x, y - offset_y)
+        """
+        pad = layer + 2
+        offset_x = pad + max(0, -slant)
+        offset_y = pad
+        width = abs(slant) + pad * 2 + 1
+        height = length + pad * 2 + 1
+
+        stamp = pygame.Surface((width, height))
+        stamp.fill((0, 0, 0))
+        start = (offset_x, offset_y)
+        end = (offset_x + slant, offset_y + length)
+
+        base_color = LAYER_COLORS[layer]
+        pygame.draw.line(stamp, base_color, start, end, layer)
+
+        if variant & VARIANT_FUZZ:
+            # Fuzzy lines around the main streak for distant rain
+            fuzz_color = (base_color[0] // 2, base_color[1] // 2, base_color[2] // 2)
+            for offset in [-1, 1]:
+                pygame.draw.line(stamp, fuzz_color,
+                               (start[0] + offset, start[1]),
+                               (end[0] + offset, end[1]), 1)
+
+        if variant & VARIANT_HIGHLIGHT:
+            variation_color = (min(255, base_color[0] + 20),
+                             min(255, base_color[1] + 20),
+                             min(255, base_color[2] + 20))
+            pygame.draw.line(stamp, variation_color,
+                           (start[0] + 1, start[1]), (end[0] + 1, end[1]), 1)
+
+        if pygame.display.get_surface() is not None:
+            stamp = stamp.convert()
+        stamp.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        return stamp, offset_x, offset_y
+
+    def create_splash(self, frame):
+        """
+        Draw one frame of a splash - droplets thrown up and out from the impact point
+
+        Returns:
+            (surface, offset_x, offset_y) - blit at (x - offset_x, y - offset_y)
+        """
+        spread, rise = SPLASH_SHAPES[frame]
+        stamp = pygame.Surface((spread * 2 + 1, 4))
+        stamp.fill((0, 0, 0))
+        for side in (-1, 1):
+            stamp.set_at((spread + side * spread, 3 - rise), SPLASH_COLOR)
+            stamp.set_at((spread + side * (spread // 2), 3 - rise - 1), SPLASH_COLOR)
+        if frame == 0:
+            # Impact line on the surface
+            pygame.draw.line(stamp, SPLASH_COLOR, (spread - 1, 3), (spread + 1, 3), 1)
+
+        if pygame.display.get_surface() is not None:
+            stamp = stamp.convert()
+        stamp.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        return stamp, spread, 3
+
+    def get_splash(self, frame):
+        """Get (surface, offset_x, offset_y) for a splash animation frame"""
+        key = ('splash', frame)
+        stamp = self.stamps.get(key)
+        if stamp is None:
+            stamp = self.create_splash(frame)
+            self.stamps[key] = stamp
+        return stamp
+
+    def get(self, layer, length, slant, variant):
+        """Get (surface, offset_x, offset_y) for a streak, drawing it on first use"""
+        key = (layer, length, slant, variant)
+        stamp = self.stamps.get(key)
+        if stamp is None:
+            stamp = self.create_stamp(layer, length, slant, variant)
+            self.stamps[key] = stamp
+        return stamp
+
+    def clear(self):
+        """Drop all cached stamps"""
+        self.stamps.clear()
+
+
+# Shared streak stamps used by all rain
+rain_stamps = RainStamps()
+
+
+class RainStore:
+    def __init__(self, screen_width, screen_height, capacity=RAIN_CAPACITY):
+        """
+        Fixed-capacity struct-of-arrays rain simulation
+
+        Live drops are packed at the front of each array; culling compacts
+        them in one pass, so no per-drop objects are created or removed.
+
+        Args:
+            screen_width, screen_height: Screen size in pixels
+            capacity: Maximum number of drops alive at once
+        """
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.capacity = capacity
+        self.count = 0
+
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.speed = np.zeros(capacity, dtype=np.float32)
+        self.length = np.zeros(capacity, dtype=np.float32)
+        self.wind_offset = np.zeros(capacity, dtype=np.float32)
+        self.layer = np.zeros(capacity, dtype=np.int8)
+        self.drift = np.zeros(capacity, dtype=np.float32)  # Wind strength at each drop, sampled per frame
+
+        self.layer_speeds = np.array(LAYER_SPEEDS, dtype=np.float32)
+
+    def spawn(self, count, speed_min, speed_max):
+        """Spawn drops just above the screen (drops past capacity are skipped)"""
+        count = min(count, self.capacity - self.count)
+        if count <= 0:
+            return
+
+        new = slice(self.count, self.count + count)
+        self.x[new] = np.random.uniform(-50, self.screen_width + 50, count)  # Allow for wind drift
+        self.y[new] = np.random.uniform(-20, -10, count)
+
+        # Create depth layers: 50% far, 30% mid, 20% close
+        depth_chance = np.random.random(count)
+        layer = 1 + (depth_chance >= 0.5) + (depth_chance >= 0.8)
+        self.layer[new] = layer
+
+        self.speed[new] = np.random.uniform(speed_min, speed_max, count) * self.layer_speeds[layer]
+        self.length[new] = np.random.uniform(4, 8, count) * layer  # Far drops shorter
+        self.wind_offset[new] = np.random.uniform(-0.5, 0.5, count)
+        self.count += count
+
+    def update(self, dt, wind, sky_map):
+        """
+        Move all drops with the wind and cull the ones that hit something
+
+        Args:
+            dt: Seconds since the last frame
+            wind: WindField sampled at every drop
+            sky_map: SkyMap - drops die at the first blocking surface of their column
+
+        Returns:
+            (x, y) arrays of where culled drops landed
+        """
+        live = slice(0, self.count)
+        wind_u, wind_v = wind.sample(self.x[live], self.y[live])
+        self.drift[live] = wind_u
+        fall = self.speed[live] * dt
+        self.y[live] += fall * (1 + wind_v)
+        self.x[live] += wind_u * fall + self.wind_offset[live]
+
+        # The bottom end of the streak is what hits the surface
+        blocked_y = sky_map.sample(self.x[live])
+        keep = self.y[live] + self.length[live] < blocked_y
+        landed = ~keep
+        landed_x = self.x[live][landed]
+        landed_y = blocked_y[landed]
+        if len(landed_x):
+            kept = int(np.count_nonzero(keep))
+            for values in (self.x, self.y, self.speed, self.length, self.wind_offset, self.layer, self.drift):
+                values[:kept] = values[live][keep]
+            self.count = kept
+        return landed_x, landed_y
+
+    def draw(self, surface, fuzz_chance=FUZZ_CHANCE, highlight_chance=HIGHLIGHT_CHANCE):
+        """Draw all visible drops far to close with a single blits() call"""
+        live = slice(0, self.count)
+        y = self.y[live]
+        visible = (y < self.screen_height) & (y + self.length[live] > 0)
+        order = np.flatnonzero(visible)
+        if len(order) == 0:
+            return
+
+        # Far to close, keeping spawn order within a layer
+        layer = self.layer[order]
+        sort = np.argsort(layer, kind='stable')
+        order = order[sort]
+        layer = layer[sort].astype(np.int32)
+
+        lengths = np.rint(self.length[order]).astype(np.int32)
+        slants = np.clip(np.rint(self.drift[order] * lengths), -MAX_SLANT, MAX_SLANT).astype(np.int32)
+        variant = (np.random.random(len(order)) < highlight_chance) * VARIANT_HIGHLIGHT
+        variant |= ((layer == 1) & (np.random.random(len(order)) < fuzz_chance)) * VARIANT_FUZZ
+
+        # One stamp lookup per distinct streak instead of per drop
+        codes = ((layer * 64 + lengths) * 64 + slants + MAX_SLANT) * 4 + variant
+        unique_codes, inverse = np.unique(codes, return_inverse=True)
+        stamps = np.empty(len(unique_codes), dtype=object)
+        offsets = np.zeros((len(unique_codes), 2), dtype=np.int32)
+        for index, code in enumerate(unique_codes.tolist()):
+            stamp_variant, code = code % 4, code // 4
+            slant, code = code % 64 - MAX_SLANT, code // 64
+            stamp_layer, stamp_length = code // 64, code % 64
+            stamps[index], offsets[index, 0], offsets[index, 1] = rain_stamps.get(
+                stamp_layer, stamp_length, slant, stamp_variant)
+
+        xs = self.x[order].astype(np.int32) - offsets[inverse, 0]
+        ys = y[order].astype(np.int32) - offsets[inverse, 1]
+        surface.blits(zip(stamps[inverse], zip(xs.tolist(), ys.tolist())), doreturn=False)
@@ -0,0 +1,104 @@
+"""Sky visibility - how far rain can fall in each screen column before something blocks it"""
+
+import pygame
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    print("NumPy not available, sky maps are looked up one column at a time")
+
+
+class SkyMap:
+    def __init__(self, width, height):
+        """
+        Per-column height of the first surface that blocks falling rain
+
+        Open columns stop rain just below the screen, like before. Scenes add roofs
+        and other overhangs once at load, so drops die (and splash) where they hit.
+
+        Args:
+            width, height: Scene size in pixels
+        """
+        self.width = width
+        self.height = height
+        self.open_height = height + 40  # Whole streak has left the bottom of the screen
+
+        if NUMPY_AVAILABLE:
+            self.heights = np.full(width, self.open_height, dtype=np.float32)
+        else:
+            self.heights = [float(self.open_height)] * width
+
+    def block_columns(self, start_x, heights):
+        """Lower the blocking height of consecutive columns starting at start_x"""
+        for offset, blocked_y in enumerate(heights):
+            x = start_x + offset
+            if 0 <= x < self.width and blocked_y < self.heights[x]:
+                self.heights[x] = blocked_y
+
+    def add_silhouette(self, points):
+        """
+        Block rain along a roof line
+
+        Args:
+            points: (x, y) points of the roof line from left to right
+        """
+        start_x = max(0, int(points[0][0]))
+        end_x = min(self.width, int(points[-1][0]) + 1)
+        if end_x <= start_x:
+            return
+
+        if NUMPY_AVAILABLE:
+            columns = np.arange(start_x, end_x)
+            roof = np.interp(columns, [x for x, _ in points], [y for _, y in points]).astype(np.float32)
+            self.heights[start_x:end_x] = np.minimum(self.heights[start_x:end_x], roof)
+            return
+
+        heights = []
+        for x in range(start_x, end_x):
+            for (x1, y1), (x2, y2) in zip(points, points[1:]):
+                if x1 <= x <= x2:
+                    heights.append(y1 + (y2 - y1) * (x - x1) / max(1, x2 - x1))
+                    break
+        self.block_columns(start_x, heights)
+
+    def add_rect(self, rect):
+        """Block rain on the top edge of a rect (awnings, ledges)"""
+        rect = pygame.Rect(rect)
+        self.block_columns(rect.left, [rect.top] * rect.width)
+
+    def add_mask(self, mask):
+        """
+        Derive blocking heights from a painted mask - the first set pixel in each column
+
+        Args:
+            mask: Scene-sized pygame.Mask of everything rain cannot fall through
+        """
+        width, height = mask.get_size()
+        if NUMPY_AVAILABLE:
+            coverage = pygame.surfarray.array_alpha(
+                mask.to_surface(setcolor=(255, 255, 255, 255), unsetcolor=(0, 0, 0, 0))) > 0
+            blocked = coverage.any(axis=1)
+            first_y = coverage.argmax(axis=1).astype(np.float32)
+            columns = np.flatnonzero(blocked[:self.width])
+            self.heights[columns] = np.minimum(self.heights[columns], first_y[columns])
+            return
+
+        heights = []
+        for x in range(min(width, self.width)):
+            first_y = next((y for y in range(height) if mask.get_at((x, y))), self.open_height)
+            heights.append(first_y)
+        self.block_columns(0, heights)
+
+    def sample(self, xs):
+        """Blocking heights for an array of x positions (off-screen columns are open)"""
+        columns = np.asarray(xs).astype(np.int32)
+        inside = (columns >= 0) & (columns < self.width)
+        return np.where(inside, self.heights[np.clip(columns, 0, self.width - 1)], self.open_height)
+
+    def height_at(self, x):
+        """Blocking height of a single column"""
+        column = int(x)
+        if 0 <= column < self.width:
+            return self.heights[column]
+        return self.open_height
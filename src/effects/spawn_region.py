@@ -0,0 +1,121 @@
+"""Spawn regions - where puddles and particles may appear in a scene"""
+
+import random
+import pygame
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    print("NumPy not available, spawn regions pick points by trial and error")
+
+
+class SpawnRegion:
+    def __init__(self, width, height):
+        """
+        Set of pixels where things may spawn, built from rects, collision maps or painted images
+
+        The valid pixels are precomputed into an index array the first time a point
+        is asked for, so picking a random spawn point is O(1).
+
+        Args:
+            width, height: Scene size in pixels
+        """
+        self.width = width
+        self.height = height
+        self.mask = pygame.Mask((width, height))
+
+        # Precomputed spawn pixels (rebuilt after the region changes)
+        self.points_x = None
+        self.points_y = None
+        self.bounds = None
+
+    def add_rect(self, rect):
+        """Allow spawning inside a rect"""
+        rect = pygame.Rect(rect)
+        if rect.width > 0 and rect.height > 0:
+            self.mask.draw(pygame.Mask(rect.size, fill=True), rect.topleft)
+        self.points_x = None
+
+    def remove_rect(self, rect):
+        """Forbid spawning inside a rect"""
+        rect = pygame.Rect(rect)
+        if rect.width > 0 and rect.height > 0:
+            self.mask.erase(pygame.Mask(rect.size, fill=True), rect.topleft)
+        self.points_x = None
+
+    def remove_collision_map(self, collision_map):
+        """Forbid spawning on every obstacle of a CollisionMap"""
+        for rect in collision_map.collision_rects:
+            self.remove_rect(rect)
+
+    def add_image(self, image, threshold=127):
+        """
+        Allow spawning wherever a painted image is opaque
+
+        Args:
+            image: Scene-sized surface with per-pixel alpha or a colorkey
+            threshold: Alpha above which a pixel counts as painted
+        """
+        self.mask.draw(pygame.mask.from_surface(image, threshold), (0, 0))
+        self.points_x = None
+
+    def build(self):
+        """Precompute the valid spawn pixels"""
+        self.bounds = self.mask.get_bounding_rects()
+        if NUMPY_AVAILABLE:
+            coverage = pygame.surfarray.array_alpha(
+                self.mask.to_surface(setcolor=(255, 255, 255, 255), unsetcolor=(0, 0, 0, 0)))
+            self.points_x, self.points_y = np.nonzero(coverage)
+        else:
+            self.points_x = self.points_y = ()
+
+    def contains(self, x, y):
+        """Whether (x, y) is inside the region"""
+        return 0 <= x < self.width and 0 <= y < self.height and bool(self.mask.get_at((int(x), int(y))))
+
+    def count(self):
+        """Number of pixels in the region"""
+        return self.mask.count()
+
+    def random_point(self):
+        """
+        Random point inside the region
+
+        Returns:
+            (x, y), or None if the region is empty
+        """
+        if self.points_x is None:
+            self.build()
+
+        if NUMPY_AVAILABLE:
+            if len(self.points_x) == 0:
+                return None
+            index = random.randrange(len(self.points_x))
+            return (int(self.points_x[index]) + random.random(),
+                    int(self.points_y[index]) + random.random())
+
+        # Without NumPy, try random points in the region's bounding rects
+        if not self.bounds:
+            return None
+        for _ in range(20):
+            rect = random.choice(self.bounds)
+            x = random.uniform(rect.left, rect.right)
+            y = random.uniform(rect.top, rect.bottom)
+            if self.contains(x, y):
+                return x, y
+        return None
+
+
+def create_walkable_region(collision_map, area=None):
+    """
+    Create a spawn region from a scene's walkable ground
+
+    Args:
+        collision_map: CollisionMap of the scene - obstacles are excluded
+        area: Optional Rect limiting the region (e.g. the ground below the horizon)
+    """
+    region = SpawnRegion(collision_map.width, collision_map.height)
+    region.add_rect(area or (0, 0, collision_map.width, collision_map.height))
+    region.remove_collision_map(collision_map)
+    return region
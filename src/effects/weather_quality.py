@@ -0,0 +1,160 @@
+"""Weather quality levels and automatic adaptation to the frame budget"""
+
+# Quality levels from cheapest to most detailed
+WEATHER_LEVELS = ["off", "low", "medium", "high", "ultra"]
+DEFAULT_WEATHER_LEVEL = "high"
+
+# Weather settings for each quality level ("high" is the original look)
+WEATHER_PRESETS = {
+    "off": {
+        "rain_intensity": 0,      # Drops per second
+        "max_puddles": 0,         # Puddle cap
+        "fuzz_chance": 0.0,       # Chance a far drop gets fuzzy side lines
+        "highlight_chance": 0.0,  # Chance a drop gets a lighter highlight line
+        "lightning_flash": False, # Full-screen lightning overlay
+        "visible": False,         # Draw puddles and rain at all
+    },
+    "low": {
+        "rain_intensity": 30,
+        "max_puddles": 6,
+        "fuzz_chance": 0.0,
+        "highlight_chance": 0.0,
+        "lightning_flash": True,
+        "visible": True,
+    },
+    "medium": {
+        "rain_intensity": 50,
+        "max_puddles": 10,
+        "fuzz_chance": 0.35,
+        "highlight_chance": 0.1,
+        "lightning_flash": True,
+        "visible": True,
+    },
+    "high": {
+        "rain_intensity": 80,
+        "max_puddles": 15,
+        "fuzz_chance": 0.7,
+        "highlight_chance": 0.2,
+        "lightning_flash": True,
+        "visible": True,
+    },
+    "ultra": {
+        "rain_intensity": 240,
+        "max_puddles": 20,
+        "fuzz_chance": 0.7,
+        "highlight_chance": 0.2,
+        "lightning_flash": True,
+        "visible": True,
+    },
+}
+
+
+class WeatherQuality:
+    def __init__(self, level=DEFAULT_WEATHER_LEVEL):
+        """Current weather quality level, shared by every WeatherSystem"""
+        self.level = level
+        self.preset = WEATHER_PRESETS[level]
+
+    def set_level(self, level):
+        """Switch to a quality level by name"""
+        if level not in WEATHER_PRESETS:
+            raise ValueError(f"Unknown weather quality '{level}', expected one of {WEATHER_LEVELS}")
+        if level != self.level:
+            print(f"Weather quality: {self.level} -> {level}")
+        self.level = level
+        self.preset = WEATHER_PRESETS[level]
+
+    def step(self, steps, lowest="off", highest="ultra"):
+        """
+        Move the quality level up (positive) or down (negative) within [lowest, highest]
+
+        Returns:
+            True if the level changed
+        """
+        index = WEATHER_LEVELS.index(self.level)
+        new_index = max(WEATHER_LEVELS.index(lowest), min(WEATHER_LEVELS.index(highest), index + steps))
+        if new_index == index:
+            return False
+        self.set_level(WEATHER_LEVELS[new_index])
+        return True
+
+
+# Shared weather quality used by all scenes
+weather_quality = WeatherQuality()
+
+
+class WeatherQualityController:
+    def __init__(self, quality=weather_quality, target_fps=60, profiler=None,
+                 lowest="low", highest="ultra"):
+        """
+        Steps weather quality down when frames run over budget and back up when there is headroom
+
+        Hysteresis keeps the level from oscillating: stepping down needs a short run
+        of slow frames, stepping up needs a longer run of fast frames, and no step up
+        happens for a while after a step down.
+
+        Args:
+            quality: WeatherQuality to adjust
+            target_fps: Frame rate to hold
+            profiler: Optional FrameProfiler that is told the current level
+            lowest, highest: Range of levels the controller may pick
+        """
+        self.quality = quality
+        self.budget_ms = 1000.0 / target_fps
+        self.profiler = profiler
+        self.lowest = lowest
+        self.highest = highest
+
+        # Thresholds as a fraction of the frame budget
+        self.step_down_load = 0.9   # Average frame work above this is too slow
+        self.step_up_load = 0.6     # Average frame work below this leaves headroom
+
+        # How long the load must stay past a threshold before stepping
+        self.step_down_delay = 1.0  # seconds
+        self.step_up_delay = 5.0    # seconds
+        self.step_up_cooldown = 10.0  # seconds without stepping up after a step down
+
+        self.average_ms = 0.0
+        self.smoothing = 0.1  # Exponential moving average factor
+        self.slow_time = 0.0
+        self.fast_time = 0.0
+        self.cooldown = 0.0
+
+        self.report()
+
+    def update(self, dt, frame_ms):
+        """
+        Feed one frame's work time (excluding the frame limiter's sleep)
+
+        Args:
+            dt: Seconds since the last frame
+            frame_ms: Milliseconds spent on events, update and render this frame
+        """
+        self.average_ms += (frame_ms - self.average_ms) * self.smoothing
+        self.cooldown = max(0.0, self.cooldown - dt)
+
+        load = self.average_ms / self.budget_ms
+        if load > self.step_down_load:
+            self.slow_time += dt
+            self.fast_time = 0.0
+        elif load < self.step_up_load:
+            self.fast_time += dt
+            self.slow_time = 0.0
+        else:
+            self.slow_time = 0.0
+            self.fast_time = 0.0
+
+        if self.slow_time >= self.step_down_delay:
+            if self.quality.step(-1, self.lowest, self.highest):
+                self.cooldown = self.step_up_cooldown
+                self.report()
+            self.slow_time = 0.0
+        elif self.fast_time >= self.step_up_delay and self.cooldown <= 0:
+            if self.quality.step(1, self.lowest, self.highest):
+                self.report()
+            self.fast_time = 0.0
+
+    def report(self):
+        """Tell the profiler the current level"""
+        if self.profiler is not None:
+            self.profiler.set_value("weather_quality", self.quality.level)
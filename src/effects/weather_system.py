@@ -3,6 +3,14 @@
 import pygame
 import random
 import math
+from ..rendering.compositor import compositor
+from .rain import RainStore, rain_stamps, NUMPY_AVAILABLE, VARIANT_FUZZ, VARIANT_HIGHLIGHT, SPLASH_FRAMES, SPLASH_DURATION
+from .weather_quality import weather_quality
+from .puddle_textures import puddle_textures
+from .spawn_region import SpawnRegion
+from .wind_field import WindField
+from .sky_map import SkyMap
+from ..audio.thunder import ThunderGenerator
 
 class RainDrop:
     def __init__(self, x, y, speed, length=8, depth_layer=1):
@@ -15,12 +23,12 @@ class RainDrop:
         self.alpha = 30 + (depth_layer * 40)  # Far drops more transparent
         self.thickness = depth_layer  # Line thickness based on depth
 
-    def update(self, dt, wind_strength=0.2):
-        self.y += self.speed * dt
+    def update(self, dt, wind_strength=0.2, wind_vertical=0.0):
+        self.y += self.speed * dt * (1 + wind_vertical)
         self.x += wind_strength * self.speed * dt + self.wind_offset
 
-    def is_off_screen(self, screen_height):
-        return self.y > screen_height + 10
+    def has_landed(self, blocked_y):
+        return self.y + self.length >= blocked_y
 
 class Puddle:
     def __init__(self, x, y, max_size=30):
@@ -45,36 +53,29 @@ class Puddle:
         if self.ripple_timer > 0:
             self.ripple_timer -= dt
 
+    def get_blits(self):
+        """Get (texture, position) tuples for the puddle and its ripple, for Surface.blits"""
+        if self.size <= 2:
+            return []
+
+        # Dark blue/gray oval from the shared texture cache
+        blits = [(puddle_textures.get_puddle(self.size, self.alpha),
+                  (int(self.x - self.size/2), int(self.y - self.size/4)))]
+
+        # Ripple ring if recently hit
+        if self.ripple_timer > 0:
+            ripple_radius = int((1 - self.ripple_timer) * self.size * 0.7)
+            if ripple_radius > 0:
+                ripple = puddle_textures.get_ripple(ripple_radius, self.ripple_timer)
+                if ripple:
+                    blits.append((ripple, (int(self.x - ripple_radius), int(self.y - ripple_radius/2))))
+        return blits
+
     def draw(self, surface):
-        if self.size > 2:
-            # Draw puddle as dark blue/gray oval
-            puddle_color = (60, 80, 120, self.alpha)
-            puddle_rect = pygame.Rect(
-                int(self.x - self.size/2),
-                int(self.y - self.size/4),
-                int(self.size),
-                int(self.size/2)
-            )
-
-            # Create puddle surface with alpha
-            puddle_surface = pygame.Surface((int(self.size), int(self.size/2)), pygame.SRCALPHA)
-            pygame.draw.ellipse(puddle_surface, puddle_color, puddle_surface.get_rect())
-            surface.blit(puddle_surface, (puddle_rect.x, puddle_rect.y))
-
-            # Draw ripples if recently hit
-            if self.ripple_timer > 0:
-                ripple_radius = int((1 - self.ripple_timer) * self.size * 0.7)
-                if ripple_radius > 0:
-                    pygame.draw.ellipse(
-                        surface,
-                        (100, 120, 160, int(60 * self.ripple_timer)),
-                        (int(self.x - ripple_radius), int(self.y - ripple_radius/2),
-                         ripple_radius * 2, ripple_radius),
-                        2
-                    )
+        surface.blits(self.get_blits(), doreturn=False)
 
 class Lightning:
-    def __init__(self, screen_width, screen_height):
+    def __init__(self, screen_width, screen_height, thunder=None):
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.active = False
@@ -84,12 +85,15 @@ class Lightning:
         self.next_strike_time = 3.0  # First strike after 3 seconds
         self.timer = 0
         self.first_strike = True  # Track if this is the first strike
+        self.distance = 0.0  # km to the last strike
+        self.thunder = thunder  # ThunderGenerator heard after each strike
+        self.enabled = True  # No strikes at all (flash or thunder) while disabled
 
     def update(self, dt):
         self.timer += dt
 
         if not self.active:
-            if self.timer >= self.next_strike_time:
+            if self.timer >= self.next_strike_time and self.enabled:
                 self.trigger_strike()
                 self.first_strike = False  # Mark that first strike has occurred
         else:
@@ -116,46 +120,138 @@ class Lightning:
         self.duration = self.max_duration
         self.intensity = 1.0
 
+        # Thunder follows after the time sound takes to cover the distance
+        self.distance = random.uniform(0.3, 4.0)
+        if self.thunder:
+            self.thunder.schedule(self.distance)
+
     def draw_flash(self, surface, puddle_areas=None):
         if self.active and self.intensity > 0:
-            # Use pygame's fill with blend mode for seamless flash
             flash_alpha = int(150 * self.intensity)
 
-            # Create RGBA color with alpha
-            flash_color = (255, 255, 255, flash_alpha)
+            # Blend a white overlay from the shared compositor
+            compositor.flash(surface, flash_alpha)
 
-            # Use a temporary surface with per-pixel alpha
-            temp_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-            temp_surface.fill(flash_color)
+class WeatherSceneConfig:
+    def __init__(self, puddle_region=None, sky_map=None):
+        """
+        Per-scene weather settings, attached with WeatherSystem.set_scene()
 
-            # Blit with alpha blending
-            surface.blit(temp_surface, (0, 0))
+        Args:
+            puddle_region: SpawnRegion where puddles form (None = door level at y=575 down to the screen bottom)
+            sky_map: SkyMap of roofs and overhangs that stop the rain (None = open sky)
+        """
+        self.puddle_region = puddle_region
+        self.sky_map = sky_map
 
 class WeatherSystem:
-    def __init__(self, screen_width, screen_height):
+    def __init__(self, screen_width, screen_height, audio_manager=None):
+        """
+        One storm shared by every outdoor scene
+
+        The game owns a single WeatherSystem so rain and the lightning timer carry on
+        through scene transitions. Scenes attach their own puddle ground and settings
+        with set_scene(); each scene keeps its own puddles. Thunder is played
+        through audio_manager when one is given.
+        """
         self.screen_width = screen_width
         self.screen_height = screen_height
 
-        # Rain system with depth layers
+        # Rain system with depth layers - NumPy arrays when available, RainDrop objects otherwise
+        self.rain = RainStore(screen_width, screen_height) if NUMPY_AVAILABLE else None
         self.raindrops = []
-        self.rain_intensity = 80  # drops per second (reduced for slower feel)
+        self.splashes = []  # [x, y, age] where drops hit a roof
+        self.max_splashes = 200
         self.rain_speed_min = 140  # Slightly faster rain
         self.rain_speed_max = 230
-        self.wind_strength = 0.15  # Gentler wind
 
-        # Puddle system
+        # Gusty wind shared by rain and anything else blowing around the scene
+        self.wind = WindField(screen_width, screen_height, base_strength=0.15)  # Gentler wind
+
+        # Puddle system - puddles of the current scene, and of scenes visited before
         self.puddles = []
+        self.scene_puddles = {}
+        self.scene_configs = {}  # Built WeatherSceneConfig per scene name
         self.puddle_spawn_timer = 0
         self.puddle_spawn_rate = 2.0  # seconds between puddle spawns
 
-        # Lightning system
-        self.lightning = Lightning(screen_width, screen_height)
+        # Lightning system, with thunder synthesized once for the whole game
+        self.thunder = ThunderGenerator(audio_manager)
+        self.lightning = Lightning(screen_width, screen_height, self.thunder)
+
+        # Quality-dependent settings (rain intensity, puddle cap, streak detail, lightning overlay)
+        self.quality = weather_quality
+        self.quality_level = None
+        self.apply_quality()
 
         # Weather timing
         self.rain_spawn_timer = 0
 
-        # Create initial puddles at startup
-        self.create_initial_puddles()
+        # Scene the storm is currently drawn in
+        self.scene_name = None
+        self.set_scene("default")
+
+    def set_scene(self, name, create_config=None):
+        """
+        Attach the weather to a scene, keeping the rain and lightning timing as they are
+
+        Each scene's config (puddle region, sky map) is built once, the first time
+        the scene is entered, and reused on every later visit.
+
+        Args:
+            name: Scene name - configs and puddles are remembered per scene
+            create_config: Function returning the scene's WeatherSceneConfig (None for the defaults)
+        """
+        if name == self.scene_name:
+            return
+
+        if self.scene_name is not None:
+            self.scene_puddles[self.scene_name] = self.puddles
+
+        self.scene_name = name
+        self.scene = self.scene_configs.get(name)
+        if self.scene is None:
+            self.scene = self.build_scene_config(create_config() if create_config else WeatherSceneConfig())
+            self.scene_configs[name] = self.scene
+
+        self.puddle_region = self.scene.puddle_region
+        self.sky_map = self.scene.sky_map
+
+        # Splashes belong to the old scene's roofs
+        self.splashes = []
+
+        # Scenes visited for the first time start with some puddles already present
+        self.puddles = self.scene_puddles.pop(name, None)
+        if self.puddles is None:
+            self.puddles = []
+            self.create_initial_puddles()
+
+    def build_scene_config(self, config):
+        """Fill in the defaults of a scene config and precompute its spawn points"""
+        # Default puddle ground: door level at y=575 down to the screen bottom
+        if config.puddle_region is None:
+            door_y = 575  # Bottom of door area
+            config.puddle_region = SpawnRegion(self.screen_width, self.screen_height)
+            config.puddle_region.add_rect((100, door_y, self.screen_width - 200, self.screen_height - 30 - door_y))
+        config.puddle_region.build()
+
+        if config.sky_map is None:
+            config.sky_map = SkyMap(self.screen_width, self.screen_height)
+        return config
+
+    def apply_quality(self):
+        """Copy the settings of the current weather quality level"""
+        preset = self.quality.preset
+        self.rain_intensity = preset["rain_intensity"]  # drops per second
+        self.max_puddles = preset["max_puddles"]
+        self.fuzz_chance = preset["fuzz_chance"]
+        self.highlight_chance = preset["highlight_chance"]
+        self.lightning_flash = preset["lightning_flash"]
+        self.visible = preset["visible"]
+        self.lightning.enabled = preset["lightning_flash"]  # Thunder only follows a strike
+        if not self.lightning.enabled:
+            self.thunder.clear()
+        self.quality_level = self.quality.level
 
     def spawn_raindrop(self):
         x = random.uniform(-50, self.screen_width + 50)  # Allow for wind drift
@@ -178,22 +274,22 @@ class WeatherSystem:
         return RainDrop(x, y, speed, length, depth_layer)
 
     def spawn_puddle(self):
-        # Spawn puddles from door area down to bottom of screen
-        # Door is at y=575, so allow puddles from y=575 down to screen bottom
-        x = random.uniform(100, self.screen_width - 100)
-        door_y = 575  # Bottom of door area
-        y = random.uniform(door_y, self.screen_height - 30)
+        # Spawn puddles on the scene's puddle ground
+        position = self.puddle_region.random_point()
+        if position is None:
+            return None
         max_size = random.uniform(15, 35)
-        return Puddle(x, y, max_size)
+        return Puddle(position[0], position[1], max_size)
 
     def create_initial_puddles(self):
-        """Create puddles that are already present when the game starts"""
+        """Create puddles that are already present when a scene is first visited"""
         initial_puddle_count = random.randint(8, 12)  # Start with 8-12 puddles
 
         for _ in range(initial_puddle_count):
-            x = random.uniform(100, self.screen_width - 100)
-            door_y = 575  # Bottom of door area
-            y = random.uniform(door_y, self.screen_height - 30)
+            position = self.puddle_region.random_point()
+            if position is None:
+                continue
+            x, y = position
 
             # Make initial puddles various sizes (some fully grown, some growing)
             max_size = random.uniform(20, 40)
@@ -206,39 +302,74 @@ class WeatherSystem:
             self.puddles.append(puddle)
 
     def update(self, dt):
+        # Pick up quality changes (menu or frame-budget controller)
+        if self.quality_level != self.quality.level:
+            self.apply_quality()
+
+        self.wind.update(dt)
+
         # Spawn raindrops
         drops_to_spawn = int(self.rain_intensity * dt)
-        for _ in range(drops_to_spawn):
-            if random.random() < 0.8:  # Not every frame
-                self.raindrops.append(self.spawn_raindrop())
+        spawn_count = sum(1 for _ in range(drops_to_spawn) if random.random() < 0.8)  # Not every frame
 
-        # Update raindrops
-        for raindrop in self.raindrops[:]:
-            raindrop.update(dt, self.wind_strength)
-            if raindrop.is_off_screen(self.screen_height):
-                self.raindrops.remove(raindrop)
+        # Update raindrops - they die at the first surface above them (roofs, or just below the screen)
+        if self.rain is not None:
+            self.rain.spawn(spawn_count, self.rain_speed_min, self.rain_speed_max)
+            landed_x, landed_y = self.rain.update(dt, self.wind, self.sky_map)
+            landed = zip(landed_x.tolist(), landed_y.tolist())
+        else:
+            for _ in range(spawn_count):
+                self.raindrops.append(self.spawn_raindrop())
 
-                # Chance to create or grow a puddle where rain lands
-                if random.random() < 0.1:  # 10% chance
-                    # Only create puddles in the allowed area (door level and below)
-                    puddle_y = max(575, self.screen_height - 20)  # Don't go above door level
-                    self.try_add_to_puddle(raindrop.x, puddle_y)
+            landed = []
+            remaining = []
+            for raindrop in self.raindrops:
+                raindrop.update(dt, *self.wind.sample_point(raindrop.x, raindrop.y))
+                blocked_y = self.sky_map.height_at(raindrop.x)
+                if raindrop.has_landed(blocked_y):
+                    landed.append((raindrop.x, blocked_y))
+                else:
+                    remaining.append(raindrop)
+            self.raindrops = remaining
+
+        for x, y in landed:
+            if y < self.screen_height:
+                # Hit a roof - splash where it landed
+                if len(self.splashes) < self.max_splashes:
+                    self.splashes.append([x, y, 0.0])
+            elif random.random() < 0.1:  # 10% chance
+                # Chance that a landing drop creates or grows a puddle on the scene's puddle ground
+                position = self.puddle_region.random_point()
+                if position:
+                    self.try_add_to_puddle(*position)
+
+        # Age splashes
+        for splash in self.splashes:
+            splash[2] += dt
+        self.splashes = [splash for splash in self.splashes if splash[2] < SPLASH_DURATION]
 
         # Spawn puddles over time
         self.puddle_spawn_timer += dt
         if self.puddle_spawn_timer >= self.puddle_spawn_rate:
-            if len(self.puddles) < 15:  # Limit puddle count
-                self.puddles.append(self.spawn_puddle())
+            if len(self.puddles) < self.max_puddles:  # Limit puddle count
+                puddle = self.spawn_puddle()
+                if puddle:
+                    self.puddles.append(puddle)
             self.puddle_spawn_timer = 0
 
         # Update puddles
         for puddle in self.puddles:
             puddle.update(dt)
 
-        # Update lightning
+        # Update lightning and the thunder still travelling
         self.lightning.update(dt)
+        self.thunder.update(dt)
 
     def try_add_to_puddle(self, x, y):
+        # Only the scene's puddle ground collects water
+        if not self.puddle_region.contains(x, y):
+            return
+
         # Find nearby puddle or create new one
         for puddle in self.puddles:
             distance = math.sqrt((puddle.x - x)**2 + (puddle.y - y)**2)
@@ -247,64 +378,50 @@ class WeatherSystem:
                 return
 
         # Create new puddle if not too many
-        if len(self.puddles) < 15:
+        if len(self.puddles) < self.max_puddles:
             new_puddle = Puddle(x, y, random.uniform(20, 40))
             self.puddles.append(new_puddle)
 
     def draw_rain(self, surface):
+        if self.rain is not None:
+            self.rain.draw(surface, self.fuzz_chance, self.highlight_chance)
+        else:
+            self.draw_raindrops(surface)
+
+        # Splashes on roofs
+        sequence = []
+        for x, y, age in self.splashes:
+            frame = min(SPLASH_FRAMES - 1, int(age / SPLASH_DURATION * SPLASH_FRAMES))
+            stamp, offset_x, offset_y = rain_stamps.get_splash(frame)
+            sequence.append((stamp, (int(x) - offset_x, int(y) - offset_y)))
+        surface.blits(sequence, doreturn=False)
+
+    def draw_raindrops(self, surface):
+        """Draw RainDrop objects (used when NumPy is not available)"""
         # Sort raindrops by depth layer (far to close)
         sorted_drops = sorted(self.raindrops, key=lambda drop: drop.depth_layer)
 
+        sequence = []
         for raindrop in sorted_drops:
-            # Draw raindrop as a line
-            start_x = int(raindrop.x)
-            start_y = int(raindrop.y)
-            end_x = int(raindrop.x + self.wind_strength * raindrop.length)
-            end_y = int(raindrop.y + raindrop.length)
-
-            if start_y < self.screen_height and end_y > 0:
-                try:
-                    # Darker rain colors based on depth
-                    if raindrop.depth_layer == 1:  # Far
-                        base_color = (45, 55, 75)  # Darker blue-gray
-                        blur_effect = True
-                    elif raindrop.depth_layer == 2:  # Mid
-                        base_color = (65, 75, 95)  # Darker medium blue-gray
-                        blur_effect = False
-                    else:  # Close
-                        base_color = (85, 95, 115)  # Darker lighter blue-gray
-                        blur_effect = False
-
-                    # Apply transparency
-                    rain_color = (*base_color, raindrop.alpha)
-
-                    # Draw main raindrop line
-                    pygame.draw.line(surface, base_color,
-                                   (start_x, start_y), (end_x, end_y),
-                                   raindrop.thickness)
-
-                    # Add blur effect for distant rain
-                    if blur_effect and random.random() < 0.7:
-                        # Draw additional fuzzy lines around the main drop
-                        for offset in [-1, 1]:
-                            fuzz_color = (base_color[0] // 2, base_color[1] // 2, base_color[2] // 2)
-                            pygame.draw.line(surface, fuzz_color,
-                                           (start_x + offset, start_y),
-                                           (end_x + offset, end_y), 1)
-
-                    # Add slight variation for realism
-                    if random.random() < 0.2:
-                        variation_color = (min(255, base_color[0] + 20),
-                                         min(255, base_color[1] + 20),
-                                         min(255, base_color[2] + 20))
-                        pygame.draw.line(surface, variation_color,
-                                       (start_x+1, start_y), (end_x+1, end_y), 1)
-                except:
-                    pass  # Handle edge cases
+            length = int(round(raindrop.length))
+            if raindrop.y < self.screen_height and raindrop.y + length > 0:
+                variant = 0
+                if raindrop.depth_layer == 1 and random.random() < self.fuzz_chance:
+                    variant |= VARIANT_FUZZ
+                if random.random() < self.highlight_chance:
+                    variant |= VARIANT_HIGHLIGHT
+                slant = int(round(self.wind.sample_point(raindrop.x, raindrop.y)[0] * length))
+                stamp, offset_x, offset_y = rain_stamps.get(raindrop.depth_layer, length, slant, variant)
+                sequence.append((stamp, (int(raindrop.x) - offset_x, int(raindrop.y) - offset_y)))
+
+        surface.blits(sequence, doreturn=False)
 
     def draw_puddles(self, surface):
+        # All puddles and ripples in one batch
+        sequence = []
         for puddle in self.puddles:
-            puddle.draw(surface)
+            sequence.extend(puddle.get_blits())
+        surface.blits(sequence, doreturn=False)
 
     def get_puddle_areas(self):
         """Get list of puddle rectangles for lightning masking"""
@@ -321,9 +438,13 @@ class WeatherSystem:
         return puddle_rects
 
     def draw_lightning(self, surface):
-        self.lightning.draw_flash(surface)
+        if self.lightning_flash:
+            self.lightning.draw_flash(surface)
 
     def draw(self, surface):
+        if not self.visible:
+            return
+
         # Draw in order: puddles, rain, lightning flash
         self.draw_puddles(surface)
         self.draw_rain(surface)
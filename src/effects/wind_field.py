@@ -0,0 +1,125 @@
+"""Coarse wind vector field with gusts, shared by rain and ambient particles"""
+
+import math
+import random
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    print("NumPy not available, wind is the same everywhere on screen")
+
+# Field resolution - wind only changes over large distances, so a coarse grid is enough
+WIND_COLUMNS = 16
+WIND_ROWS = 12
+
+
+class WindField:
+    def __init__(self, screen_width, screen_height, base_strength=0.15):
+        """
+        Low-resolution wind field evolved once per frame
+
+        Wind is stored as strength (horizontal drift per pixel of fall, like the old
+        scalar wind_strength), so rain drifts by speed * strength. Particles that move
+        with the wind scale their own speed by strength / base_strength.
+
+        Args:
+            screen_width, screen_height: Area the field covers
+            base_strength: Average horizontal wind strength (positive blows right)
+        """
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.base_strength = base_strength
+
+        self.cell_width = screen_width / WIND_COLUMNS
+        self.cell_height = screen_height / WIND_ROWS
+
+        # Variation relative to the base strength
+        self.turbulence = 0.15        # Slow swirls drifting through the field
+        self.vertical_strength = 0.2  # Up/down draughts
+        self.gust_interval = (3.0, 8.0)  # seconds between gust fronts
+        self.gust_speed = 300.0       # pixels per second a gust front travels
+        self.gust_width = 250.0       # pixels
+
+        self.time = 0.0
+        self.gusts = []  # Gust fronts: {'x', 'strength'}
+        self.next_gust_time = random.uniform(*self.gust_interval)
+
+        if NUMPY_AVAILABLE:
+            # Cell centers
+            self.grid_x = ((np.arange(WIND_COLUMNS, dtype=np.float32) + 0.5) * self.cell_width)[None, :]
+            self.grid_y = ((np.arange(WIND_ROWS, dtype=np.float32) + 0.5) * self.cell_height)[:, None]
+            self.u = np.full((WIND_ROWS, WIND_COLUMNS), base_strength, dtype=np.float32)
+            self.v = np.zeros((WIND_ROWS, WIND_COLUMNS), dtype=np.float32)
+        else:
+            self.u = base_strength
+            self.v = 0.0
+
+    def update(self, dt):
+        """Move the gust fronts and recompute the field"""
+        self.time += dt
+
+        # Start a new gust front off the upwind edge
+        self.next_gust_time -= dt
+        if self.next_gust_time <= 0:
+            start_x = -self.gust_width if self.base_strength >= 0 else self.screen_width + self.gust_width
+            self.gusts.append({'x': start_x, 'strength': random.uniform(0.3, 1.0)})
+            self.next_gust_time = random.uniform(*self.gust_interval)
+
+        direction = 1 if self.base_strength >= 0 else -1
+        for gust in self.gusts:
+            gust['x'] += direction * self.gust_speed * dt
+        self.gusts = [gust for gust in self.gusts
+                      if -2 * self.gust_width <= gust['x'] <= self.screen_width + 2 * self.gust_width]
+
+        t = self.time
+        if NUMPY_AVAILABLE:
+            x, y = self.grid_x, self.grid_y
+            swirl = np.sin(x * 0.004 + t * 0.7) * np.cos(y * 0.006 - t * 0.5)
+            relative = 1.0 + self.turbulence * swirl
+            for gust in self.gusts:
+                relative = relative + gust['strength'] * np.exp(-((x - gust['x']) / self.gust_width) ** 2)
+            self.u[:] = self.base_strength * relative
+            self.v[:] = self.base_strength * self.vertical_strength * np.sin(x * 0.005 - y * 0.003 + t * 1.3)
+        else:
+            # Without NumPy the wind is sampled at the screen center and applied everywhere
+            x, y = self.screen_width / 2, self.screen_height / 2
+            relative = 1.0 + self.turbulence * math.sin(x * 0.004 + t * 0.7) * math.cos(y * 0.006 - t * 0.5)
+            for gust in self.gusts:
+                relative += gust['strength'] * math.exp(-((x - gust['x']) / self.gust_width) ** 2)
+            self.u = self.base_strength * relative
+            self.v = self.base_strength * self.vertical_strength * math.sin(x * 0.005 - y * 0.003 + t * 1.3)
+
+    def sample(self, xs, ys):
+        """
+        Wind at many points at once (bilinear between cell centers)
+
+        Args:
+            xs, ys: Arrays (or lists) of positions
+
+        Returns:
+            (u, v) arrays of horizontal and vertical wind strength
+        """
+        if not NUMPY_AVAILABLE:
+            return [self.u] * len(xs), [self.v] * len(xs)
+
+        gx = np.clip(np.asarray(xs, dtype=np.float32) / self.cell_width - 0.5, 0, WIND_COLUMNS - 1.001)
+        gy = np.clip(np.asarray(ys, dtype=np.float32) / self.cell_height - 0.5, 0, WIND_ROWS - 1.001)
+        ix = gx.astype(np.int32)
+        iy = gy.astype(np.int32)
+        fx = gx - ix
+        fy = gy - iy
+
+        def lerp(field):
+            top = field[iy, ix] * (1 - fx) + field[iy, ix + 1] * fx
+            bottom = field[iy + 1, ix] * (1 - fx) + field[iy + 1, ix + 1] * fx
+            return top * (1 - fy) + bottom * fy
+
+        return lerp(self.u), lerp(self.v)
+
+    def sample_point(self, x, y):
+        """Wind at a single point as (u, v) floats"""
+        if not NUMPY_AVAILABLE:
+            return self.u, self.v
+        u, v = self.sample(np.array([x]), np.array([y]))
+        return float(u[0]), float(v[0])
@@ -12,15 +12,22 @@ from .states.scene5_state import Scene5State
 from .states.fight0_state import Fight0State
 from .states.game_state import GameStateManager
 from .audio.audio_manager import AudioManager
+from .effects.weather_system import WeatherSystem
+from .rendering.presenter import Presenter, SCALE_NEAREST
+from .ui.text_cache import text_cache
+from .effects.weather_quality import weather_quality, WeatherQualityController, DEFAULT_WEATHER_LEVEL
+from .profiler import FrameProfiler
 
 class Game:
-    def __init__(self, start_scene=None):
+    def __init__(self, start_scene=None, dirty_rects=False, scale_mode=SCALE_NEAREST,
+                 weather_level=DEFAULT_WEATHER_LEVEL):
         self.base_width = 1024
         self.base_height = 768
         self.screen_width = 1024
         self.screen_height = 768
         self.fullscreen = False
-        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
+        self.presenter = Presenter(self.base_width, self.base_height, scale_mode)  # Scales the virtual screen in fullscreen
+        self.screen = self.presenter.set_mode(self.fullscreen)
         self.display_surface = pygame.Surface((self.base_width, self.base_height))  # Virtual screen
         pygame.display.set_caption("Ligne Maudite")
 
@@ -28,28 +35,49 @@ class Game:
         self.fps = 60
         self.running = True
 
+        # Frame work time (without the limiter's sleep) and values reported by subsystems
+        self.profiler = FrameProfiler(self.fps)
+
+        # Weather quality - "auto" starts at the default level and follows the frame budget
+        if weather_level == "auto":
+            weather_quality.set_level(DEFAULT_WEATHER_LEVEL)
+            self.weather_controller = WeatherQualityController(weather_quality, self.fps, self.profiler)
+        else:
+            weather_quality.set_level(weather_level)
+            self.weather_controller = None
+            self.profiler.set_value("weather_quality", weather_quality.level)
+
+        # Opt-in dirty-rect presentation (windowed only): states that report what
+        # changed only get those rects pushed to the window, or no redraw at all
+        self.dirty_rect_mode = dirty_rects
+        self.force_full_redraw = True
+        self.last_rendered_state = None
+
         # Create shared audio manager
         self.audio_manager = AudioManager()
         self.audio_manager.load_ambient_pack()
 
+        # One storm for every outdoor scene, so rain, puddles and lightning carry on through transitions
+        self.weather = WeatherSystem(self.base_width, self.base_height, self.audio_manager)
+
         self.state_manager = GameStateManager()
 
         # Start with specified scene or default to scene 0
         if start_scene == 0:
             print("Starting directly in Scene 0 (Story)")
-            self.state_manager.push_state(Scene0State(self.display_surface, self.audio_manager))
+            self.state_manager.push_state(Scene0State(self.display_surface, self.audio_manager, self.weather))
         elif start_scene == 1:
             print("Starting directly in Scene 1 (Forest Path)")
-            self.state_manager.push_state(IntroState(self.display_surface, self.audio_manager))
+            self.state_manager.push_state(IntroState(self.display_surface, self.audio_manager, self.weather))
         elif start_scene == 2:
             print("Starting directly in Scene 2 (Field)")
-            self.state_manager.push_state(FieldState(self.display_surface, self.audio_manager))
+            self.state_manager.push_state(FieldState(self.display_surface, self.audio_manager, self.weather))
         elif start_scene == 3:
             print("Starting directly in Scene 3 (Behind Bunker)")
-            self.state_manager.push_state(BehindBunkerState(self.display_surface, self.audio_manager))
+            self.state_manager.push_state(BehindBunkerState(self.display_surface, self.audio_manager, self.weather))
         elif start_scene == 4:
             print("Starting directly in Scene 4 (Dragonteeth)")
-            self.state_manager.push_state(DragonteethState(self.display_surface, self.audio_manager))
+            self.state_manager.push_state(DragonteethState(self.display_surface, self.audio_manager, self.weather))
         elif start_scene == 5:
             print("Starting directly in Scene 5 (Bunker Interior)")
             self.state_manager.push_state(Scene5State(self.display_surface, self.audio_manager))
@@ -58,27 +86,27 @@ class Game:
             self.state_manager.push_state(Fight0State(self.display_surface, self.audio_manager))
         else:
             # Default to scene 0 (story)
-            self.state_manager.push_state(Scene0State(self.display_surface, self.audio_manager))
+            self.state_manager.push_state(Scene0State(self.display_surface, self.audio_manager, self.weather))
 
     def toggle_fullscreen(self):
         """Toggle between fullscreen and windowed mode"""
         self.fullscreen = not self.fullscreen
 
+        # The presenter preallocates its scaling target for the new mode
+        self.screen = self.presenter.set_mode(self.fullscreen, self.display_surface)
+        self.screen_width = self.screen.get_width()
+        self.screen_height = self.screen.get_height()
+
         if self.fullscreen:
-            # Go fullscreen
-            self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-            self.screen_width = self.screen.get_width()
-            self.screen_height = self.screen.get_height()
             print(f"Switched to fullscreen mode: {self.screen_width}x{self.screen_height}")
         else:
-            # Go windowed
-            self.screen_width = self.base_width
-            self.screen_height = self.base_height
-            self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
             print("Switched to windowed mode")
 
         # Note: We don't update state screen references because they always use the virtual display_surface
 
+        # The new window contents are undefined until a full redraw
+        self.force_full_redraw = True
+
     def handle_state_transition(self, new_state_name):
         """Handle transitions between game states"""
         if new_state_name == "puzzle":
@@ -103,12 +131,12 @@ class Game:
             self.state_manager.pop_state()  # Return to field
         elif new_state_name == "intro":
             # Transition from scene 0 to scene 1 (forest path with protagonist)
-            self.state_manager.change_state(IntroState(self.display_surface, self.audio_manager))
+            self.state_manager.change_state(IntroState(self.display_surface, self.audio_manager, self.weather))
         elif new_state_name == "field":
             # Check if we're transitioning from intro or returning from another state
             if len(self.state_manager.states) == 1:
                 # Coming from intro - replace intro with field
-                self.state_manager.change_state(FieldState(self.display_surface, self.audio_manager))
+                self.state_manager.change_state(FieldState(self.display_surface, self.audio_manager, self.weather))
             else:
                 # Return to field by popping current state
                 self.state_manager.pop_state()
@@ -116,14 +144,14 @@ class Game:
             # Transition to dragonteeth scene (scene 4)
             import time
             print(f"[{time.time():.2f}] Creating DragonteethState...")
-            dragonteeth_state = DragonteethState(self.display_surface, self.audio_manager)
+            dragonteeth_state = DragonteethState(self.display_surface, self.audio_manager, self.weather)
             print(f"[{time.time():.2f}] DragonteethState created, changing state...")
             self.state_manager.change_state(dragonteeth_state)
             print(f"[{time.time():.2f}] State changed to dragonteeth")
             print(f"[{time.time():.2f}] First render should happen next frame...")
         elif new_state_name in ["behind_bunker_left", "behind_bunker_right", "behind_bunker_red", "behind_bunker_blue"]:
             # Transition to behind bunker scene
-            behind_bunker_state = BehindBunkerState(self.display_surface, self.audio_manager)
+            behind_bunker_state = BehindBunkerState(self.display_surface, self.audio_manager, self.weather)
             # Set protagonist position based on which transition was used
             if new_state_name == "behind_bunker_left":
                 behind_bunker_state.protagonist_x = behind_bunker_state.screen_width - 100  # Right side
@@ -144,7 +172,7 @@ class Game:
             self.state_manager.change_state(behind_bunker_state)
         elif new_state_name in ["field_left", "field_right", "field_center", "field_red", "field_blue"]:
             # Return to field from behind bunker
-            field_state = FieldState(self.display_surface, self.audio_manager)
+            field_state = FieldState(self.display_surface, self.audio_manager, self.weather)
             # Set protagonist position based on which side they came from
             if new_state_name == "field_left":
                 field_state.protagonist_x = 100  # Left side
@@ -173,7 +201,7 @@ class Game:
             self.state_manager.change_state(field_state)
         elif new_state_name == "behind_bunker":
             # Return to behind bunker from dragonteeth
-            behind_bunker_state = BehindBunkerState(self.display_surface, self.audio_manager)
+            behind_bunker_state = BehindBunkerState(self.display_surface, self.audio_manager, self.weather)
             # Spawn at center bottom of behind bunker scene
             behind_bunker_state.protagonist_x = behind_bunker_state.screen_width // 2 - 32
             behind_bunker_state.protagonist_y = behind_bunker_state.screen_height - 100
@@ -201,10 +229,24 @@ class Game:
                     if result:
                         self.handle_state_transition(result)
             else:
+                if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    # Window contents were lost - repaint everything
+                    self.force_full_redraw = True
+
                 result = self.state_manager.handle_event(event)
                 if result:
                     self.handle_state_transition(result)
 
+    def get_dirty_rects(self):
+        """Rects to present this frame: None for the whole screen, [] for nothing"""
+        current_state = self.state_manager.states[-1] if self.state_manager.states else None
+
+        if not self.dirty_rect_mode or self.fullscreen or self.force_full_redraw:
+            return None
+        if current_state is None or current_state is not self.last_rendered_state:
+            return None  # New scene - paint it all once
+        return current_state.get_dirty_rects()
+
     def update(self, dt):
         # Check if current state wants to transition
         if self.state_manager.states:
@@ -215,20 +257,33 @@ class Game:
             self.state_manager.update(dt)
 
     def render(self):
+        # Nothing changed on a static screen - skip drawing and presenting entirely
+        dirty_rects = self.get_dirty_rects()
+        if dirty_rects is not None and not dirty_rects:
+            return
+
+        # Redraw only the changed area - drawing outside the clip rect is skipped by pygame
+        if dirty_rects:
+            self.display_surface.set_clip(dirty_rects[0].unionall(dirty_rects[1:]))
+
         # Clear virtual screen
         self.display_surface.fill((20, 20, 40))  # Dark bunker-like background
 
         # Render game to virtual screen
         self.state_manager.render(self.display_surface)
+        self.display_surface.set_clip(None)
+        self.last_rendered_state = self.state_manager.states[-1] if self.state_manager.states else None
+        self.force_full_redraw = False
 
-        # Scale virtual screen to real screen
-        if self.fullscreen:
-            # Stretch to fill entire screen
-            scaled_surface = pygame.transform.scale(self.display_surface, (self.screen_width, self.screen_height))
-            self.screen.blit(scaled_surface, (0, 0))
-        else:
-            # Direct blit in windowed mode
-            self.screen.blit(self.display_surface, (0, 0))
+        # Only push the changed areas to the window
+        if dirty_rects:
+            for rect in dirty_rects:
+                self.screen.blit(self.display_surface, rect, rect)
+            pygame.display.update(dirty_rects)
+            return
+
+        # Scale virtual screen to real screen (direct blit in windowed mode)
+        self.presenter.present(self.display_surface)
 
         pygame.display.flip()
 
@@ -236,13 +291,28 @@ class Game:
         while self.running:
             dt = self.clock.tick(self.fps) / 1000.0
 
+            self.profiler.begin_frame()
             self.handle_events()
             self.update(dt)
             self.render()
+            frame_ms = self.profiler.end_frame()
+
+            if self.weather_controller:
+                self.weather_controller.update(dt, frame_ms)
 
             if self.state_manager.should_quit():
                 self.running = False
 
+        # Report how much text rendering the cache saved
+        stats = text_cache.get_stats()
+        print(f"Text cache: {stats['hits']} hits, {stats['misses']} misses, "
+              f"{stats['evictions']} evictions ({stats['hit_rate']:.1%} hit rate)")
+
+        stats = self.profiler.get_stats()
+        print(f"Frames: {stats['frames']}, {stats['average_ms']:.1f} ms average work, "
+              f"{stats['worst_ms']:.1f} ms worst, {stats['slow_frames']} over budget, "
+              f"weather quality {stats['values'].get('weather_quality')}")
+
         # Cleanup audio when game ends
         if hasattr(self, 'audio_manager'):
             self.audio_manager.cleanup()
\ No newline at end of file
@@ -3,6 +3,22 @@
 import pygame
 import math
 import random
+import sys
+import os
+from ..rendering.render_queue import LAYER_GROUND, LAYER_ACTORS, LAYER_EFFECTS
+from ..ui.text_cache import text_cache
+from ..ui.font_registry import get_font
+from ..effects.particles import ParticleSystem, ParticleEmitter, PARTICLE_BUDGETS, SHAPE_SQUARE
+
+# How fast sparkles drift sideways in the average wind (pixels per second)
+SPARKLE_WIND_DRIFT = 15
+
+# Add the project root to the path to import assets
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+sys.path.insert(0, project_root)
+
+from assets.sprites.prop_cache import prop_cache
+from assets.sprites.surface_optimizer import optimize_surface
 
 class AnimatedRock:
     def __init__(self, x, y):
@@ -19,7 +35,17 @@ class AnimatedRock:
 
         # Sparkle animation
         self.sparkle_timer = 0.0
-        self.sparkles = []
+        self.sparkles = ParticleSystem(PARTICLE_BUDGETS["sparkles"], [
+            (255, 255, 200),  # Soft yellow
+            (200, 255, 255),  # Soft cyan
+            (255, 200, 255),  # Soft magenta
+            (200, 255, 200)   # Soft green
+        ], shape=SHAPE_SQUARE, fade_out=False, fade_rate=200)
+        self.sparkle_emitter = ParticleEmitter(self.sparkles,
+                                               area=(10, self.width - 10, 5, self.height - 5),
+                                               velocity=((0, 0), (-40, -20)),
+                                               lifetime=(1.0, 2.0), size=(3, 3),
+                                               wind_speed=(SPARKLE_WIND_DRIFT, SPARKLE_WIND_DRIFT))
         self.next_sparkle_time = random.uniform(0.5, 2.0)
 
         # Interaction properties
@@ -31,8 +57,11 @@ class AnimatedRock:
         self.highlight_color = (140, 130, 120)
         self.shadow_color = (80, 70, 60)
 
-    def update(self, dt):
-        """Update rock animations"""
+        # Interaction hint font
+        self.hint_font = get_font(24)
+
+    def update(self, dt, wind=None):
+        """Update rock animations (sparkles drift with the WindField, if given)"""
         # Gentle bobbing animation
         self.bob_timer += dt * self.bob_speed
         self.y = self.base_y + math.sin(self.bob_timer) * self.bob_amplitude
@@ -46,32 +75,12 @@ class AnimatedRock:
             self.sparkle_timer = 0.0
             self.next_sparkle_time = random.uniform(1.0, 3.0)
 
-        # Update existing sparkles
-        for sparkle in self.sparkles[:]:
-            sparkle['timer'] += dt
-            sparkle['y'] -= sparkle['speed'] * dt
-            sparkle['alpha'] = max(0, sparkle['alpha'] - dt * 200)
-
-            if sparkle['timer'] > sparkle['lifetime'] or sparkle['alpha'] <= 0:
-                self.sparkles.remove(sparkle)
+        # Sparkles rise, fade and drift with the wind
+        self.sparkles.update(dt, wind)
 
     def add_sparkle(self):
         """Add a magical sparkle effect"""
-        sparkle = {
-            'x': self.x + random.randint(10, self.width - 10),
-            'y': self.y + random.randint(5, self.height - 5),
-            'speed': random.uniform(20, 40),
-            'timer': 0.0,
-            'lifetime': random.uniform(1.0, 2.0),
-            'alpha': 255,
-            'color': random.choice([
-                (255, 255, 200),  # Soft yellow
-                (200, 255, 255),  # Soft cyan
-                (255, 200, 255),  # Soft magenta
-                (200, 255, 200)   # Soft green
-            ])
-        }
-        self.sparkles.append(sparkle)
+        self.sparkle_emitter.emit(1, self.x, self.y)
 
     def check_proximity(self, protagonist_x, protagonist_y, sprite_width, sprite_height):
         """Check if protagonist is near the rock"""
@@ -97,52 +106,65 @@ class AnimatedRock:
 
     def render(self, screen):
         """Render the animated rock"""
+        self.render_shadow(screen)
+        self.render_body(screen)
+        self.render_sparkles(screen)
+
+    def submit(self, render_queue):
+        """Queue the rock's parts so it depth-sorts against the protagonist"""
+        render_queue.submit_draw(self.render_shadow, LAYER_GROUND, self.base_y + self.height)
+        render_queue.submit_draw(self.render_body, LAYER_ACTORS, self.base_y + self.height)
+        render_queue.submit_draw(self.render_sparkles, LAYER_EFFECTS, self.base_y)
+
+    def render_shadow(self, screen):
+        """Render the shadow under the rock"""
         # Draw shadow
-        shadow_rect = pygame.Rect(self.x + 5, self.base_y + self.height - 5, self.width, 8)
         shadow_alpha = max(50, int(100 - abs(self.y - self.base_y) * 10))
+        shadow_surface = prop_cache.get(("rock_shadow", self.width), self.create_shadow_sprite)
+        shadow_surface.set_alpha(shadow_alpha)  # Shared sprite - alpha is set right before each blit
+        screen.blit(shadow_surface, (self.x + 5, self.base_y + self.height - 5))
+
+    def create_shadow_sprite(self, variant="normal"):
+        """Create the flat shadow under the rock"""
         shadow_surface = pygame.Surface((self.width, 8))
-        shadow_surface.set_alpha(shadow_alpha)
         shadow_surface.fill(self.shadow_color)
-        screen.blit(shadow_surface, (self.x + 5, self.base_y + self.height - 5))
+        return shadow_surface
+
+    def render_body(self, screen):
+        """Render the rock body"""
+        body_sprite = prop_cache.get(("rock_body", self.width, self.height), self.create_body_sprite)
+        screen.blit(body_sprite, (self.x, int(self.y)))
+
+    def create_body_sprite(self, variant="normal"):
+        """Draw the rock body once, relative to its top-left corner"""
+        body_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
 
         # Draw main rock body (oval shape)
-        rock_rect = pygame.Rect(self.x, int(self.y), self.width, self.height)
-        pygame.draw.ellipse(screen, self.base_color, rock_rect)
+        rock_rect = pygame.Rect(0, 0, self.width, self.height)
+        pygame.draw.ellipse(body_surface, self.base_color, rock_rect)
 
         # Draw rock highlights for 3D effect
-        highlight_rect = pygame.Rect(self.x + 5, int(self.y) + 5, self.width - 20, self.height - 20)
-        pygame.draw.ellipse(screen, self.highlight_color, highlight_rect)
+        highlight_rect = pygame.Rect(5, 5, self.width - 20, self.height - 20)
+        pygame.draw.ellipse(body_surface, self.highlight_color, highlight_rect)
 
         # Draw rock texture lines
         for i in range(3):
-            start_x = self.x + 15 + i * 20
-            start_y = int(self.y) + 10 + i * 5
+            start_x = 15 + i * 20
+            start_y = 10 + i * 5
             end_x = start_x + 25
             end_y = start_y + 8
-            pygame.draw.line(screen, self.shadow_color, (start_x, start_y), (end_x, end_y), 2)
-
-        # Draw sparkles
-        for sparkle in self.sparkles:
-            # Create sparkle surface with alpha
-            sparkle_surface = pygame.Surface((6, 6))
-            sparkle_surface.set_alpha(int(sparkle['alpha']))
-            sparkle_surface.fill(sparkle['color'])
-
-            # Draw sparkle as a small star shape
-            sparkle_x = int(sparkle['x'])
-            sparkle_y = int(sparkle['y'])
+            pygame.draw.line(body_surface, self.shadow_color, (start_x, start_y), (end_x, end_y), 2)
 
-            # Draw + shape for sparkle
-            pygame.draw.line(sparkle_surface, sparkle['color'], (1, 3), (5, 3), 1)
-            pygame.draw.line(sparkle_surface, sparkle['color'], (3, 1), (3, 5), 1)
+        return optimize_surface(body_surface)
 
-            screen.blit(sparkle_surface, (sparkle_x - 3, sparkle_y - 3))
+    def render_sparkles(self, screen):
+        """Render the sparkles floating off the rock"""
+        self.sparkles.draw(screen)
 
     def render_interaction_hint(self, screen):
         """Render interaction hint when protagonist is near"""
         # Small text above the rock
-        font = pygame.font.Font(None, 24)
-        text = font.render("Press ENTER to sit", True, (255, 255, 255))
+        text = text_cache.render(self.hint_font, "Press ENTER to sit", True, (255, 255, 255))
         text_rect = text.get_rect()
         text_rect.centerx = self.x + self.width // 2
         text_rect.bottom = int(self.y) - 10
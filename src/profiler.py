@@ -0,0 +1,65 @@
+"""Frame time profiler for the main loop"""
+
+import time
+from collections import deque
+
+
+class FrameProfiler:
+    def __init__(self, target_fps=60, window=120):
+        """
+        Measures how long each frame's work takes, excluding the frame limiter's sleep
+
+        Args:
+            target_fps: Frame rate the game aims for (frames slower than its budget count as slow)
+            window: Number of recent frames averaged
+        """
+        self.budget_ms = 1000.0 / target_fps
+        self.frame_times = deque(maxlen=window)
+        self.frame_start = None
+
+        # Named values reported by subsystems (e.g. weather quality level)
+        self.values = {}
+
+        # Statistics
+        self.frames = 0
+        self.slow_frames = 0
+        self.worst_ms = 0.0
+
+    def begin_frame(self):
+        """Mark the start of a frame's work"""
+        self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """
+        Mark the end of a frame's work
+
+        Returns:
+            Milliseconds of work this frame
+        """
+        frame_ms = (time.perf_counter() - self.frame_start) * 1000.0
+        self.frame_times.append(frame_ms)
+        self.frames += 1
+        if frame_ms > self.budget_ms:
+            self.slow_frames += 1
+        self.worst_ms = max(self.worst_ms, frame_ms)
+        return frame_ms
+
+    def set_value(self, name, value):
+        """Record a named value to show alongside the frame times"""
+        self.values[name] = value
+
+    def get_average_ms(self):
+        """Average work time over the recent frames"""
+        if not self.frame_times:
+            return 0.0
+        return sum(self.frame_times) / len(self.frame_times)
+
+    def get_stats(self):
+        """Get profiler statistics"""
+        return {
+            'frames': self.frames,
+            'average_ms': self.get_average_ms(),
+            'worst_ms': self.worst_ms,
+            'slow_frames': self.slow_frames,
+            'values': dict(self.values),
+        }
@@ -0,0 +1 @@
+# Rendering helpers shared by the game states
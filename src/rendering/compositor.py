@@ -0,0 +1,72 @@
+"""Full-screen fades, flashes and tints drawn from preallocated overlay surfaces"""
+
+import pygame
+
+
+class Compositor:
+    def __init__(self):
+        """
+        Shared screen-effect service
+
+        Scenes ask for an effect ("fade to black at this alpha", "white flash")
+        and the compositor draws it with a surface that is allocated once per
+        screen size and color, so steady-state frames allocate nothing.
+        """
+        # (screen size, color) -> opaque overlay filled with that color
+        self.overlays = {}
+
+        # Statistics
+        self.allocations = 0
+
+    def get_overlay(self, size, color):
+        """Get the preallocated overlay for a screen size and color"""
+        key = (size, tuple(color[:3]))
+        overlay = self.overlays.get(key)
+        if overlay is None:
+            overlay = pygame.Surface(size)
+            overlay.fill(key[1])
+            if pygame.display.get_surface() is not None:
+                overlay = overlay.convert()
+            self.overlays[key] = overlay
+            self.allocations += 1
+        return overlay
+
+    def fade(self, screen, alpha, color=(0, 0, 0)):
+        """
+        Cover the screen with a color at the given opacity
+
+        Args:
+            screen: Surface to draw on
+            alpha: Opacity 0-255 (0 draws nothing)
+            color: Overlay color
+        """
+        alpha = int(alpha)
+        if alpha <= 0:
+            return
+        if alpha >= 255:
+            screen.fill(color)
+            return
+
+        overlay = self.get_overlay(screen.get_size(), color)
+        overlay.set_alpha(alpha)
+        screen.blit(overlay, (0, 0))
+
+    def dim(self, screen, alpha):
+        """Darken the screen behind menus and overlays"""
+        self.fade(screen, alpha, (0, 0, 0))
+
+    def flash(self, screen, alpha, color=(255, 255, 255)):
+        """Blend a flash color (lightning, hits) over the screen"""
+        self.fade(screen, alpha, color)
+
+    def tint(self, screen, color, blend=pygame.BLEND_RGB_MULT):
+        """Tint the whole screen in place with a blend flag (no overlay surface needed)"""
+        screen.fill(color, special_flags=blend)
+
+    def clear(self):
+        """Drop the preallocated overlays (e.g. after a resolution change)"""
+        self.overlays.clear()
+
+
+# Shared compositor used by all game states
+compositor = Compositor()
@@ -0,0 +1,118 @@
+"""Presents the virtual display surface on the real window without per-frame allocations"""
+
+import pygame
+
+# Fullscreen scaling strategies
+SCALE_INTEGER = 'integer'  # Largest whole-number scale, centered with black letterbox bars
+SCALE_NEAREST = 'nearest'  # Stretch to fill the screen, nearest-neighbour (pixel art stays sharp)
+SCALE_SMOOTH = 'smooth'    # Stretch to fill the screen with filtering
+SCALE_SDL = 'scaled'       # Let SDL scale on the GPU (pygame.SCALED)
+
+SCALE_STRATEGIES = [SCALE_INTEGER, SCALE_NEAREST, SCALE_SMOOTH, SCALE_SDL]
+
+class Presenter:
+    def __init__(self, base_width, base_height, strategy=SCALE_NEAREST):
+        """
+        Set up presentation of a fixed-size virtual screen
+
+        Args:
+            base_width: Width of the virtual display surface
+            base_height: Height of the virtual display surface
+            strategy: One of SCALE_STRATEGIES, used in fullscreen
+        """
+        if strategy not in SCALE_STRATEGIES:
+            print(f"Unknown scale strategy '{strategy}', using {SCALE_NEAREST}")
+            strategy = SCALE_NEAREST
+
+        self.base_size = (base_width, base_height)
+        self.strategy = strategy
+        self.screen = None
+        self.fullscreen = False
+
+        # Preallocated per display mode
+        self.scaled_surface = None  # Destination for scale()/smoothscale()
+        self.scaled_pos = (0, 0)
+        self.letterbox_rects = []
+
+    def set_mode(self, fullscreen, source_surface=None):
+        """
+        Open the window or go fullscreen, and preallocate the scaling target
+
+        Args:
+            fullscreen: True for fullscreen, False for a window at the base size
+            source_surface: Virtual display surface (scale targets copy its pixel format)
+        """
+        self.fullscreen = fullscreen
+        self.scaled_surface = None
+        self.scaled_pos = (0, 0)
+        self.letterbox_rects = []
+
+        if not fullscreen:
+            self.screen = pygame.display.set_mode(self.base_size)
+            return self.screen
+
+        if self.strategy == SCALE_SDL:
+            # SDL keeps the base resolution and scales when presenting
+            try:
+                self.screen = pygame.display.set_mode(self.base_size, pygame.FULLSCREEN | pygame.SCALED)
+                return self.screen
+            except pygame.error as e:
+                print(f"SDL scaling not available ({e}), using {SCALE_NEAREST}")
+                self.strategy = SCALE_NEAREST
+
+        self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        screen_width, screen_height = self.screen.get_size()
+        base_width, base_height = self.base_size
+
+        if self.strategy == SCALE_INTEGER:
+            factor = min(screen_width // base_width, screen_height // base_height)
+            if factor == 0:
+                # Screen smaller than the base size - a 1x picture would be cropped
+                print(f"Screen {screen_width}x{screen_height} too small for integer scaling, using {SCALE_NEAREST}")
+                self.strategy = SCALE_NEAREST
+
+        if self.strategy == SCALE_INTEGER:
+            scaled_size = (base_width * factor, base_height * factor)
+        else:
+            scaled_size = (screen_width, screen_height)
+
+        self.scaled_pos = ((screen_width - scaled_size[0]) // 2, (screen_height - scaled_size[1]) // 2)
+        scaled_rect = pygame.Rect(self.scaled_pos, scaled_size)
+
+        # Bars around the picture (integer scaling only)
+        screen_rect = self.screen.get_rect()
+        self.letterbox_rects = [
+            pygame.Rect(0, 0, screen_width, scaled_rect.top),
+            pygame.Rect(0, scaled_rect.bottom, screen_width, screen_height - scaled_rect.bottom),
+            pygame.Rect(0, scaled_rect.top, scaled_rect.left, scaled_rect.height),
+            pygame.Rect(scaled_rect.right, scaled_rect.top, screen_width - scaled_rect.right, scaled_rect.height)
+        ]
+        self.letterbox_rects = [rect for rect in self.letterbox_rects if rect.width > 0 and rect.height > 0]
+
+        # scale() into an existing surface needs a matching pixel format
+        if source_surface is not None:
+            self.scaled_surface = pygame.Surface(scaled_size, 0, source_surface)
+        else:
+            self.scaled_surface = pygame.Surface(scaled_size).convert()
+
+        self.screen.fill((0, 0, 0))
+        print(f"Presenting {base_width}x{base_height} at {scaled_size[0]}x{scaled_size[1]} "
+              f"on {screen_rect.width}x{screen_rect.height} ({self.strategy})")
+        return self.screen
+
+    def present(self, display_surface):
+        """Copy the virtual screen to the real screen (caller flips)"""
+        if not self.fullscreen or self.scaled_surface is None:
+            # Windowed, or SDL does the scaling
+            self.screen.blit(display_surface, (0, 0))
+            return
+
+        # Scale into the preallocated surface - no new Surface per frame
+        if self.strategy == SCALE_SMOOTH:
+            pygame.transform.smoothscale(display_surface, self.scaled_surface.get_size(), self.scaled_surface)
+        else:
+            pygame.transform.scale(display_surface, self.scaled_surface.get_size(), self.scaled_surface)
+
+        for rect in self.letterbox_rects:
+            self.screen.fill((0, 0, 0), rect)
+        self.screen.blit(self.scaled_surface, self.scaled_pos)
@@ -0,0 +1,92 @@
+"""Per-frame render queue with layered, y-sorted batched blitting"""
+
+# Draw layers, flushed from lowest to highest
+LAYER_GROUND = 0   # Shadows, hatches and other things lying on the ground
+LAYER_ACTORS = 1   # Characters and props - ordered by where they touch the ground
+LAYER_EFFECTS = 2  # Sparkles and other effects drawn above the actors
+LAYER_PROJECTILES = 3  # Bullets - one batch over everything, not depth-sorted
+
+class RenderQueue:
+    def __init__(self):
+        """Create an empty render queue - submit during render(), then flush() once"""
+        self.layers = {}
+        self.submit_order = 0  # Keeps submission order for items with the same sort_y
+
+        # Stats from the last flush
+        self.last_item_count = 0
+        self.last_blits_calls = 0
+
+    def submit(self, surface, pos, layer=LAYER_ACTORS, sort_y=None):
+        """
+        Queue a surface to be blitted
+
+        Args:
+            surface: Surface to draw
+            pos: Top-left screen position
+            layer: Draw layer (LAYER_GROUND, LAYER_ACTORS, LAYER_EFFECTS...)
+            sort_y: Depth within the layer - defaults to the bottom edge of the surface
+        """
+        if sort_y is None:
+            sort_y = pos[1] + surface.get_height()
+        self._add(layer, sort_y, ((surface, pos),), None)
+
+    def submit_batch(self, surface, positions, layer=LAYER_PROJECTILES, sort_y=0):
+        """
+        Queue many copies of one surface as a single item (bullets)
+
+        The whole batch shares one depth, so give it a layer that does not need
+        to sort against anything else.
+
+        Args:
+            surface: Surface drawn at every position
+            positions: List of top-left screen positions
+            layer: Draw layer
+            sort_y: Depth of the whole batch within the layer
+        """
+        if not positions:
+            return
+        self._add(layer, sort_y, [(surface, pos) for pos in positions], None)
+
+    def submit_draw(self, draw_func, layer=LAYER_ACTORS, sort_y=0):
+        """Queue an immediate-mode draw (e.g. pygame.draw primitives) called as draw_func(screen)"""
+        self._add(layer, sort_y, None, draw_func)
+
+    def _add(self, layer, sort_y, blit_args, draw_func):
+        """Store a queued item"""
+        self.submit_order += 1
+        self.layers.setdefault(layer, []).append((sort_y, self.submit_order, blit_args, draw_func))
+
+    def flush(self, screen):
+        """Draw everything queued, layer by layer, and empty the queue"""
+        self.last_item_count = 0
+        self.last_blits_calls = 0
+
+        for layer in sorted(self.layers):
+            items = self.layers[layer]
+            items.sort(key=lambda item: (item[0], item[1]))
+            self.last_item_count += len(items)
+
+            # Consecutive surfaces go out in one Surface.blits call; a draw call ends the batch
+            batch = []
+            for sort_y, order, blit_args, draw_func in items:
+                if draw_func is None:
+                    batch.extend(blit_args)
+                    continue
+
+                if batch:
+                    screen.blits(batch, doreturn=False)
+                    self.last_blits_calls += 1
+                    batch = []
+                draw_func(screen)
+
+            if batch:
+                screen.blits(batch, doreturn=False)
+                self.last_blits_calls += 1
+
+        self.layers.clear()
+        self.submit_order = 0
+
+    def clear(self):
+        """Drop everything queued without drawing it"""
+        self.layers.clear()
+        self.submit_order = 0
@@ -0,0 +1,74 @@
+"""Static scene layers composed once into a cached surface"""
+
+import pygame
+
+# Fill color for transparent layers - no HUD art uses pure magenta
+LAYER_COLORKEY = (255, 0, 255)
+
+
+class StaticLayer:
+    def __init__(self, size, transparent=True):
+        """
+        Cached composition of draw callbacks that only change on invalidate()
+
+        Transparent layers (HUD labels drawn over the scene) are composed on a
+        colorkeyed surface, so pygame.draw colors behave exactly as they do on the
+        screen, then cropped to the area that was drawn. Opaque layers (background
+        plus anything fixed on it) cover the whole screen.
+
+        Args:
+            size: (width, height) of the scene
+            transparent: True for overlays, False for background layers
+        """
+        self.size = size
+        self.transparent = transparent
+        self.draw_funcs = []
+
+        self.surface = None
+        self.offset = (0, 0)
+        self.dirty = True
+
+        # Statistics
+        self.rebuilds = 0
+
+    def add(self, draw_func):
+        """Add a callback draw_func(surface) to the layer, drawn in the order added"""
+        self.draw_funcs.append(draw_func)
+        self.dirty = True
+
+    def invalidate(self):
+        """Recompose the layer before it is drawn next"""
+        self.dirty = True
+
+    def build(self):
+        """Compose all draw callbacks into the cached surface"""
+        layer = pygame.Surface(self.size)
+        if self.transparent:
+            layer.fill(LAYER_COLORKEY)
+            layer.set_colorkey(LAYER_COLORKEY)
+
+        for draw_func in self.draw_funcs:
+            draw_func(layer)
+
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert()
+
+        if self.transparent:
+            # Keep only the drawn area so the per-frame blit stays small
+            bounds = layer.get_bounding_rect()
+            layer = layer.subsurface(bounds).copy()
+            layer.set_colorkey(LAYER_COLORKEY, pygame.RLEACCEL)
+            self.offset = bounds.topleft
+        else:
+            self.offset = (0, 0)
+
+        self.surface = layer
+        self.dirty = False
+        self.rebuilds += 1
+
+    def draw(self, screen):
+        """Blit the layer, recomposing it first if it was invalidated"""
+        if self.dirty:
+            self.build()
+        if self.surface.get_width() and self.surface.get_height():
+            screen.blit(self.surface, self.offset)
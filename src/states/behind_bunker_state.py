@@ -6,9 +6,16 @@ from .game_state import GameState
 from ..ui.speech_bubble import SpeechBubble, InteractionPrompt
 from ..ui.action_indicator import ActionIndicator
 from ..ui.quit_overlay import QuitOverlay
+from ..ui.text_cache import text_cache
+from ..ui.font_registry import get_font
 from ..effects.light_effect import LightManager
-from ..effects.weather_system import WeatherSystem
+from ..effects.weather_system import WeatherSystem, WeatherSceneConfig
+from ..effects.spawn_region import create_walkable_region
+from ..effects.sky_map import SkyMap
 from ..audio.audio_manager import AudioManager
+from ..rendering.render_queue import RenderQueue, LAYER_GROUND, LAYER_ACTORS, LAYER_PROJECTILES
+from ..rendering.compositor import compositor
+from ..rendering.static_layer import StaticLayer
 
 # Add the project root to the path to import assets
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
@@ -17,11 +24,13 @@ sys.path.insert(0, project_root)
 from assets.backgrounds.collision_map import create_maginot_collision_map
 from assets.backgrounds.image_collision_detector import create_smart_collision_map
 from assets.sprites.protagonist import create_protagonist_animation_system
-from assets.sprites.bullet import Bullet, get_direction_from_keys
+from assets.sprites.bullet import BulletPool, get_direction_from_keys
 from assets.sprites.sprite_sheet_loader import SpriteSheet
+from assets.sprites.surface_optimizer import optimize_surface
+from assets.sprites.prop_cache import prop_cache
 
 class BehindBunkerState(GameState):
-    def __init__(self, screen, audio_manager=None):
+    def __init__(self, screen, audio_manager=None, weather=None):
         self.screen = screen
         self.screen_width = screen.get_width()
         self.screen_height = screen.get_height()
@@ -72,11 +81,14 @@ class BehindBunkerState(GameState):
         self.is_moving = False
         self.last_facing_direction = 'down'  # Start facing down
 
-        # Shooting
-        self.bullets = []
+        # Shooting - bullets come from a preallocated pool
+        self.bullets = BulletPool()
         self.shoot_cooldown = 0.0
         self.shoot_delay = 0.2  # seconds between shots
 
+        # Depth-sorted drawing of protagonist, props and bullets
+        self.render_queue = RenderQueue()
+
         # UI components
         self.action_indicator = ActionIndicator(0, 0)
         self.interaction_prompt = InteractionPrompt()
@@ -138,14 +150,24 @@ class BehindBunkerState(GameState):
         # Quit overlay
         self.quit_overlay = QuitOverlay()
 
+        # HUD fonts - shared via the font registry, text is rendered through the shared text cache
+        self.scene_font = get_font(36)
+        self.location_font = get_font(24)
+        self.hint_font = get_font(28)
+
+        # Scene number and location label - composed once, drawn as one blit
+        self.hud_layer = StaticLayer((self.screen_width, self.screen_height))
+        self.hud_layer.add(self.draw_hud_labels)
+
         # Create lighting effects
         self.light_manager = LightManager()
         # Add some ambient lighting behind the bunker
         self.light_manager.add_light(400, 200, radius=8, color=(255, 220, 120))
         self.light_manager.add_light(600, 300, radius=6, color=(200, 255, 200))
 
-        # Create weather system (same rain and thunder as field)
-        self.weather = WeatherSystem(self.screen_width, self.screen_height)
+        # Join the game's storm (rain and lightning carry on between scenes) - standalone scenes make their own
+        self.weather = weather if weather else WeatherSystem(self.screen_width, self.screen_height)
+        self.weather.set_scene("behind_bunker", self.create_weather_scene)
 
         # Use shared audio manager or create new one
         if audio_manager:
@@ -185,6 +207,7 @@ class BehindBunkerState(GameState):
             if os.path.exists(bg_path):
                 background = pygame.image.load(bg_path)
                 background = pygame.transform.scale(background, (self.screen_width, self.screen_height))
+                background = optimize_surface(background)
                 print(f"Loaded behind bunker background from: {bg_path}")
                 return background
             else:
@@ -492,11 +515,29 @@ class BehindBunkerState(GameState):
 
     def draw_rusty_iron_hatch(self, screen):
         """Draw an old iron rusty door hatch with rounded edges"""
-        hatch_x = self.hatch_collision_x
-        hatch_y = self.hatch_collision_y
+        # Pick the variant - each is drawn once and then shared from the prop cache
+        if self.hatch_is_open:
+            variant = "open"
+        elif self.near_hatch_collision:
+            variant = "highlighted"
+        else:
+            variant = "normal"
+
+        hatch_name = ("hatch", self.hatch_collision_width, self.hatch_collision_height)
+        hatch_sprite = prop_cache.get(hatch_name, self.create_hatch_sprite, variant)
+        screen.blit(hatch_sprite, (self.hatch_collision_x, self.hatch_collision_y))
+
+    def create_hatch_sprite(self, variant):
+        """Draw one variant ('normal', 'highlighted', 'open') of the hatch"""
         hatch_w = self.hatch_collision_width
         hatch_h = self.hatch_collision_height
 
+        # Open hatch is just a black hole
+        if variant == "open":
+            hole_surface = pygame.Surface((hatch_w, hatch_h), pygame.SRCALPHA)
+            hole_surface.fill((0, 0, 0))  # Pure black hole
+            return optimize_surface(hole_surface)
+
         # Base moss green colors to blend with environment
         moss_green = (76, 91, 61)
         dark_moss = (45, 55, 35)
@@ -531,12 +572,11 @@ class BehindBunkerState(GameState):
                     hatch_surface.set_at((hatch_w - x - 1, hatch_h - y - 1), dark_moss)
 
         # Add moss and weathering patches
-        import random
-        random.seed(42)  # Consistent pattern
+        patch_random = random.Random(42)  # Consistent pattern without touching the global RNG
         for i in range(15):
-            patch_x = random.randint(2, hatch_w - 3)
-            patch_y = random.randint(2, hatch_h - 3)
-            patch_size = random.randint(2, 5)
+            patch_x = patch_random.randint(2, hatch_w - 3)
+            patch_y = patch_random.randint(2, hatch_h - 3)
+            patch_size = patch_random.randint(2, 5)
             patch_color = forest_green if i % 2 == 0 else moss_green
             pygame.draw.circle(hatch_surface, patch_color, (patch_x, patch_y), patch_size)
 
@@ -567,20 +607,13 @@ class BehindBunkerState(GameState):
         pygame.draw.line(hatch_surface, (25, 35, 15), (hatch_w - 1, corner_radius), (hatch_w - 1, hatch_h - corner_radius), 2)
 
         # Apply brightness when near
-        if self.near_hatch_collision:
+        if variant == "highlighted":
             # Create a bright overlay
             overlay = pygame.Surface((hatch_w, hatch_h), pygame.SRCALPHA)
             overlay.fill((255, 255, 150, 50))  # Yellow highlight when near
             hatch_surface.blit(overlay, (0, 0))
 
-        # Draw black hole if hatch is open
-        if self.hatch_is_open:
-            hole_surface = pygame.Surface((hatch_w, hatch_h), pygame.SRCALPHA)
-            hole_surface.fill((0, 0, 0))  # Pure black hole
-            screen.blit(hole_surface, (hatch_x, hatch_y))
-        else:
-            # Blit the hatch to the main screen
-            screen.blit(hatch_surface, (hatch_x, hatch_y))
+        return optimize_surface(hatch_surface)
 
     def start_hatch_interaction(self):
         """Start the hatch interaction sequence"""
@@ -662,6 +695,25 @@ class BehindBunkerState(GameState):
         self.next_scene = next_scene
         self.transitioning = True
 
+    def create_weather_scene(self):
+        """Puddles on the walkable ground below the boundary, rain stopped by the roofs (built once per game)"""
+        return WeatherSceneConfig(
+            puddle_region=create_walkable_region(
+                self.collision_map, pygame.Rect(100, self.horizontal_boundary_y, self.screen_width - 200,
+                                                self.screen_height - 30 - self.horizontal_boundary_y)),
+            sky_map=self.create_sky_map())
+
+    def create_sky_map(self):
+        """Rain stops on the bunker roof (roof line traced from the concept art)"""
+        sky_map = SkyMap(self.screen_width, self.screen_height)
+        sky_map.add_silhouette([
+            (375, 490), (385, 460), (415, 445), (465, 435),              # Left roof
+            (467, 412), (477, 380), (505, 360), (522, 352), (550, 365),  # Dome
+            (567, 400), (575, 420),
+            (600, 437), (630, 450), (647, 490), (652, 525),              # Right roof
+        ])
+        return sky_map
+
     def handle_event(self, event):
         # Handle quit overlay input first if it's visible
         if self.quit_overlay.is_visible():
@@ -810,15 +862,11 @@ class BehindBunkerState(GameState):
 
             bullet_x = self.protagonist_x + gun_x_offset
             bullet_y = self.protagonist_y + gun_y_offset
-            bullet = Bullet(bullet_x, bullet_y, direction_x, direction_y)
-            self.bullets.append(bullet)
+            self.bullets.fire(bullet_x, bullet_y, direction_x, direction_y)
             self.shoot_cooldown = self.shoot_delay
 
         # Update bullets
-        for bullet in self.bullets[:]:  # Use slice copy to avoid modification during iteration
-            bullet.update(dt)
-            if bullet.is_off_screen(self.screen_width, self.screen_height):
-                self.bullets.remove(bullet)
+        self.bullets.update(dt, self.screen_width, self.screen_height)
 
         # Handle animation based on movement
         if self.is_moving and movement_direction:
@@ -857,6 +905,28 @@ class BehindBunkerState(GameState):
 
         return None
 
+    def draw_hud_labels(self, surface):
+        """Draw the scene labels that never change"""
+        # Draw scene number
+        scene_text = text_cache.render(self.scene_font, "SCENE 3", True, (255, 255, 255))
+        scene_rect = scene_text.get_rect()
+        scene_rect.topright = (self.screen_width - 20, 20)
+
+        # Draw scene background
+        scene_bg_rect = scene_rect.inflate(10, 5)
+        pygame.draw.rect(surface, (0, 0, 0, 180), scene_bg_rect)
+        surface.blit(scene_text, scene_rect)
+
+        # Optional: Draw a simple UI element showing location
+        location_text = text_cache.render(self.location_font, "Behind the Maginot Line - SCENE 3", True, (255, 255, 255))
+        text_rect = location_text.get_rect()
+        text_rect.topleft = (10, 10)
+
+        # Draw text background
+        bg_rect = text_rect.inflate(10, 5)
+        pygame.draw.rect(surface, (0, 0, 0, 128), bg_rect)
+        surface.blit(location_text, text_rect)
+
     def render(self, screen):
         # Draw background
         screen.blit(self.background, (0, 0))
@@ -864,9 +934,12 @@ class BehindBunkerState(GameState):
         # Draw lighting effects
         self.light_manager.draw(screen)
 
-        # Draw bullets
-        for bullet in self.bullets:
-            bullet.render(screen)
+        # Queue bullets (drawn with the protagonist and props below)
+        self.bullets.submit(self.render_queue, LAYER_PROJECTILES)
+
+        # Draw bunker door hatch collision box - old iron rusty door with rounded edges
+        # (queued on the ground layer so the protagonist is drawn over it)
+        self.render_queue.submit_draw(self.draw_rusty_iron_hatch, LAYER_GROUND)
 
         # Draw protagonist (hatch inspection animation takes priority)
         if self.is_inspecting_hatch and self.hatch_inspection_frames:
@@ -878,7 +951,7 @@ class BehindBunkerState(GameState):
                     scaled_width = int(inspection_sprite.get_width() * self.character_display_scale)
                     scaled_height = int(inspection_sprite.get_height() * self.character_display_scale)
                     inspection_sprite = pygame.transform.scale(inspection_sprite, (scaled_width, scaled_height))
-                screen.blit(inspection_sprite, (int(self.protagonist_x), int(self.protagonist_y)))
+                self.render_queue.submit(inspection_sprite, (int(self.protagonist_x), int(self.protagonist_y)), LAYER_ACTORS)
         else:
             # Show normal protagonist animation
             protagonist_sprite = self.protagonist_animation.get_current_frame()
@@ -891,7 +964,10 @@ class BehindBunkerState(GameState):
                     scaled_height = int(protagonist_sprite.get_height() * self.character_display_scale)
                     protagonist_sprite = pygame.transform.scale(protagonist_sprite, (scaled_width, scaled_height))
 
-                screen.blit(protagonist_sprite, (int(self.protagonist_x), int(self.protagonist_y)))
+                self.render_queue.submit(protagonist_sprite, (int(self.protagonist_x), int(self.protagonist_y)), LAYER_ACTORS)
+
+        # Draw everything queued this frame, sorted by depth
+        self.render_queue.flush(screen)
 
         # Draw weather effects (rain and lightning over everything)
         self.weather.draw(screen)
@@ -899,27 +975,8 @@ class BehindBunkerState(GameState):
         # Draw collision debug if enabled
         self.collision_map.render_debug(screen)
 
-        # Draw scene number
-        scene_font = pygame.font.Font(None, 36)
-        scene_text = scene_font.render("SCENE 3", True, (255, 255, 255))
-        scene_rect = scene_text.get_rect()
-        scene_rect.topright = (self.screen_width - 20, 20)
-
-        # Draw scene background
-        scene_bg_rect = scene_rect.inflate(10, 5)
-        pygame.draw.rect(screen, (0, 0, 0, 180), scene_bg_rect)
-        screen.blit(scene_text, scene_rect)
-
-        # Optional: Draw a simple UI element showing location
-        font = pygame.font.Font(None, 24)
-        location_text = font.render("Behind the Maginot Line - SCENE 3", True, (255, 255, 255))
-        text_rect = location_text.get_rect()
-        text_rect.topleft = (10, 10)
-
-        # Draw text background
-        bg_rect = text_rect.inflate(10, 5)
-        pygame.draw.rect(screen, (0, 0, 0, 128), bg_rect)
-        screen.blit(location_text, text_rect)
+        # Draw labels
+        self.hud_layer.draw(screen)
 
         # Horizontal boundary line is invisible (collision only)
 
@@ -942,13 +999,9 @@ class BehindBunkerState(GameState):
 
         # Dragonteeth collision box is invisible (collision only)
 
-        # Draw bunker door hatch collision box - old iron rusty door with rounded edges
-        self.draw_rusty_iron_hatch(screen)
-
         # Draw hatch inspection area hint when nearby
         if self.is_near_hatch() and not self.is_inspecting_hatch:
-            hint_font = pygame.font.Font(None, 28)
-            hint_text = hint_font.render("Press E to inspect hatch", True, (255, 255, 0))
+            hint_text = text_cache.render(self.hint_font, "Press E to inspect hatch", True, (255, 255, 0))
             hint_rect = hint_text.get_rect()
             hint_rect.centerx = self.screen_width // 2
             hint_rect.centery = 150  # Above hatch area
@@ -960,8 +1013,7 @@ class BehindBunkerState(GameState):
 
         # Draw return collision box hint
         if self.near_return_collision_box_red or self.near_return_collision_box_blue:
-            hint_font = pygame.font.Font(None, 28)
-            hint_text = hint_font.render("Transitioning back to front...", True, (255, 255, 0))
+            hint_text = text_cache.render(self.hint_font, "Transitioning back to front...", True, (255, 255, 0))
             hint_rect = hint_text.get_rect()
             hint_rect.centerx = self.screen_width // 2
             hint_rect.bottom = self.screen_height - 60
@@ -973,8 +1025,7 @@ class BehindBunkerState(GameState):
 
         # Draw transition hints if near edges
         if self.near_left_transition or self.near_right_transition:
-            hint_font = pygame.font.Font(None, 28)
-            hint_text = hint_font.render("Move to edge to return to front", True, (255, 255, 0))
+            hint_text = text_cache.render(self.hint_font, "Move to edge to return to front", True, (255, 255, 0))
             hint_rect = hint_text.get_rect()
             hint_rect.centerx = self.screen_width // 2
             hint_rect.bottom = self.screen_height - 20
@@ -998,11 +1049,7 @@ class BehindBunkerState(GameState):
 
         # Draw fade overlay if transitioning
         if (self.fade_in or self.fade_out) and self.fade_alpha > 0:
-            # Use SRCALPHA surface for smooth fade without box outlines
-            fade_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-            fade_color = (0, 0, 0, self.fade_alpha)  # Black with alpha
-            fade_surface.fill(fade_color)
-            screen.blit(fade_surface, (0, 0))
+            compositor.fade(screen, self.fade_alpha)
 
     def cleanup(self):
         """Clean up resources when behind bunker state is destroyed"""
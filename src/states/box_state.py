@@ -1,7 +1,16 @@
 import pygame
+import sys
 import os
 from .game_state import GameState
 from ..ui.quit_overlay import QuitOverlay
+from ..ui.font_registry import get_font
+from ..rendering.static_layer import StaticLayer
+
+# Add the project root to the path to import assets
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+sys.path.insert(0, project_root)
+
+from assets.sprites.surface_optimizer import optimize_surface
 
 class BoxState(GameState):
     def __init__(self, screen, box_has_key=True):
@@ -18,13 +27,20 @@ class BoxState(GameState):
         self.background = self.load_box_background()
 
         # Fonts
-        self.font_large = pygame.font.Font(None, 48)
-        self.font_medium = pygame.font.Font(None, 36)
-        self.font_small = pygame.font.Font(None, 28)
+        self.font_large = get_font(48)
+        self.font_medium = get_font(36)
+        self.font_small = get_font(28)
+
+        # Background with the prompt - composed once, drawn as one blit
+        self.background_layer = StaticLayer((self.screen_width, self.screen_height), transparent=False)
+        self.background_layer.add(self.draw_background_layer)
 
         # Quit overlay
         self.quit_overlay = QuitOverlay()
 
+        # Dirty-rect mode: areas changed since the last render (None = whole screen)
+        self.dirty_rects = None
+
         print("Box opened - You see a key inside!" if box_has_key else "Box opened - It's empty.")
 
     def load_box_background(self):
@@ -41,6 +57,7 @@ class BoxState(GameState):
             if os.path.exists(bg_path):
                 background = pygame.image.load(bg_path)
                 background = pygame.transform.scale(background, (self.screen_width, self.screen_height))
+                background = optimize_surface(background)
                 print(f"Loaded box background from: {bg_path}")
                 return background
             else:
@@ -94,6 +111,10 @@ class BoxState(GameState):
         # Handle quit overlay input first if it's visible
         if self.quit_overlay.is_visible():
             result = self.quit_overlay.handle_input(event)
+            if result == "resume":
+                self.mark_dirty()  # Overlay closed - whole screen changes
+            elif event.type == pygame.KEYDOWN:
+                self.mark_dirty(self.quit_overlay.get_panel_rect(self.screen_width, self.screen_height))
             if result == "quit":
                 # Signal the game to quit
                 pygame.event.post(pygame.event.Event(pygame.QUIT))
@@ -108,6 +129,7 @@ class BoxState(GameState):
             if event.key == pygame.K_ESCAPE:
                 # Show quit overlay
                 self.quit_overlay.show()
+                self.mark_dirty()
             elif event.key == pygame.K_BACKSPACE:
                 # Close without taking anything
                 return "field"
@@ -129,9 +151,10 @@ class BoxState(GameState):
         # Static state, nothing to update
         pass
 
-    def render(self, screen):
+    def draw_background_layer(self, surface):
+        """Draw the background and everything fixed on top of it"""
         # Draw background image (should be visible now)
-        screen.blit(self.background, (0, 0))
+        surface.blit(self.background, (0, 0))
 
         if self.box_has_key and self.awaiting_response:
             # Text asking about taking key (positioned at bottom of screen)
@@ -142,8 +165,8 @@ class BoxState(GameState):
 
             # Add background for text
             bg_rect = question_rect.inflate(20, 10)
-            pygame.draw.rect(screen, (0, 0, 0, 180), bg_rect)
-            screen.blit(question_text, question_rect)
+            pygame.draw.rect(surface, (0, 0, 0, 180), bg_rect)
+            surface.blit(question_text, question_rect)
 
             # Simple Y/N instruction
             instruction_text = self.font_small.render("Y - Yes    N - No    ESC - Leave", True, (200, 200, 200))
@@ -153,8 +176,8 @@ class BoxState(GameState):
 
             # Add background for instruction
             inst_bg_rect = instruction_rect.inflate(20, 10)
-            pygame.draw.rect(screen, (0, 0, 0, 180), inst_bg_rect)
-            screen.blit(instruction_text, instruction_rect)
+            pygame.draw.rect(surface, (0, 0, 0, 180), inst_bg_rect)
+            surface.blit(instruction_text, instruction_rect)
 
         else:  # Empty or key taken
             empty_text = self.font_medium.render("Empty.", True, (255, 255, 255))
@@ -163,8 +186,8 @@ class BoxState(GameState):
 
             # Add background for text
             bg_rect = empty_rect.inflate(20, 10)
-            pygame.draw.rect(screen, (0, 0, 0, 180), bg_rect)
-            screen.blit(empty_text, empty_rect)
+            pygame.draw.rect(surface, (0, 0, 0, 180), bg_rect)
+            surface.blit(empty_text, empty_rect)
 
             exit_text = self.font_small.render("ESC - Leave", True, (200, 200, 200))
             exit_rect = exit_text.get_rect()
@@ -173,12 +196,19 @@ class BoxState(GameState):
 
             # Add background for instruction
             exit_bg_rect = exit_rect.inflate(20, 10)
-            pygame.draw.rect(screen, (0, 0, 0, 180), exit_bg_rect)
-            screen.blit(exit_text, exit_rect)
+            pygame.draw.rect(surface, (0, 0, 0, 180), exit_bg_rect)
+            surface.blit(exit_text, exit_rect)
+
+    def render(self, screen):
+        # Draw background and labels
+        self.background_layer.draw(screen)
 
         # Draw quit overlay on top of everything
         self.quit_overlay.render(screen)
 
+        # Everything is up to date until the next input
+        self.dirty_rects = []
+
     def cleanup(self):
         """Clean up resources"""
         pass
\ No newline at end of file
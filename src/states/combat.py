@@ -1,12 +1,15 @@
 import pygame
 from .game_state import GameState
+from ..ui.text_cache import text_cache
+from ..ui.font_registry import get_font
+from ..ui.bitmap_font import get_bitmap_font
 from ..entities import Player, GermanSoldier, GermanOfficer, ActionType
 
 class CombatState(GameState):
     def __init__(self, screen):
         self.screen = screen
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
+        self.font = get_font(36)
+        self.small_font = get_font(24)
 
         self.party = [Player("Jean", "French Soldier")]
         self.enemies = [GermanSoldier(), GermanOfficer()]
@@ -127,10 +130,10 @@ class CombatState(GameState):
 
         y_offset = 50
 
-        title = self.font.render("LIGNE MAUDITE - COMBAT", True, (255, 255, 255))
+        title = text_cache.render(self.font, "LIGNE MAUDITE - COMBAT", True, (255, 255, 255))
         screen.blit(title, (20, 20))
 
-        party_text = self.small_font.render("ALLIED FORCES:", True, (100, 255, 100))
+        party_text = text_cache.render(self.small_font, "ALLIED FORCES:", True, (100, 255, 100))
         screen.blit(party_text, (20, y_offset))
         y_offset += 30
 
@@ -139,12 +142,11 @@ class CombatState(GameState):
             text = f"{player.name}: {player.hp}/{player.max_hp} HP"
             if hasattr(player, 'job'):
                 text += f" ({player.job})"
-            rendered = self.small_font.render(text, True, color)
-            screen.blit(rendered, (40, y_offset))
+            get_bitmap_font(self.small_font, color).draw(screen, text, (40, y_offset))
             y_offset += 25
 
         y_offset += 20
-        enemy_text = self.small_font.render("GERMAN FORCES:", True, (255, 100, 100))
+        enemy_text = text_cache.render(self.small_font, "GERMAN FORCES:", True, (255, 100, 100))
         screen.blit(enemy_text, (20, y_offset))
         y_offset += 30
 
@@ -156,38 +158,38 @@ class CombatState(GameState):
                     color = (255, 255, 0)
 
             text = f"{enemy.name}: {enemy.hp}/{enemy.max_hp} HP"
-            rendered = self.small_font.render(text, True, color)
-            screen.blit(rendered, (40, y_offset))
+            get_bitmap_font(self.small_font, color).draw(screen, text, (40, y_offset))
             y_offset += 25
 
         if self.turn_order:
             current_actor = self.turn_order[self.current_turn]
             turn_text = f"Current Turn: {current_actor.name}"
-            rendered = self.small_font.render(turn_text, True, (255, 255, 100))
+            rendered = text_cache.render(self.small_font, turn_text, True, (255, 255, 100))
             screen.blit(rendered, (400, 100))
 
         if not self.game_over and self.turn_order and self.turn_order[self.current_turn] in self.party:
             if not self.in_target_selection:
-                menu_text = self.small_font.render("Choose Action:", True, (255, 255, 255))
+                menu_text = text_cache.render(self.small_font, "Choose Action:", True, (255, 255, 255))
                 screen.blit(menu_text, (400, 150))
 
                 for i, option in enumerate(self.menu_options):
                     color = (255, 255, 0) if i == self.selected_option else (255, 255, 255)
-                    text = self.small_font.render(f"→ {option}" if i == self.selected_option else f"  {option}", True, color)
+                    text = text_cache.render(self.small_font, f"→ {option}" if i == self.selected_option else f"  {option}", True, color)
                     screen.blit(text, (420, 180 + i * 25))
             else:
-                target_text = self.small_font.render("Select Target:", True, (255, 255, 255))
+                target_text = text_cache.render(self.small_font, "Select Target:", True, (255, 255, 255))
                 screen.blit(target_text, (400, 150))
 
-        log_title = self.small_font.render("Combat Log:", True, (255, 255, 255))
+        log_title = text_cache.render(self.small_font, "Combat Log:", True, (255, 255, 255))
         screen.blit(log_title, (400, 300))
 
+        # Log lines scroll every action - draw them from the glyph atlas
+        log_font = get_bitmap_font(self.small_font, (200, 200, 200))
         for i, message in enumerate(self.message_log[-self.max_messages:]):
-            text = self.small_font.render(message, True, (200, 200, 200))
-            screen.blit(text, (400, 330 + i * 20))
+            log_font.draw(screen, message, (400, 330 + i * 20))
 
         if self.game_over:
             game_over_text = "VICTORY!" if self.victory else "DEFEAT!"
             color = (100, 255, 100) if self.victory else (255, 100, 100)
-            rendered = self.font.render(game_over_text, True, color)
+            rendered = text_cache.render(self.font, game_over_text, True, color)
             screen.blit(rendered, (400, 500))
\ No newline at end of file
@@ -1,7 +1,17 @@
 import pygame
+import sys
 import os
 from .game_state import GameState
 from ..ui.quit_overlay import QuitOverlay
+from ..ui.text_cache import text_cache
+from ..ui.font_registry import get_font
+from ..rendering.static_layer import StaticLayer
+
+# Add the project root to the path to import assets
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+sys.path.insert(0, project_root)
+
+from assets.sprites.surface_optimizer import optimize_surface
 
 class DoorState(GameState):
     def __init__(self, screen):
@@ -15,6 +25,16 @@ class DoorState(GameState):
         # Quit overlay
         self.quit_overlay = QuitOverlay()
 
+        # HUD fonts - shared via the font registry, text is rendered through the shared text cache
+        self.instruction_font = get_font(36)
+
+        # Background with the instructions - composed once, drawn as one blit
+        self.background_layer = StaticLayer((self.screen_width, self.screen_height), transparent=False)
+        self.background_layer.add(self.draw_background_layer)
+
+        # Dirty-rect mode: areas changed since the last render (None = whole screen)
+        self.dirty_rects = None
+
         print("Door close-up view - Press ESC to go back, ENTER to interact with door")
 
     def load_door_background(self):
@@ -28,6 +48,7 @@ class DoorState(GameState):
                 background = pygame.image.load(door_path)
                 # Scale to fit screen
                 background = pygame.transform.scale(background, (self.screen_width, self.screen_height))
+                background = optimize_surface(background)
                 print(f"Loaded door background from: {door_path}")
                 return background
             else:
@@ -95,6 +116,10 @@ class DoorState(GameState):
         # Handle quit overlay input first if it's visible
         if self.quit_overlay.is_visible():
             result = self.quit_overlay.handle_input(event)
+            if result == "resume":
+                self.mark_dirty()  # Overlay closed - whole screen changes
+            elif event.type == pygame.KEYDOWN:
+                self.mark_dirty(self.quit_overlay.get_panel_rect(self.screen_width, self.screen_height))
             if result == "quit":
                 # Signal the game to quit
                 pygame.event.post(pygame.event.Event(pygame.QUIT))
@@ -109,6 +134,7 @@ class DoorState(GameState):
             if event.key == pygame.K_ESCAPE:
                 # Show quit overlay
                 self.quit_overlay.show()
+                self.mark_dirty()
             elif event.key == pygame.K_RETURN:
                 # Enter the door (go to puzzle)
                 return "puzzle"
@@ -125,12 +151,12 @@ class DoorState(GameState):
         # Nothing to update for static door view
         pass
 
-    def render(self, screen):
+    def draw_background_layer(self, surface):
+        """Draw the background and everything fixed on top of it"""
         # Draw background
-        screen.blit(self.background, (0, 0))
+        surface.blit(self.background, (0, 0))
 
         # Draw instructions
-        font = pygame.font.Font(None, 36)
         instructions = [
             "Door Close-up View",
             "",
@@ -142,20 +168,27 @@ class DoorState(GameState):
         y_offset = 50
         for instruction in instructions:
             if instruction:  # Skip empty strings
-                text = font.render(instruction, True, (255, 255, 255))
+                text = text_cache.render(self.instruction_font, instruction, True, (255, 255, 255))
                 text_rect = text.get_rect()
                 text_rect.topleft = (50, y_offset)
 
                 # Draw text background
                 bg_rect = text_rect.inflate(20, 10)
-                pygame.draw.rect(screen, (0, 0, 0, 180), bg_rect)
-                screen.blit(text, text_rect)
+                pygame.draw.rect(surface, (0, 0, 0, 180), bg_rect)
+                surface.blit(text, text_rect)
 
             y_offset += 45
 
+    def render(self, screen):
+        # Draw background and labels
+        self.background_layer.draw(screen)
+
         # Draw quit overlay on top of everything
         self.quit_overlay.render(screen)
 
+        # Everything is up to date until the next input
+        self.dirty_rects = []
+
     def cleanup(self):
         """Clean up resources when door state is destroyed"""
         pass
\ No newline at end of file
@@ -7,16 +7,22 @@ import os
 import sys
 from .game_state import GameState
 from ..ui.quit_overlay import QuitOverlay
-from ..effects.weather_system import WeatherSystem
+from ..rendering.compositor import compositor
+from ..ui.text_cache import text_cache
+from ..ui.font_registry import get_font
+from ..effects.weather_system import WeatherSystem, WeatherSceneConfig
+from ..effects.spawn_region import SpawnRegion
+from ..rendering.static_layer import StaticLayer
 
 # Add the project root to the path to import assets
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 sys.path.insert(0, project_root)
 
 from assets.sprites.protagonist import create_protagonist_animation_system
+from assets.sprites.surface_optimizer import optimize_surface
 
 class DragonteethState(GameState):
-    def __init__(self, screen, audio_manager=None):
+    def __init__(self, screen, audio_manager=None, weather=None):
         import time
         print(f"[{time.time():.2f}] DragonteethState __init__ started")
 
@@ -98,15 +104,21 @@ class DragonteethState(GameState):
         self.speech_active = False
         self.speech_text = "I should probably seek shelter from the storm"
 
-        # Create weather system (same rain and thunder as other scenes)
-        self.weather = WeatherSystem(self.screen_width, self.screen_height)
-
-        # Customize puddle spawning for scene 4 - only in bottom 80%
-        self.setup_scene4_puddles()
+        # Join the game's storm (same rain and thunder as other scenes) - standalone scenes make their own
+        self.weather = weather if weather else WeatherSystem(self.screen_width, self.screen_height)
+        self.weather.set_scene("dragonteeth", self.create_weather_scene)
 
         # Quit overlay
         self.quit_overlay = QuitOverlay()
 
+        # HUD fonts - shared via the font registry, text is rendered through the shared text cache
+        self.scene_font = get_font(36)
+        self.speech_font = get_font(24)
+
+        # Scene number - composed once, drawn as one blit
+        self.hud_layer = StaticLayer((self.screen_width, self.screen_height))
+        self.hud_layer.add(self.draw_hud_labels)
+
         # Transition system
         self.fade_in = True
         self.fade_timer = 0.0
@@ -139,6 +151,7 @@ class DragonteethState(GameState):
                 background = pygame.image.load(bg_path)
                 print(f"[{time.time():.2f}] Scaling dragonteeth.png...")
                 background = pygame.transform.scale(background, (self.screen_width, self.screen_height))
+                background = optimize_surface(background)
                 print(f"[{time.time():.2f}] Dragonteeth.png loaded and scaled")
                 return background
             else:
@@ -165,6 +178,13 @@ class DragonteethState(GameState):
 
         return background
 
+    def create_weather_scene(self):
+        """Puddles only in the bottom 80% of scene 4 (built once per game)"""
+        puddle_start_y = int(self.screen_height * 0.2)
+        puddle_region = SpawnRegion(self.screen_width, self.screen_height)
+        puddle_region.add_rect((100, puddle_start_y, self.screen_width - 200, self.screen_height - 30 - puddle_start_y))
+        return WeatherSceneConfig(puddle_region=puddle_region)
+
     def check_return_collision(self):
         """Check if protagonist hits the return collision box to go back to scene 3"""
         if self.fade_out:
@@ -221,53 +241,6 @@ class DragonteethState(GameState):
         else:
             self.near_bottom_collision = False
 
-    def setup_scene4_puddles(self):
-        """Setup puddles for scene 4 - only in bottom 80% of screen"""
-        import random
-
-        # Clear existing puddles
-        self.weather.puddles = []
-
-        # Calculate bottom 80% area
-        puddle_start_y = self.screen_height * 0.2  # Start at 20% from top = bottom 80%
-        puddle_end_y = self.screen_height - 30
-
-        # Create initial puddles in bottom 80%
-        initial_puddle_count = random.randint(8, 12)
-        for _ in range(initial_puddle_count):
-            x = random.uniform(100, self.screen_width - 100)
-            y = random.uniform(puddle_start_y, puddle_end_y)
-            max_size = random.uniform(20, 40)
-
-            # Create puddle
-            from ..effects.weather_system import Puddle
-            puddle = Puddle(x, y, max_size)
-
-            # Make initial puddles various sizes (some fully grown, some growing)
-            growth_progress = random.uniform(0.3, 1.0)
-            puddle.size = puddle.max_size * growth_progress
-
-            self.weather.puddles.append(puddle)
-
-        # Override the weather system's puddle spawning method for scene 4
-        original_spawn_puddle = self.weather.spawn_puddle
-        def scene4_spawn_puddle():
-            x = random.uniform(100, self.screen_width - 100)
-            y = random.uniform(puddle_start_y, puddle_end_y)  # Bottom 80% only
-            max_size = random.uniform(15, 35)
-            return Puddle(x, y, max_size)
-
-        self.weather.spawn_puddle = scene4_spawn_puddle
-
-        # Override the try_add_to_puddle method to restrict to bottom 80%
-        original_try_add_to_puddle = self.weather.try_add_to_puddle
-        def scene4_try_add_to_puddle(x, y):
-            # Only allow puddle creation in bottom 80%
-            if y >= puddle_start_y:
-                original_try_add_to_puddle(x, y)
-
-        self.weather.try_add_to_puddle = scene4_try_add_to_puddle
-
     def calculate_current_scale(self):
         """Calculate protagonist scale based on vertical position"""
         # Calculate position ratio from top to bottom of movement area
@@ -287,8 +260,8 @@ class DragonteethState(GameState):
 
     def render_speech_bubble(self, screen):
         """Render speech bubble above protagonist"""
-        # Create font for speech text
-        font = pygame.font.Font(None, 24)
+        # Font for speech text
+        font = self.speech_font
 
         # Prepare text (split into multiple lines if needed)
         words = self.speech_text.split()
@@ -339,7 +312,7 @@ class DragonteethState(GameState):
 
         # Draw text lines
         for i, line in enumerate(lines):
-            text_surface = font.render(line, True, (0, 0, 0))
+            text_surface = text_cache.render(self.speech_font, line, True, (0, 0, 0))
             text_x = bubble_x + 10
             text_y = bubble_y + 10 + i * line_height
             screen.blit(text_surface, (text_x, text_y))
@@ -471,6 +444,18 @@ class DragonteethState(GameState):
 
         return None
 
+    def draw_hud_labels(self, surface):
+        """Draw the scene labels that never change"""
+        # Draw scene number
+        scene_text = text_cache.render(self.scene_font, "SCENE 4", True, (255, 255, 255))
+        scene_rect = scene_text.get_rect()
+        scene_rect.topright = (self.screen_width - 20, 20)
+
+        # Draw scene background
+        scene_bg_rect = scene_rect.inflate(10, 5)
+        pygame.draw.rect(surface, (0, 0, 0, 180), scene_bg_rect)
+        surface.blit(scene_text, scene_rect)
+
     def render(self, screen):
         import time
         render_start = time.time()
@@ -491,16 +476,8 @@ class DragonteethState(GameState):
         # Draw weather effects (rain and lightning over everything)
         self.weather.draw(screen)
 
-        # Draw scene number
-        scene_font = pygame.font.Font(None, 36)
-        scene_text = scene_font.render("SCENE 4", True, (255, 255, 255))
-        scene_rect = scene_text.get_rect()
-        scene_rect.topright = (self.screen_width - 20, 20)
-
-        # Draw scene background
-        scene_bg_rect = scene_rect.inflate(10, 5)
-        pygame.draw.rect(screen, (0, 0, 0, 180), scene_bg_rect)
-        screen.blit(scene_text, scene_rect)
+        # Draw labels
+        self.hud_layer.draw(screen)
 
         # Draw speech bubble if active
         if self.speech_active:
@@ -512,10 +489,7 @@ class DragonteethState(GameState):
 
         # Draw fade transition
         if self.fade_in or self.fade_out:
-            fade_surface = pygame.Surface((self.screen_width, self.screen_height))
-            fade_surface.set_alpha(self.fade_alpha)
-            fade_surface.fill((0, 0, 0))
-            screen.blit(fade_surface, (0, 0))
+            compositor.fade(screen, self.fade_alpha)
 
         render_time = time.time() - render_start
         if render_time > 0.01:  # Only log if render takes more than 10ms
@@ -6,10 +6,18 @@ from .game_state import GameState
 from ..ui.speech_bubble import SpeechBubble, InteractionPrompt
 from ..ui.action_indicator import ActionIndicator
 from ..ui.quit_overlay import QuitOverlay
+from ..ui.text_cache import text_cache
+from ..ui.font_registry import get_font
 from ..effects.light_effect import LightManager
-from ..effects.weather_system import WeatherSystem
+from ..effects.glow_cache import glow_cache
+from ..effects.weather_system import WeatherSystem, WeatherSceneConfig
+from ..effects.spawn_region import create_walkable_region
+from ..effects.sky_map import SkyMap
 from ..audio.audio_manager import AudioManager
+from ..rendering.render_queue import RenderQueue, LAYER_ACTORS, LAYER_PROJECTILES
+from ..rendering.compositor import compositor
 from ..objects.animated_rock import AnimatedRock
+from ..rendering.static_layer import StaticLayer
 
 # Add the project root to the path to import assets
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
@@ -20,10 +28,10 @@ from assets.backgrounds.image_loader import load_concept_art_background, blend_c
 from assets.backgrounds.collision_map import create_maginot_collision_map
 from assets.backgrounds.image_collision_detector import create_smart_collision_map
 from assets.sprites.protagonist import create_protagonist_animation_system
-from assets.sprites.bullet import Bullet, get_direction_from_keys
+from assets.sprites.bullet import BulletPool, get_direction_from_keys
 
 class FieldState(GameState):
-    def __init__(self, screen, audio_manager=None):
+    def __init__(self, screen, audio_manager=None, weather=None):
         self.screen = screen
         self.screen_width = screen.get_width()
         self.screen_height = screen.get_height()
@@ -82,11 +90,14 @@ class FieldState(GameState):
         self.is_moving = False
         self.last_facing_direction = 'down'  # Start facing down (towards player)
 
-        # Shooting
-        self.bullets = []
+        # Shooting - bullets come from a preallocated pool
+        self.bullets = BulletPool()
         self.shoot_cooldown = 0.0
         self.shoot_delay = 0.2  # seconds between shots
 
+        # Depth-sorted drawing of protagonist, props and bullets
+        self.render_queue = RenderQueue()
+
         # Door interaction with multi-stage workflow
         self.action_indicator = ActionIndicator(0, 0)
         self.interaction_prompt = InteractionPrompt()
@@ -103,6 +114,15 @@ class FieldState(GameState):
         # Quit overlay
         self.quit_overlay = QuitOverlay()
 
+        # HUD fonts - shared via the font registry, text is rendered through the shared text cache
+        self.scene_font = get_font(36)
+        self.location_font = get_font(24)
+        self.hint_font = get_font(28)
+
+        # Scene number and location label - composed once, drawn as one blit
+        self.hud_layer = StaticLayer((self.screen_width, self.screen_height))
+        self.hud_layer.add(self.draw_hud_labels)
+
         # Flash interaction - lower half, left side
         self.flash_x = 195  # Left side of screen
         self.flash_y = 595  # Lower half
@@ -170,8 +190,9 @@ class FieldState(GameState):
         tower_window_y = self.door_y - 150  # Above the door
         self.light_manager.add_light(tower_window_x, tower_window_y, radius=6, color=(255, 220, 120))
 
-        # Create weather system
-        self.weather = WeatherSystem(self.screen_width, self.screen_height)
+        # Join the game's storm (rain and lightning carry on between scenes) - standalone scenes make their own
+        self.weather = weather if weather else WeatherSystem(self.screen_width, self.screen_height)
+        self.weather.set_scene("field", self.create_weather_scene)
 
         # Use shared audio manager or create new one
         if audio_manager:
@@ -530,6 +551,23 @@ class FieldState(GameState):
         else:
             self.near_collision_box_blue = False
 
+    def create_weather_scene(self):
+        """Puddles on the walkable ground below the door, rain stopped by the bunker roof (built once per game)"""
+        return WeatherSceneConfig(
+            puddle_region=create_walkable_region(
+                self.collision_map, pygame.Rect(100, self.door_y, self.screen_width - 200, self.screen_height - 30 - self.door_y)),
+            sky_map=self.create_sky_map())
+
+    def create_sky_map(self):
+        """Rain stops on the bunker roof (roof line traced from the concept art)"""
+        sky_map = SkyMap(self.screen_width, self.screen_height)
+        sky_map.add_silhouette([
+            (388, 520), (395, 480), (410, 465), (440, 448), (470, 442),  # Left roof
+            (495, 415), (505, 398), (527, 387), (550, 398), (562, 417),  # Dome
+            (580, 445), (600, 460), (612, 480), (618, 520),              # Right roof
+        ])
+        return sky_map
+
     def handle_event(self, event):
         # Handle quit overlay input first if it's visible
         if self.quit_overlay.is_visible():
@@ -667,15 +705,11 @@ class FieldState(GameState):
 
             bullet_x = self.protagonist_x + gun_x_offset
             bullet_y = self.protagonist_y + gun_y_offset
-            bullet = Bullet(bullet_x, bullet_y, direction_x, direction_y)
-            self.bullets.append(bullet)
+            self.bullets.fire(bullet_x, bullet_y, direction_x, direction_y)
             self.shoot_cooldown = self.shoot_delay
 
         # Update bullets
-        for bullet in self.bullets[:]:  # Use slice copy to avoid modification during iteration
-            bullet.update(dt)
-            if bullet.is_off_screen(self.screen_width, self.screen_height):
-                self.bullets.remove(bullet)
+        self.bullets.update(dt, self.screen_width, self.screen_height)
 
         # Handle animation based on movement
         if self.is_moving and movement_direction:
@@ -769,7 +803,7 @@ class FieldState(GameState):
             self.check_collision_boxes()
 
         # Update animated rock
-        self.animated_rock.update(dt)
+        self.animated_rock.update(dt, self.weather.wind)
 
         # Handle fade-in transition
         if self.fade_in:
@@ -783,6 +817,28 @@ class FieldState(GameState):
                 self.fade_in = False
                 self.fade_alpha = 0
 
+    def draw_hud_labels(self, surface):
+        """Draw the scene labels that never change"""
+        # Draw scene number
+        scene_text = text_cache.render(self.scene_font, "SCENE 2", True, (255, 255, 255))
+        scene_rect = scene_text.get_rect()
+        scene_rect.topright = (self.screen_width - 20, 20)
+
+        # Draw scene background
+        scene_bg_rect = scene_rect.inflate(10, 5)
+        pygame.draw.rect(surface, (0, 0, 0, 180), scene_bg_rect)
+        surface.blit(scene_text, scene_rect)
+
+        # Optional: Draw a simple UI element showing location
+        location_text = text_cache.render(self.location_font, "Outside the Maginot Line - SCENE 2", True, (255, 255, 255))
+        text_rect = location_text.get_rect()
+        text_rect.topleft = (10, 10)
+
+        # Draw text background
+        bg_rect = text_rect.inflate(10, 5)
+        pygame.draw.rect(surface, (0, 0, 0, 128), bg_rect)
+        surface.blit(location_text, text_rect)
+
     def render(self, screen):
         # Draw background
         screen.blit(self.background, (0, 0))
@@ -790,9 +846,8 @@ class FieldState(GameState):
         # Draw lighting effects
         self.light_manager.draw(screen)
 
-        # Draw bullets
-        for bullet in self.bullets:
-            bullet.render(screen)
+        # Queue bullets (drawn with the protagonist and props below)
+        self.bullets.submit(self.render_queue, LAYER_PROJECTILES)
 
         # Draw realistic flickering light effect (more visible and sharper)
         if not self.flash_discovered and self.current_flicker_intensity > 0.02:  # Lower threshold for visibility
@@ -820,28 +875,16 @@ class FieldState(GameState):
                 {'radius': max_radius * 0.2, 'color': core_color, 'alpha_mult': 1.0}    # Full intensity center
             ]
 
+            # Layered glows from the shared cache, added in one blits() call
+            glow_blits = []
             for layer in layers:
-                radius = int(layer['radius'] * intensity)
+                radius = layer['radius'] * intensity
                 if radius > 1:  # Lower minimum radius
-                    alpha = int(255 * intensity * layer['alpha_mult'])
-                    alpha = min(255, max(0, alpha))
-
-                    # Create surface for proper alpha blending
-                    light_surface = pygame.Surface((radius * 4, radius * 4))
-                    light_surface.set_colorkey((0, 0, 0))  # Make black transparent
-                    light_surface.set_alpha(alpha)
-
-                    # Draw sharper gradient circle for more defined light
-                    for i in range(radius, 0, -2):  # Step by 2 for sharper edges
-                        circle_alpha = int((i / radius) * 255)
-                        falloff = (i / radius) ** 0.7  # Sharper falloff curve
-                        color_with_alpha = tuple(int(c * falloff) for c in layer['color'])
-                        pygame.draw.circle(light_surface, color_with_alpha,
-                                         (radius * 2, radius * 2), i)
-
-                    # Blit to screen
-                    screen.blit(light_surface,
-                              (self.flash_x - radius * 2, self.flash_y - radius * 2))
+                    glow_blit = glow_cache.get_blit(self.flash_x, self.flash_y, radius, layer['color'],
+                                                    falloff=0.7, brightness=intensity * layer['alpha_mult'])
+                    if glow_blit:
+                        glow_blits.append(glow_blit)
+            screen.blits(glow_blits, doreturn=False)
 
         # Draw protagonist (scaled down for display)
         protagonist_sprite = self.protagonist_animation.get_current_frame()
@@ -854,7 +897,13 @@ class FieldState(GameState):
                 scaled_height = int(protagonist_sprite.get_height() * self.character_display_scale)
                 protagonist_sprite = pygame.transform.scale(protagonist_sprite, (scaled_width, scaled_height))
 
-            screen.blit(protagonist_sprite, (int(self.protagonist_x), int(self.protagonist_y)))
+            self.render_queue.submit(protagonist_sprite, (int(self.protagonist_x), int(self.protagonist_y)), LAYER_ACTORS)
+
+        # Draw animated rock (queued so it sorts against the protagonist)
+        self.animated_rock.submit(self.render_queue)
+
+        # Draw everything queued this frame, sorted by depth
+        self.render_queue.flush(screen)
 
         # Draw weather effects (rain and lightning over everything)
         self.weather.draw(screen)
@@ -862,37 +911,16 @@ class FieldState(GameState):
         # Draw collision debug if enabled
         self.collision_map.render_debug(screen)
 
-        # Draw scene number
-        scene_font = pygame.font.Font(None, 36)
-        scene_text = scene_font.render("SCENE 2", True, (255, 255, 255))
-        scene_rect = scene_text.get_rect()
-        scene_rect.topright = (self.screen_width - 20, 20)
-
-        # Draw scene background
-        scene_bg_rect = scene_rect.inflate(10, 5)
-        pygame.draw.rect(screen, (0, 0, 0, 180), scene_bg_rect)
-        screen.blit(scene_text, scene_rect)
-
-        # Optional: Draw a simple UI element showing location
-        font = pygame.font.Font(None, 24)
-        location_text = font.render("Outside the Maginot Line - SCENE 2", True, (255, 255, 255))
-        text_rect = location_text.get_rect()
-        text_rect.topleft = (10, 10)
-
-        # Draw text background
-        bg_rect = text_rect.inflate(10, 5)
-        pygame.draw.rect(screen, (0, 0, 0, 128), bg_rect)
-        screen.blit(location_text, text_rect)
+        # Draw labels
+        self.hud_layer.draw(screen)
 
-        # Draw animated rock
-        self.animated_rock.render(screen)
+        # Draw rock interaction hint
         if self.near_rock:
             self.animated_rock.render_interaction_hint(screen)
 
         # Draw transition hints if near edges
         if self.near_left_transition or self.near_right_transition:
-            hint_font = pygame.font.Font(None, 28)
-            hint_text = hint_font.render("Move to edge to go behind bunker", True, (255, 255, 0))
+            hint_text = text_cache.render(self.hint_font, "Move to edge to go behind bunker", True, (255, 255, 0))
             hint_rect = hint_text.get_rect()
             hint_rect.centerx = self.screen_width // 2
             hint_rect.bottom = self.screen_height - 60
@@ -904,8 +932,7 @@ class FieldState(GameState):
 
         # Draw collision box hints (though transition is now automatic)
         if self.near_collision_box_red or self.near_collision_box_blue:
-            hint_font = pygame.font.Font(None, 28)
-            hint_text = hint_font.render("Transitioning to behind bunker...", True, (255, 255, 0))
+            hint_text = text_cache.render(self.hint_font, "Transitioning to behind bunker...", True, (255, 255, 0))
             hint_rect = hint_text.get_rect()
             hint_rect.centerx = self.screen_width // 2
             hint_rect.bottom = self.screen_height - 100
@@ -947,11 +974,7 @@ class FieldState(GameState):
 
         # Draw fade overlay if transitioning
         if (self.fade_in or self.fade_out) and self.fade_alpha > 0:
-            # Use SRCALPHA surface for smooth fade without box outlines
-            fade_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-            fade_color = (0, 0, 0, self.fade_alpha)  # Black with alpha
-            fade_surface.fill(fade_color)
-            screen.blit(fade_surface, (0, 0))
+            compositor.fade(screen, self.fade_alpha)
 
     def cleanup(self):
         """Clean up resources when field state is destroyed"""
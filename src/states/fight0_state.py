@@ -1,17 +1,24 @@
 import pygame
 import os
 import sys
-import random
 from .game_state import GameState
 from ..ui.quit_overlay import QuitOverlay
+from ..rendering.compositor import compositor
+from ..ui.text_cache import text_cache
+from ..ui.font_registry import get_font
+from ..ui.bitmap_font import get_bitmap_font
 from ..audio.audio_manager import AudioManager
+from ..rendering.static_layer import StaticLayer
+from ..effects.particles import ParticleSystem, ParticleEmitter, PARTICLE_BUDGETS
 
 # Add the project root to the path to import assets
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 sys.path.insert(0, project_root)
 
 from assets.sprites.protagonist import create_protagonist_animation_system
-from assets.sprites.rat_enemy import create_rat_animation_system
+from assets.sprites.rat_enemy import create_rat_animation_system, get_enemy_base_type, ENEMY_VARIANTS
+from assets.sprites.surface_optimizer import optimize_surface
+from assets.sprites.prop_cache import prop_cache
 
 class Fight0State(GameState):
     def __init__(self, screen, audio_manager=None):
@@ -43,8 +50,26 @@ class Fight0State(GameState):
         # Quit overlay
         self.quit_overlay = QuitOverlay()
 
+        # HUD fonts - shared via the font registry, text is rendered through the shared text cache
+        self.scene_font = get_font(36)
+        self.label_font = get_font(24)
+        self.menu_font = get_font(28)
+        self.popup_font = get_font(32)
+        self.banner_font = get_font(48)
+        self.victory_font = get_font(64)
+        self.controls_font = get_font(20)
+
+        # Background with the scene and location labels - composed once, drawn as one blit
+        self.background_layer = StaticLayer((self.screen_width, self.screen_height), transparent=False)
+        self.background_layer.add(self.draw_background_layer)
+
         # Initialize poison cloud effect
-        self.poison_cloud = {"active": False}
+        self.poison_cloud = ParticleSystem(PARTICLE_BUDGETS["poison_cloud"], [(0, 255, 100)], gravity=20)
+        self.poison_emitter = ParticleEmitter(self.poison_cloud,
+                                              area=(-30, 30, -20, 20),
+                                              velocity=((-20, 20), (-20, 20)),
+                                              lifetime=(2.0, 2.0),  # Show for 2 seconds
+                                              size=(3, 9), whole_sizes=True)
 
         # Initialize dual enemies system
         self.dual_enemies = False
@@ -62,6 +87,7 @@ class Fight0State(GameState):
             if os.path.exists(bg_path):
                 background = pygame.image.load(bg_path)
                 background = pygame.transform.scale(background, (self.screen_width, self.screen_height))
+                background = optimize_surface(background)
                 print(f"Loaded fight background from: {bg_path}")
                 return background
             else:
@@ -163,6 +189,8 @@ class Fight0State(GameState):
                 enemy_hp = 6
             elif self.enemy_type == "frog":
                 enemy_hp = 7
+            elif self.enemy_type in ENEMY_VARIANTS:
+                enemy_hp = ENEMY_VARIANTS[self.enemy_type]['hp']
             else:
                 enemy_hp = 30  # Default for rat
 
@@ -271,8 +299,8 @@ class Fight0State(GameState):
         self.stats_width = 250
         self.stats_height = 80
 
-    def create_potion_icon(self):
-        """Create a small potion bottle icon"""
+    def create_potion_icon(self, variant="normal"):
+        """Create a small potion bottle icon ('disabled' variant is greyed out)"""
         potion_surface = pygame.Surface((16, 16), pygame.SRCALPHA)
 
         # Bottle body (glass)
@@ -284,7 +312,11 @@ class Fight0State(GameState):
         # Cork
         pygame.draw.rect(potion_surface, (139, 69, 19), (7, 3, 2, 2))
 
-        return potion_surface
+        if variant == "disabled":
+            # Make icon grey
+            potion_surface.fill((128, 128, 128), special_flags=pygame.BLEND_MULT)
+
+        return optimize_surface(potion_surface)
 
     def handle_event(self, event):
         # Handle quit overlay input first if it's visible
@@ -428,8 +460,7 @@ class Fight0State(GameState):
                 self.showing_damage = False
 
         # Update poison cloud effect
-        if self.poison_cloud["active"]:
-            self.update_poison_cloud(dt)
+        self.poison_cloud.update(dt)
 
         # Update victory sequence
         if self.victory_state != "none":
@@ -650,57 +681,26 @@ class Fight0State(GameState):
 
     def hit_protagonist(self):
         """Handle protagonist being hit by enemy"""
-        # Different damage based on enemy type
-        if getattr(self, 'enemy_type', 'rat') == 'frog':
+        # Different damage based on enemy type (variants hit with their own damage)
+        enemy_type = getattr(self, 'enemy_type', 'rat')
+        variant = ENEMY_VARIANTS.get(enemy_type)
+        if get_enemy_base_type(enemy_type) == 'frog':
             # Frog deals 4 damage and creates poison cloud
-            damage = 4
+            damage = variant['damage'] if variant else 4
             self.protagonist_stats["hp"] = max(0, self.protagonist_stats["hp"] - damage)
             self.show_damage_number(f"-{damage}", "protagonist")
             self.create_poison_cloud()
         else:
             # Cockroach deals 3 damage (or default 3 for rat)
-            damage = 3
+            damage = variant['damage'] if variant else 3
             self.protagonist_stats["hp"] = max(0, self.protagonist_stats["hp"] - damage)
             self.show_damage_number(f"-{damage}", "protagonist")
 
     def create_poison_cloud(self):
         """Create a green poison cloud effect around the protagonist"""
-        # Initialize poison cloud effect
-        self.poison_cloud = {
-            "active": True,
-            "timer": 0.0,
-            "duration": 2.0,  # Show for 2 seconds
-            "particles": []
-        }
-
-        # Create poison cloud particles around protagonist
-        for i in range(15):  # 15 poison particles
-            particle = {
-                "x": self.protagonist_x + random.randint(-30, 30),
-                "y": self.protagonist_y + random.randint(-20, 20),
-                "vx": random.randint(-20, 20),
-                "vy": random.randint(-20, 20),
-                "size": random.randint(3, 8),
-                "alpha": 255
-            }
-            self.poison_cloud["particles"].append(particle)
-
-    def update_poison_cloud(self, dt):
-        """Update poison cloud particles"""
-        self.poison_cloud["timer"] += dt
-
-        # Update particle positions and fade
-        for particle in self.poison_cloud["particles"]:
-            particle["x"] += particle["vx"] * dt
-            particle["y"] += particle["vy"] * dt
-            particle["vy"] += 20 * dt  # Gravity effect
-            # Fade out over time
-            fade_progress = self.poison_cloud["timer"] / self.poison_cloud["duration"]
-            particle["alpha"] = max(0, 255 * (1 - fade_progress))
-
-        # Remove poison cloud when duration expires
-        if self.poison_cloud["timer"] >= self.poison_cloud["duration"]:
-            self.poison_cloud["active"] = False
+        # 15 poison particles, faded out over 2 seconds (replaces any cloud still showing)
+        self.poison_cloud.clear()
+        self.poison_emitter.emit(15, self.protagonist_x, self.protagonist_y)
 
     def start_victory_sequence(self):
         """Start the victory sequence"""
@@ -750,31 +750,34 @@ class Fight0State(GameState):
                 self.menu_visible = True
                 self.start_rat_turn()  # Start rat's turn after healing
 
-    def render(self, screen):
+    def draw_background_layer(self, surface):
+        """Draw the background and everything fixed on top of it"""
         # Draw background
-        screen.blit(self.background, (0, 0))
+        surface.blit(self.background, (0, 0))
 
         # Draw scene number
-        scene_font = pygame.font.Font(None, 36)
-        scene_text = scene_font.render("FIGHT 0", True, (255, 255, 255))
+        scene_text = text_cache.render(self.scene_font, "FIGHT 0", True, (255, 255, 255))
         scene_rect = scene_text.get_rect()
         scene_rect.topright = (self.screen_width - 20, 20)
 
         # Draw scene background
         scene_bg_rect = scene_rect.inflate(10, 5)
-        pygame.draw.rect(screen, (0, 0, 0, 180), scene_bg_rect)
-        screen.blit(scene_text, scene_rect)
+        pygame.draw.rect(surface, (0, 0, 0, 180), scene_bg_rect)
+        surface.blit(scene_text, scene_rect)
 
         # Draw location text
-        font = pygame.font.Font(None, 24)
-        location_text = font.render("Fight Scene 0 - Battle Arena", True, (255, 255, 255))
+        location_text = text_cache.render(self.label_font, "Fight Scene 0 - Battle Arena", True, (255, 255, 255))
         text_rect = location_text.get_rect()
         text_rect.topleft = (10, 10)
 
         # Draw text background
         bg_rect = text_rect.inflate(10, 5)
-        pygame.draw.rect(screen, (0, 0, 0, 128), bg_rect)
-        screen.blit(location_text, text_rect)
+        pygame.draw.rect(surface, (0, 0, 0, 128), bg_rect)
+        surface.blit(location_text, text_rect)
+
+    def render(self, screen):
+        # Draw background and labels
+        self.background_layer.draw(screen)
 
         # Draw protagonist (repositioned to avoid menu overlap)
         protagonist_sprite = self.protagonist_animation.get_current_frame()
@@ -886,10 +889,9 @@ class Fight0State(GameState):
                     screen.blit(scaled_rat, (int(self.enemy_x), int(self.enemy_y)))
 
         # Draw character labels
-        label_font = pygame.font.Font(None, 24)
 
         # Protagonist label
-        protag_label = label_font.render("Protagonist", True, (255, 255, 255))
+        protag_label = text_cache.render(self.label_font, "Protagonist", True, (255, 255, 255))
         protag_rect = protag_label.get_rect()
         protag_rect.centerx = int(self.protagonist_x + (protagonist_sprite.get_width() * self.protagonist_scale) // 2) if protagonist_sprite else int(self.protagonist_x + 32)
         protag_rect.bottom = int(self.protagonist_y) - 5
@@ -900,7 +902,7 @@ class Fight0State(GameState):
         screen.blit(protag_label, protag_rect)
 
         # Enemy label
-        enemy_label = label_font.render("Rat Enemy", True, (255, 255, 255))
+        enemy_label = text_cache.render(self.label_font, "Rat Enemy", True, (255, 255, 255))
         enemy_rect = enemy_label.get_rect()
         if current_rat_frame and self.enemy_scale != 1.0:
             enemy_rect.centerx = int(self.enemy_x + (scaled_rat.get_width()) // 2)
@@ -918,20 +920,19 @@ class Fight0State(GameState):
         # Draw rat health counter
         health_text = f"HP: {self.rat_stats['hp']}/{self.rat_stats['max_hp']}"
         health_color = (255, 255, 255) if self.rat_stats["hp"] > 0 else (255, 100, 100)  # Red if dead
-        health_label = label_font.render(health_text, True, health_color)
-        health_rect = health_label.get_rect()
+        health_digits = get_bitmap_font(self.label_font, health_color)  # Changes every hit - drawn from the glyph atlas
+        health_rect = health_digits.get_rect(health_text)
         health_rect.centerx = enemy_rect.centerx
         health_rect.top = enemy_rect.bottom + 2  # Just below the enemy label
 
         # Draw health label background
         health_bg = health_rect.inflate(6, 2)
         pygame.draw.rect(screen, (0, 0, 0, 128), health_bg)
-        screen.blit(health_label, health_rect)
+        health_digits.draw(screen, health_text, health_rect.topleft)
 
         # Draw combat state indicator
         if self.combat_state == "attacking":
-            attack_font = pygame.font.Font(None, 36)
-            attack_text = attack_font.render("ATTACKING", True, (255, 255, 0))
+            attack_text = text_cache.render(self.scene_font, "ATTACKING", True, (255, 255, 0))
             attack_rect = attack_text.get_rect()
             attack_rect.centerx = self.screen_width // 2
             attack_rect.top = 20
@@ -952,15 +953,13 @@ class Fight0State(GameState):
 
         # Draw heal effect
         if hasattr(self, 'showing_heal') and self.showing_heal:
-            heal_font = pygame.font.Font(None, 32)
-            heal_text = heal_font.render("+50", True, (255, 255, 0))
+            heal_text = text_cache.render(self.popup_font, "+50", True, (255, 255, 0))
             heal_x = int(self.protagonist_x + 40)
             heal_y = int(self.protagonist_y - 30)
             screen.blit(heal_text, (heal_x, heal_y))
 
         # Draw damage numbers
         if self.showing_damage:
-            damage_font = pygame.font.Font(None, 32)
             if self.damage_target == "rat":
                 damage_x = int(self.enemy_x + 40)
                 damage_y = int(self.enemy_y - 30)
@@ -970,14 +969,12 @@ class Fight0State(GameState):
                 damage_y = int(self.protagonist_y - 30)
                 color = (255, 100, 100)  # Red for damage to protagonist
 
-            damage_text = damage_font.render(self.damage_text, True, color)
-            screen.blit(damage_text, (damage_x, damage_y))
+            get_bitmap_font(self.popup_font, color).draw(screen, self.damage_text, (damage_x, damage_y))
 
         # Draw rat attack banner
         if self.rat_attack_state == "banner":
-            banner_font = pygame.font.Font(None, 48)
             attack_name = getattr(self, 'enemy_attack', 'CLAWS')  # Use enemy attack name
-            banner_text = banner_font.render(attack_name, True, (255, 0, 0))
+            banner_text = text_cache.render(self.banner_font, attack_name, True, (255, 0, 0))
             banner_rect = banner_text.get_rect()
             banner_rect.centerx = self.screen_width // 2
             banner_rect.top = 80
@@ -989,8 +986,7 @@ class Fight0State(GameState):
             screen.blit(banner_text, banner_rect)
 
         # Draw poison cloud effect
-        if self.poison_cloud["active"]:
-            self.draw_poison_cloud(screen)
+        self.poison_cloud.draw(screen)
 
         # Draw fight menu (lower left corner) - only during player's turn
         if self.menu_visible and self.player_turn:
@@ -1000,18 +996,17 @@ class Fight0State(GameState):
         self.draw_stats_table(screen)
 
         # Draw controls
-        controls_font = pygame.font.Font(None, 20)
         if self.player_turn and self.menu_visible:
-            controls_text = controls_font.render("Arrow Keys: Navigate | Enter: Select | ESC: Back/Quit", True, (200, 200, 200))
+            controls_text = text_cache.render(self.controls_font, "Arrow Keys: Navigate | Enter: Select | ESC: Back/Quit", True, (200, 200, 200))
         elif not self.player_turn:
             if self.rat_attack_state == "banner":
-                controls_text = controls_font.render("Rat prepares to attack...", True, (200, 200, 200))
+                controls_text = text_cache.render(self.controls_font, "Rat prepares to attack...", True, (200, 200, 200))
             elif self.rat_attack_state in ["jumping", "attacking", "returning"]:
-                controls_text = controls_font.render("Rat is attacking!", True, (200, 200, 200))
+                controls_text = text_cache.render(self.controls_font, "Rat is attacking!", True, (200, 200, 200))
             else:
-                controls_text = controls_font.render("Rat's Turn | Press R to reset to player turn", True, (200, 200, 200))
+                controls_text = text_cache.render(self.controls_font, "Rat's Turn | Press R to reset to player turn", True, (200, 200, 200))
         else:
-            controls_text = controls_font.render("Combat in progress...", True, (200, 200, 200))
+            controls_text = text_cache.render(self.controls_font, "Combat in progress...", True, (200, 200, 200))
         controls_rect = controls_text.get_rect()
         controls_rect.bottomleft = (10, self.screen_height - 10)
         screen.blit(controls_text, controls_rect)
@@ -1019,54 +1014,30 @@ class Fight0State(GameState):
         # Draw victory text and fade
         if self.victory_state == "victory_text":
             # Victory text background
-            text_bg = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-            text_bg.fill((0, 0, 0, 150))
-            screen.blit(text_bg, (0, 0))
+            compositor.dim(screen, 150)
 
             # Victory text
-            victory_font = pygame.font.Font(None, 64)
-            victory_text = victory_font.render("VICTORY!", True, (255, 255, 0))
+            victory_text = text_cache.render(self.victory_font, "VICTORY!", True, (255, 255, 0))
             victory_rect = victory_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 - 50))
             screen.blit(victory_text, victory_rect)
 
             # Rewards text
-            reward_font = pygame.font.Font(None, 48)
-            potion_text = reward_font.render("Potion 1", True, (255, 255, 255))
+            potion_text = text_cache.render(self.banner_font, "Potion 1", True, (255, 255, 255))
             potion_rect = potion_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 20))
             screen.blit(potion_text, potion_rect)
 
-            gold_text = reward_font.render("Gold 23", True, (255, 215, 0))
+            gold_text = text_cache.render(self.banner_font, "Gold 23", True, (255, 215, 0))
             gold_rect = gold_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 70))
             screen.blit(gold_text, gold_rect)
 
         elif self.victory_state == "fading":
             # Fade to black
             fade_progress = self.victory_timer / self.fade_duration
-            fade_alpha = int(255 * fade_progress)
-            fade_surface = pygame.Surface((self.screen_width, self.screen_height))
-            fade_surface.fill((0, 0, 0))
-            fade_surface.set_alpha(fade_alpha)
-            screen.blit(fade_surface, (0, 0))
+            compositor.fade(screen, 255 * fade_progress)
 
         # Draw quit overlay
         self.quit_overlay.render(screen)
 
-    def draw_poison_cloud(self, screen):
-        """Draw the poison cloud effect"""
-        for particle in self.poison_cloud["particles"]:
-            if particle["alpha"] > 0:
-                # Create a surface for the particle with alpha
-                particle_surface = pygame.Surface((particle["size"] * 2, particle["size"] * 2), pygame.SRCALPHA)
-
-                # Draw green circle with alpha
-                green_color = (0, 255, 100, int(particle["alpha"]))
-                pygame.draw.circle(particle_surface, green_color,
-                                 (particle["size"], particle["size"]),
-                                 particle["size"])
-
-                # Blit to screen
-                screen.blit(particle_surface, (particle["x"] - particle["size"], particle["y"] - particle["size"]))
-
     def draw_fight_menu(self, screen):
         """Draw the fight menu in lower left corner"""
         # Menu background (semi-transparent)
@@ -1075,7 +1046,6 @@ class Fight0State(GameState):
         pygame.draw.rect(menu_surface, (255, 255, 255), (0, 0, self.menu_width, self.menu_height), 2)
         screen.blit(menu_surface, (self.menu_x, self.menu_y))
 
-        font = pygame.font.Font(None, 28)
 
         if not self.in_submenu:
             # Draw main menu
@@ -1098,12 +1068,11 @@ class Fight0State(GameState):
                         (self.menu_x + 18, y_pos + 14)
                     ])
 
-                text = font.render(item["text"], True, color)
+                text = text_cache.render(self.menu_font, item["text"], True, color)
                 screen.blit(text, (self.menu_x + 30, y_pos))
         else:
             # Draw item submenu
-            title_font = pygame.font.Font(None, 24)
-            title_text = title_font.render("Items:", True, (255, 255, 255))
+            title_text = text_cache.render(self.label_font, "Items:", True, (255, 255, 255))
             screen.blit(title_text, (self.menu_x + 10, self.menu_y + 10))
 
             for i, item in enumerate(self.item_submenu):
@@ -1121,14 +1090,8 @@ class Fight0State(GameState):
                     ])
 
                 # Draw potion icon (greyed out if not available)
-                potion_icon = self.create_potion_icon()
-                if not available:
-                    # Make icon grey
-                    grey_icon = potion_icon.copy()
-                    grey_icon.fill((128, 128, 128), special_flags=pygame.BLEND_MULT)
-                    screen.blit(grey_icon, (self.menu_x + 25, y_pos + 2))
-                else:
-                    screen.blit(potion_icon, (self.menu_x + 25, y_pos + 2))
+                potion_icon = prop_cache.get("potion", self.create_potion_icon, "normal" if available else "disabled")
+                screen.blit(potion_icon, (self.menu_x + 25, y_pos + 2))
 
                 # Item text (grey if not available)
                 if not available:
@@ -1138,7 +1101,7 @@ class Fight0State(GameState):
                 else:
                     color = (255, 255, 255)  # White
 
-                text = font.render(item["text"], True, color)
+                text = text_cache.render(self.menu_font, item["text"], True, color)
                 screen.blit(text, (self.menu_x + 45, y_pos))
 
     def draw_stats_table(self, screen):
@@ -1149,14 +1112,13 @@ class Fight0State(GameState):
         pygame.draw.rect(table_surface, (255, 255, 255), (0, 0, self.stats_width, self.stats_height), 1)
         screen.blit(table_surface, (self.stats_x, self.stats_y))
 
-        font = pygame.font.Font(None, 24)
 
         # Header row
         headers = ["Name", "HP", "MP", "Anger"]
         col_width = self.stats_width // 4
 
         for i, header in enumerate(headers):
-            text = font.render(header, True, (255, 255, 255))
+            text = text_cache.render(self.label_font, header, True, (255, 255, 255))
             x_pos = self.stats_x + (i * col_width) + 5
             screen.blit(text, (x_pos, self.stats_y + 5))
 
@@ -1165,16 +1127,13 @@ class Fight0State(GameState):
         y_pos = self.stats_y + 30
 
         # Name
-        name_text = font.render(stats["name"], True, (255, 255, 255))
+        name_text = text_cache.render(self.label_font, stats["name"], True, (255, 255, 255))
         screen.blit(name_text, (self.stats_x + 5, y_pos))
 
-        # HP
-        hp_text = font.render(str(stats["hp"]), True, (255, 255, 255))
-        screen.blit(hp_text, (self.stats_x + col_width + 5, y_pos))
-
-        # MP
-        mp_text = font.render(str(stats["mp"]), True, (255, 255, 255))
-        screen.blit(mp_text, (self.stats_x + (2 * col_width) + 5, y_pos))
+        # HP and MP change during the fight - draw them from the glyph atlas
+        digits = get_bitmap_font(self.label_font, (255, 255, 255))
+        digits.draw(screen, str(stats["hp"]), (self.stats_x + col_width + 5, y_pos))
+        digits.draw(screen, str(stats["mp"]), (self.stats_x + (2 * col_width) + 5, y_pos))
 
         # Anger bar
         anger_x = self.stats_x + (3 * col_width) + 5
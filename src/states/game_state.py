@@ -1,3 +1,4 @@
+import pygame
 from abc import ABC, abstractmethod
 
 class GameState(ABC):
@@ -13,6 +14,24 @@ class GameState(ABC):
     def render(self, screen):
         pass
 
+    def get_dirty_rects(self):
+        """
+        Screen areas the next render() will change (used by the opt-in dirty-rect mode)
+
+        Returns None when anything may change (the default for animated scenes),
+        an empty list when nothing changed, or a list of pygame.Rect.
+        States that track this set self.dirty_rects = [] at the end of render().
+        """
+        return getattr(self, 'dirty_rects', None)
+
+    def mark_dirty(self, rect=None):
+        """Flag an area (or the whole screen, with no rect) to be redrawn in dirty-rect mode"""
+        dirty_rects = getattr(self, 'dirty_rects', None)
+        if rect is None or dirty_rects is None:
+            self.dirty_rects = None
+        else:
+            dirty_rects.append(pygame.Rect(rect))
+
 class GameStateManager:
     def __init__(self):
         self.states = []
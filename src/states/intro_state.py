@@ -3,8 +3,13 @@ import sys
 import os
 from .game_state import GameState
 from ..audio.audio_manager import AudioManager
-from ..effects.weather_system import WeatherSystem
+from ..effects.weather_system import WeatherSystem, WeatherSceneConfig
+from ..effects.spawn_region import create_walkable_region
 from ..ui.quit_overlay import QuitOverlay
+from ..rendering.compositor import compositor
+from ..ui.text_cache import text_cache
+from ..ui.font_registry import get_font
+from ..rendering.static_layer import StaticLayer
 
 # Add the project root to the path to import assets
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
@@ -12,9 +17,10 @@ sys.path.insert(0, project_root)
 
 from assets.sprites.protagonist import create_protagonist_animation_system
 from assets.backgrounds.collision_map import CollisionMap
+from assets.sprites.surface_optimizer import optimize_surface
 
 class IntroState(GameState):
-    def __init__(self, screen, audio_manager=None):
+    def __init__(self, screen, audio_manager=None, weather=None):
         self.screen = screen
         self.screen_width = screen.get_width()
         self.screen_height = screen.get_height()
@@ -99,12 +105,21 @@ class IntroState(GameState):
             self.audio.play_ambient("forest_rain", loop=True, fade_in_ms=3000)
             self.audio.play_music("forest_rain_music", loop=True, fade_in_ms=3000)
 
-        # Create weather system
-        self.weather = WeatherSystem(self.screen_width, self.screen_height)
+        # Join the game's storm (rain and lightning carry on between scenes) - standalone scenes make their own
+        self.weather = weather if weather else WeatherSystem(self.screen_width, self.screen_height)
+        self.weather.set_scene("intro", self.create_weather_scene)
 
         # Quit overlay
         self.quit_overlay = QuitOverlay()
 
+        # HUD fonts - shared via the font registry, text is rendered through the shared text cache
+        self.scene_font = get_font(36)
+        self.instruction_font = get_font(24)
+
+        # Scene number and instructions - composed once, drawn as one blit
+        self.hud_layer = StaticLayer((self.screen_width, self.screen_height))
+        self.hud_layer.add(self.draw_hud_labels)
+
         print("Intro state initialized - Walk north to reach the Maginot Line!")
         print(f"Exit area at: ({self.exit_x}, {self.exit_y}) - {self.exit_width}x{self.exit_height}")
 
@@ -117,6 +132,7 @@ class IntroState(GameState):
             if os.path.exists(bg_path):
                 background = pygame.image.load(bg_path)
                 background = pygame.transform.scale(background, (self.screen_width, self.screen_height))
+                background = optimize_surface(background)
                 print(f"Loaded forest path background from: {bg_path}")
                 return background
             else:
@@ -200,6 +216,10 @@ class IntroState(GameState):
 
         return collision_map
 
+    def create_weather_scene(self):
+        """Puddles only on the path (built once per game)"""
+        return WeatherSceneConfig(puddle_region=create_walkable_region(self.collision_map))
+
     def calculate_perspective_scale(self):
         """Calculate perspective scaling based on protagonist position"""
         # Get position relative to screen
@@ -361,6 +381,30 @@ class IntroState(GameState):
 
         return None
 
+    def draw_hud_labels(self, surface):
+        """Draw the scene labels that never change"""
+        # Draw scene number
+        scene_text = text_cache.render(self.scene_font, "SCENE 1", True, (255, 255, 255))
+        scene_rect = scene_text.get_rect()
+        scene_rect.topright = (self.screen_width - 20, 20)
+
+        # Draw scene background
+        scene_bg_rect = scene_rect.inflate(10, 5)
+        pygame.draw.rect(surface, (0, 0, 0, 180), scene_bg_rect)
+        surface.blit(scene_text, scene_rect)
+
+        # Draw instructions
+        instructions = "Walk north to Maginot Line • SPACE Toggle audio • C Debug • ESC Quit"
+
+        instruction_text = text_cache.render(self.instruction_font, instructions, True, (255, 255, 255))
+        instruction_rect = instruction_text.get_rect()
+        instruction_rect.center = (self.screen_width // 2, 30)
+
+        # Draw instruction background
+        bg_rect = instruction_rect.inflate(20, 10)
+        pygame.draw.rect(surface, (0, 0, 0, 180), bg_rect)
+        surface.blit(instruction_text, instruction_rect)
+
     def render(self, screen):
         # Draw background
         screen.blit(self.background, (0, 0))
@@ -385,37 +429,12 @@ class IntroState(GameState):
         # No story text in scene 1 - moved to scene 0
 
 
-        # Draw scene number
-        scene_font = pygame.font.Font(None, 36)
-        scene_text = scene_font.render("SCENE 1", True, (255, 255, 255))
-        scene_rect = scene_text.get_rect()
-        scene_rect.topright = (self.screen_width - 20, 20)
-
-        # Draw scene background
-        scene_bg_rect = scene_rect.inflate(10, 5)
-        pygame.draw.rect(screen, (0, 0, 0, 180), scene_bg_rect)
-        screen.blit(scene_text, scene_rect)
-
-        # Draw instructions
-        instructions = "Walk north to Maginot Line • SPACE Toggle audio • C Debug • ESC Quit"
-
-        instruction_font = pygame.font.Font(None, 24)
-        instruction_text = instruction_font.render(instructions, True, (255, 255, 255))
-        instruction_rect = instruction_text.get_rect()
-        instruction_rect.center = (self.screen_width // 2, 30)
-
-        # Draw instruction background
-        bg_rect = instruction_rect.inflate(20, 10)
-        pygame.draw.rect(screen, (0, 0, 0, 180), bg_rect)
-        screen.blit(instruction_text, instruction_rect)
+        # Draw labels
+        self.hud_layer.draw(screen)
 
         # Draw fade overlay if transitioning
         if self.fade_transition and self.fade_alpha > 0:
-            # Use SRCALPHA surface for smooth fade without box outlines
-            fade_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-            fade_color = (0, 0, 0, self.fade_alpha)  # Black with alpha
-            fade_surface.fill(fade_color)
-            screen.blit(fade_surface, (0, 0))
+            compositor.fade(screen, self.fade_alpha)
 
         # Draw quit overlay on top of everything
         self.quit_overlay.render(screen)
@@ -1,6 +1,16 @@
 import pygame
+import sys
 import os
 from .game_state import GameState
+from ..ui.font_registry import get_font
+from ..rendering.compositor import compositor
+from ..rendering.static_layer import StaticLayer
+
+# Add the project root to the path to import assets
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+sys.path.insert(0, project_root)
+
+from assets.sprites.surface_optimizer import optimize_surface
 
 class TicTacToePuzzleState(GameState):
     def __init__(self, screen):
@@ -31,13 +41,20 @@ class TicTacToePuzzleState(GameState):
         self.grid_y = (self.screen_height - self.grid_size) // 2
 
         # UI
-        self.font = pygame.font.Font(None, 48)
-        self.small_font = pygame.font.Font(None, 32)
+        self.font = get_font(48)
+        self.small_font = get_font(32)
+
+        # Background, dimming and title - composed once, drawn as one blit
+        self.background_layer = StaticLayer((self.screen_width, self.screen_height), transparent=False)
+        self.background_layer.add(self.draw_background_layer)
 
         # Game state
         self.puzzle_solved = False
         self.selected_cell = [0, 0]  # For keyboard navigation
 
+        # Dirty-rect mode: areas changed since the last render (None = whole screen)
+        self.dirty_rects = None
+
         print("Tic-tac-toe puzzle loaded! Match the pattern to unlock the door.")
 
     def load_door_background(self):
@@ -49,6 +66,7 @@ class TicTacToePuzzleState(GameState):
             if os.path.exists(door_path):
                 background = pygame.image.load(door_path)
                 background = pygame.transform.scale(background, (self.screen_width, self.screen_height))
+                background = optimize_surface(background)
                 print(f"Loaded door background from: {door_path}")
                 return background
             else:
@@ -87,21 +105,27 @@ class TicTacToePuzzleState(GameState):
             elif event.key == pygame.K_r:
                 # Reset puzzle
                 self.reset_puzzle()
+                self.mark_dirty()
             elif event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
                 # Place symbol in selected cell
                 self.place_symbol()
             elif event.key == pygame.K_TAB:
                 # Switch symbol
                 self.current_symbol = 'O' if self.current_symbol == 'X' else 'X'
+                self.mark_dirty(self.get_symbol_indicator_rect())
             # Arrow key navigation
             elif event.key == pygame.K_LEFT:
                 self.selected_cell[0] = max(0, self.selected_cell[0] - 1)
+                self.mark_dirty(self.get_grid_rect())
             elif event.key == pygame.K_RIGHT:
                 self.selected_cell[0] = min(2, self.selected_cell[0] + 1)
+                self.mark_dirty(self.get_grid_rect())
             elif event.key == pygame.K_UP:
                 self.selected_cell[1] = max(0, self.selected_cell[1] - 1)
+                self.mark_dirty(self.get_grid_rect())
             elif event.key == pygame.K_DOWN:
                 self.selected_cell[1] = min(2, self.selected_cell[1] + 1)
+                self.mark_dirty(self.get_grid_rect())
 
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left click
@@ -133,6 +157,20 @@ class TicTacToePuzzleState(GameState):
             self.board[row][col] = self.current_symbol
             self.check_solution()
 
+            # Solving swaps the solution pattern for the unlocked message
+            if self.puzzle_solved:
+                self.mark_dirty()
+            else:
+                self.mark_dirty(self.get_grid_rect())
+
+    def get_grid_rect(self):
+        """Screen area of the puzzle grid, including the selection highlight"""
+        return pygame.Rect(self.grid_x, self.grid_y, self.grid_size, self.grid_size).inflate(10, 10)
+
+    def get_symbol_indicator_rect(self):
+        """Screen area of the current symbol indicator"""
+        return pygame.Rect(50, self.screen_height - 150, 300, 30)
+
     def check_solution(self):
         """Check if the puzzle is solved"""
         if self.board == self.solution:
@@ -148,20 +186,22 @@ class TicTacToePuzzleState(GameState):
         # No real-time updates needed for this puzzle
         pass
 
-    def render(self, screen):
+    def draw_background_layer(self, surface):
+        """Draw the background and everything fixed on top of it"""
         # Draw door background
-        screen.blit(self.background, (0, 0))
+        surface.blit(self.background, (0, 0))
 
         # Semi-transparent overlay for better text visibility
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(100)
-        overlay.fill((0, 0, 0))
-        screen.blit(overlay, (0, 0))
+        compositor.dim(surface, 100)
 
         # Title
         title_text = self.font.render("Door Lock Puzzle", True, (255, 255, 255))
         title_rect = title_text.get_rect(center=(self.screen_width // 2, 50))
-        screen.blit(title_text, title_rect)
+        surface.blit(title_text, title_rect)
+
+    def render(self, screen):
+        # Draw background and labels
+        self.background_layer.draw(screen)
 
         # Draw main puzzle grid (center-left)
         self.draw_grid(screen)
@@ -191,6 +231,9 @@ class TicTacToePuzzleState(GameState):
             text = self.small_font.render(control, True, (200, 200, 200))
             screen.blit(text, (50, self.screen_height - 120 + i * 25))
 
+        # Everything is up to date until the next input
+        self.dirty_rects = []
+
     def draw_solution_pattern(self, screen):
         """Draw the target pattern on the right side"""
         pattern_size = 150
@@ -224,7 +267,7 @@ class TicTacToePuzzleState(GameState):
                 symbol = self.solution[row][col]
                 if symbol:
                     color = (255, 0, 0) if symbol == 'X' else (0, 0, 255)  # Red X, Blue O
-                    font = pygame.font.Font(None, int(pattern_cell_size * 0.6))
+                    font = get_font(int(pattern_cell_size * 0.6))
                     text = font.render(symbol, True, color)
                     text_rect = text.get_rect(center=(cell_x + pattern_cell_size // 2,
                                                     cell_y + pattern_cell_size // 2))
@@ -6,9 +6,22 @@ import math
 from .game_state import GameState
 from ..audio.audio_manager import AudioManager
 from ..ui.quit_overlay import QuitOverlay
+from ..rendering.compositor import compositor
+from ..ui.text_cache import text_cache
+from ..ui.font_registry import get_font, STORY_FONT_CANDIDATES
+from ..ui.bitmap_font import get_bitmap_font
+from ..rendering.static_layer import StaticLayer
+from ..effects.wind_field import WindField
+from ..effects.particles import ParticleSystem, ParticleEmitter, PARTICLE_BUDGETS
+
+# Add the project root to the path to import assets
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+sys.path.insert(0, project_root)
+
+from assets.sprites.surface_optimizer import optimize_surface
 
 class Scene0State(GameState):
-    def __init__(self, screen, audio_manager=None):
+    def __init__(self, screen, audio_manager=None, weather=None):
         self.screen = screen
         self.screen_width = screen.get_width()
         self.screen_height = screen.get_height()
@@ -47,30 +60,10 @@ class Scene0State(GameState):
         self.visible_lines = 12  # Number of lines visible at once
         self.max_scroll = max(0, len(self.story_text) * self.line_height - (self.visible_lines * self.line_height))
 
-        # Load font
-        try:
-            font_candidates = [
-                'Times New Roman',  # Classic serif
-                'Georgia',         # Web-safe serif
-                'Garamond',        # Classic book font
-                'Book Antiqua',    # Victorian-style
-                'Palatino',        # Elegant serif
-            ]
-            self.text_font = None
-            for font_name in font_candidates:
-                try:
-                    self.text_font = pygame.font.SysFont(font_name, 22)
-                    print(f"Using font: {font_name}")
-                    break
-                except:
-                    continue
-
-            if self.text_font is None:
-                self.text_font = pygame.font.Font(None, 22)
-                print("Using default pygame font")
-
-        except:
-            self.text_font = pygame.font.Font(None, 22)
+        # Story font - first installed serif, resolved once per process by the font registry
+        self.text_font = get_font(22, STORY_FONT_CANDIDATES)
+        self.story_shadow_glyphs = get_bitmap_font(self.text_font, (0, 0, 0))
+        self.story_glyphs = get_bitmap_font(self.text_font, (240, 230, 210))
 
         self.text_visible = True
 
@@ -96,12 +89,24 @@ class Scene0State(GameState):
         self.setup_birds()
 
         # Wind and sunshine effects
-        self.wind_particles = []
-        self.setup_wind_particles()
+        self.wind_particles = ParticleSystem(PARTICLE_BUDGETS["wind"], [(200, 200, 255)],  # Light blue-white
+                                             fade_out=False)
+        self.wind_emitter = ParticleEmitter(self.wind_particles,
+                                            area=(0, self.screen_width, 0, self.screen_height // 2),
+                                            velocity=((0, 0), (-5, 5)),
+                                            size=(1, 4), alpha=(30, 80),
+                                            wind_speed=(20, 40), whole_sizes=True)
+        self.wind_emitter.emit(20, 0, 0)
+
+        # Wind particles ride the game's wind field (the storm of the later scenes is already brewing)
+        self.wind = weather.wind if weather else WindField(self.screen_width, self.screen_height)
         self.sun_position = (self.screen_width - 150, 100)
         self.sun_rays = []
         self.setup_sun_rays()
 
+        # Sun and rays never change, so they are drawn once into a cached layer
+        self.build_sun_layer()
+
         # Use shared audio manager or create new one
         if audio_manager:
             self.audio = audio_manager
@@ -117,6 +122,14 @@ class Scene0State(GameState):
         # Quit overlay
         self.quit_overlay = QuitOverlay()
 
+        # HUD fonts - shared via the font registry, text is rendered through the shared text cache
+        self.scene_font = get_font(36)
+        self.instruction_font = get_font(24)
+
+        # Scene number and instructions - composed once, drawn as one blit
+        self.hud_layer = StaticLayer((self.screen_width, self.screen_height))
+        self.hud_layer.add(self.draw_hud_labels)
+
         print("Scene 0 initialized - Story intro with bunker background")
 
     def load_bunker_background(self):
@@ -128,6 +141,7 @@ class Scene0State(GameState):
             if os.path.exists(bg_path):
                 background = pygame.image.load(bg_path)
                 background = pygame.transform.scale(background, (self.screen_width, self.screen_height))
+                background = optimize_surface(background)
                 print(f"Loaded bunker background from: {bg_path}")
                 return background
             else:
@@ -177,19 +191,6 @@ class Scene0State(GameState):
             }
             self.birds.append(bird)
 
-    def setup_wind_particles(self):
-        """Setup wind particles for atmospheric effect"""
-        for i in range(20):
-            particle = {
-                'x': random.randint(0, self.screen_width),
-                'y': random.randint(0, self.screen_height // 2),
-                'speed_x': random.uniform(20, 40),
-                'speed_y': random.uniform(-5, 5),
-                'alpha': random.randint(30, 80),
-                'size': random.randint(1, 3)
-            }
-            self.wind_particles.append(particle)
-
     def setup_sun_rays(self):
         """Setup sun rays for sunshine effect"""
         for i in range(8):
@@ -201,6 +202,27 @@ class Scene0State(GameState):
             }
             self.sun_rays.append(ray)
 
+    def build_sun_layer(self):
+        """Draw the rays and the sun into a layer just big enough to hold them"""
+        sun_x, sun_y = self.sun_position
+        reach = max(ray['length'] for ray in self.sun_rays) + 2
+        layer = pygame.Surface((reach * 2, reach * 2), pygame.SRCALPHA)
+
+        # Lines on a SRCALPHA surface keep their exact color and alpha,
+        # so blitting the layer blends each ray like a direct draw would
+        for ray in self.sun_rays:
+            end_x = reach + math.cos(ray['angle']) * ray['length']
+            end_y = reach + math.sin(ray['angle']) * ray['length']
+            color = (255, 255, 200, ray['alpha'])
+            pygame.draw.line(layer, color, (reach, reach), (end_x, end_y), 3)
+
+        # Draw sun
+        pygame.draw.circle(layer, (255, 255, 150), (reach, reach), 25)
+        pygame.draw.circle(layer, (255, 255, 200), (reach, reach), 20)
+
+        self.sun_layer = layer
+        self.sun_layer_offset = (sun_x - reach, sun_y - reach)
+
     def update_birds(self, dt):
         """Update bird positions and animation"""
         for bird in self.birds:
@@ -214,15 +236,16 @@ class Scene0State(GameState):
                 bird['y'] = random.randint(50, 200)
 
     def update_wind_particles(self, dt):
-        """Update wind particle positions"""
-        for particle in self.wind_particles:
-            particle['x'] += particle['speed_x'] * dt
-            particle['y'] += particle['speed_y'] * dt
+        """Update wind particle positions, carried by the wind field"""
+        self.wind.update(dt)
+
+        # Particles keep their own speed in the average wind and speed up in gusts
+        self.wind_particles.update(dt, self.wind)
 
-            # Reset particle if it goes off screen
-            if particle['x'] > self.screen_width:
-                particle['x'] = -10
-                particle['y'] = random.randint(0, self.screen_height // 2)
+        # Respawn particles that blew off the right edge on the left
+        blown_away = self.wind_particles.kill_outside(
+            pygame.Rect(-20, -self.screen_height, self.screen_width + 20, self.screen_height * 3))
+        self.wind_emitter.emit(blown_away, -10, 0, area=(0, 0, 0, self.screen_height // 2))
 
     def draw_bird(self, screen, bird):
         """Draw a simple animated bird"""
@@ -235,37 +258,9 @@ class Scene0State(GameState):
         # Wings (simple lines that flap)
         pygame.draw.line(screen, (40, 40, 40), (x - 8, y + wing_offset), (x + 8, y - wing_offset), 2)
 
-    def draw_wind_particles(self, screen):
-        """Draw wind particles"""
-        for particle in self.wind_particles:
-            x, y = int(particle['x']), int(particle['y'])
-            size = particle['size']
-            alpha = particle['alpha']
-
-            # Create a small surface for the particle with alpha
-            particle_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            color = (200, 200, 255, alpha)  # Light blue-white
-            pygame.draw.circle(particle_surface, color, (size, size), size)
-            screen.blit(particle_surface, (x - size, y - size))
-
     def draw_sun_and_rays(self, screen):
         """Draw sun with rays"""
-        sun_x, sun_y = self.sun_position
-
-        # Draw sun rays
-        for ray in self.sun_rays:
-            end_x = sun_x + math.cos(ray['angle']) * ray['length']
-            end_y = sun_y + math.sin(ray['angle']) * ray['length']
-
-            # Create surface for ray with alpha
-            ray_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-            color = (255, 255, 200, ray['alpha'])
-            pygame.draw.line(ray_surface, color, (sun_x, sun_y), (end_x, end_y), 3)
-            screen.blit(ray_surface, (0, 0))
-
-        # Draw sun
-        pygame.draw.circle(screen, (255, 255, 150), (sun_x, sun_y), 25)
-        pygame.draw.circle(screen, (255, 255, 200), (sun_x, sun_y), 20)
+        screen.blit(self.sun_layer, self.sun_layer_offset)
 
     def handle_event(self, event):
         # Handle quit overlay input first if it's visible
@@ -345,13 +340,35 @@ class Scene0State(GameState):
 
         return None
 
+    def draw_hud_labels(self, surface):
+        """Draw the scene labels that never change"""
+        # Draw scene number and instructions
+        scene_text = text_cache.render(self.scene_font, "SCENE 0", True, (255, 255, 255))
+        scene_rect = scene_text.get_rect()
+        scene_rect.topright = (self.screen_width - 20, 20)
+
+        # Draw scene background
+        scene_bg_rect = scene_rect.inflate(10, 5)
+        pygame.draw.rect(surface, (0, 0, 0, 180), scene_bg_rect)
+        surface.blit(scene_text, scene_rect)
+
+        instructions = "Story scrolling... • ENTER Skip to game • SPACE Toggle audio • ESC Quit"
+        instruction_text = text_cache.render(self.instruction_font, instructions, True, (255, 255, 255))
+        instruction_rect = instruction_text.get_rect()
+        instruction_rect.center = (self.screen_width // 2, 30)
+
+        # Draw instruction background
+        bg_rect = instruction_rect.inflate(20, 10)
+        pygame.draw.rect(surface, (0, 0, 0, 180), bg_rect)
+        surface.blit(instruction_text, instruction_rect)
+
     def render(self, screen):
         # Draw background
         screen.blit(self.background, (0, 0))
 
         # Draw atmospheric effects behind text
         self.draw_sun_and_rays(screen)
-        self.draw_wind_particles(screen)
+        self.wind_particles.draw(screen)
 
         # Draw birds
         for bird in self.birds:
@@ -384,46 +401,20 @@ class Scene0State(GameState):
 
                 if line:  # Skip empty lines for rendering
                     # Add text shadow for better readability
-                    shadow_surface = self.text_font.render(line, True, (0, 0, 0))
-                    shadow_surface.set_alpha(self.text_alpha)
-                    screen.blit(shadow_surface, (text_start_x + 2, line_y + 2))
+                    self.story_shadow_glyphs.draw(screen, line, (text_start_x + 2, line_y + 2), self.text_alpha)
 
                     # Main text
-                    text_surface = self.text_font.render(line, True, (240, 230, 210))
-                    text_surface.set_alpha(self.text_alpha)
-                    screen.blit(text_surface, (text_start_x, line_y))
+                    self.story_glyphs.draw(screen, line, (text_start_x, line_y), self.text_alpha)
 
             # Restore clipping
             screen.set_clip(original_clip)
 
-        # Draw scene number and instructions
-        scene_font = pygame.font.Font(None, 36)
-        scene_text = scene_font.render("SCENE 0", True, (255, 255, 255))
-        scene_rect = scene_text.get_rect()
-        scene_rect.topright = (self.screen_width - 20, 20)
-
-        # Draw scene background
-        scene_bg_rect = scene_rect.inflate(10, 5)
-        pygame.draw.rect(screen, (0, 0, 0, 180), scene_bg_rect)
-        screen.blit(scene_text, scene_rect)
-
-        instructions = "Story scrolling... • ENTER Skip to game • SPACE Toggle audio • ESC Quit"
-        instruction_font = pygame.font.Font(None, 24)
-        instruction_text = instruction_font.render(instructions, True, (255, 255, 255))
-        instruction_rect = instruction_text.get_rect()
-        instruction_rect.center = (self.screen_width // 2, 30)
-
-        # Draw instruction background
-        bg_rect = instruction_rect.inflate(20, 10)
-        pygame.draw.rect(screen, (0, 0, 0, 180), bg_rect)
-        screen.blit(instruction_text, instruction_rect)
+        # Draw labels
+        self.hud_layer.draw(screen)
 
         # Draw fade overlay if transitioning
         if self.fade_transition and self.fade_alpha > 0:
-            fade_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-            fade_color = (0, 0, 0, self.fade_alpha)
-            fade_surface.fill(fade_color)
-            screen.blit(fade_surface, (0, 0))
+            compositor.fade(screen, self.fade_alpha)
 
         # Draw quit overlay on top of everything
         self.quit_overlay.render(screen)
@@ -1,9 +1,14 @@
 import pygame
 import sys
 import os
+import math
 from .game_state import GameState
 from ..ui.quit_overlay import QuitOverlay
+from ..ui.text_cache import text_cache
+from ..ui.font_registry import get_font
 from ..audio.audio_manager import AudioManager
+from ..rendering.static_layer import StaticLayer
+from ..effects.particles import ParticleSystem, ParticleEmitter, PARTICLE_BUDGETS
 
 # Add the project root to the path to import assets
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
@@ -11,6 +16,7 @@ sys.path.insert(0, project_root)
 
 from assets.sprites.protagonist import create_protagonist_animation_system
 from assets.backgrounds.collision_map import CollisionMap
+from assets.sprites.surface_optimizer import optimize_surface
 
 class Scene5State(GameState):
     def __init__(self, screen, audio_manager=None):
@@ -84,10 +90,15 @@ class Scene5State(GameState):
         self.fade_alpha = 0
 
         # Splash effect system
-        self.splash_active = False
-        self.splash_timer = 0.0
         self.splash_duration = 1.0  # 1 second splash effect
-        self.splash_particles = []
+        self.splash_particles = ParticleSystem(PARTICLE_BUDGETS["splash"], [(100, 120, 140)],  # Water blue-gray
+                                               gravity=300, shrink=True)
+        self.splash_emitter = ParticleEmitter(self.splash_particles,
+                                              area=(-10, 10, -5, 5),
+                                              velocity=((0, 0), (-100, -50)),  # Upward bias
+                                              speed=(50, 150), angle=(0, 2 * math.pi),
+                                              lifetime=(self.splash_duration, self.splash_duration),
+                                              size=(2, 5))
 
         # Audio manager (no rain in this scene)
         if audio_manager:
@@ -104,6 +115,18 @@ class Scene5State(GameState):
         # Quit overlay
         self.quit_overlay = QuitOverlay()
 
+        # HUD fonts - shared via the font registry, text is rendered through the shared text cache
+        self.scene_font = get_font(36)
+        self.location_font = get_font(24)
+
+        # Background with the scene number - composed once, drawn as one blit
+        self.background_layer = StaticLayer((self.screen_width, self.screen_height), transparent=False)
+        self.background_layer.add(self.draw_background_layer)
+
+        # Location label - recomposed when the fall ends
+        self.hud_layer = StaticLayer((self.screen_width, self.screen_height))
+        self.hud_layer.add(self.draw_hud_labels)
+
         print("Scene 5 initialized - Inside the bunker!")
 
     def load_bunker_room_background(self):
@@ -115,6 +138,7 @@ class Scene5State(GameState):
             if os.path.exists(bg_path):
                 background = pygame.image.load(bg_path)
                 background = pygame.transform.scale(background, (self.screen_width, self.screen_height))
+                background = optimize_surface(background)
                 print(f"Loaded bunker room background from: {bg_path}")
                 return background
             else:
@@ -212,69 +236,9 @@ class Scene5State(GameState):
 
     def create_splash_effect(self):
         """Create splash particles when landing in puddle"""
-        import random
-        import math
-
-        self.splash_active = True
-        self.splash_timer = 0.0
-        self.splash_particles = []
-
-        # Create splash particles around landing position
-        center_x = self.protagonist_x + 32  # Center of protagonist
-        center_y = self.protagonist_y + 64  # Bottom of protagonist
-
-        for i in range(20):  # 20 splash particles
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(50, 150)
-            particle = {
-                'x': center_x + random.uniform(-10, 10),
-                'y': center_y + random.uniform(-5, 5),
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed - random.uniform(50, 100),  # Upward bias
-                'size': random.uniform(2, 5),
-                'life': 1.0,
-                'color': (100, 120, 140)  # Water blue-gray
-            }
-            self.splash_particles.append(particle)
-
-    def update_splash_effect(self, dt):
-        """Update splash particle system"""
-        if not self.splash_active:
-            return
-
-        self.splash_timer += dt
-
-        # Update particles
-        for particle in self.splash_particles[:]:
-            particle['x'] += particle['vx'] * dt
-            particle['y'] += particle['vy'] * dt
-            particle['vy'] += 300 * dt  # Gravity
-            particle['life'] -= dt / self.splash_duration
-
-            # Remove dead particles
-            if particle['life'] <= 0:
-                self.splash_particles.remove(particle)
-
-        # End splash effect when timer expires
-        if self.splash_timer >= self.splash_duration:
-            self.splash_active = False
-            self.splash_particles = []
-
-    def draw_splash_effect(self, screen):
-        """Draw splash particles"""
-        if not self.splash_active:
-            return
-
-        for particle in self.splash_particles:
-            if particle['life'] > 0:
-                alpha = int(255 * particle['life'])
-                size = int(particle['size'] * particle['life'])
-                if size > 0:
-                    # Create surface for particle with alpha
-                    particle_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-                    color = (*particle['color'], alpha)
-                    pygame.draw.circle(particle_surface, color, (size, size), size)
-                    screen.blit(particle_surface, (int(particle['x'] - size), int(particle['y'] - size)))
+        # 20 splash particles around the bottom center of the protagonist
+        self.splash_particles.clear()
+        self.splash_emitter.emit(20, self.protagonist_x + 32, self.protagonist_y + 64)
 
     def handle_event(self, event):
         # Handle quit overlay input first if it's visible
@@ -308,6 +272,7 @@ class Scene5State(GameState):
             if self.protagonist_y >= self.target_y:
                 self.protagonist_y = self.target_y
                 self.is_falling = False
+                self.hud_layer.invalidate()  # Location label changes
                 print("Protagonist landed in bunker room with a splash!")
                 # Create splash effect
                 self.create_splash_effect()
@@ -371,24 +336,44 @@ class Scene5State(GameState):
         self.protagonist_animation.update(dt)
 
         # Update splash effect
-        self.update_splash_effect(dt)
+        self.splash_particles.update(dt)
 
         return None
 
-    def render(self, screen):
+    def draw_background_layer(self, surface):
+        """Draw the background and everything fixed on top of it"""
         # Draw background
-        screen.blit(self.background, (0, 0))
+        surface.blit(self.background, (0, 0))
 
         # Draw scene number
-        scene_font = pygame.font.Font(None, 36)
-        scene_text = scene_font.render("SCENE 5", True, (255, 255, 255))
+        scene_text = text_cache.render(self.scene_font, "SCENE 5", True, (255, 255, 255))
         scene_rect = scene_text.get_rect()
         scene_rect.topright = (self.screen_width - 20, 20)
 
         # Draw scene background
         scene_bg_rect = scene_rect.inflate(10, 5)
-        pygame.draw.rect(screen, (0, 0, 0, 180), scene_bg_rect)
-        screen.blit(scene_text, scene_rect)
+        pygame.draw.rect(surface, (0, 0, 0, 180), scene_bg_rect)
+        surface.blit(scene_text, scene_rect)
+
+    def draw_hud_labels(self, surface):
+        """Draw the location label (changes once the fall ends)"""
+        # Draw location text
+        if self.is_falling:
+            location_text = text_cache.render(self.location_font, "Falling into the bunker - SCENE 5", True, (255, 255, 255))
+        else:
+            location_text = text_cache.render(self.location_font, "Inside the bunker - SCENE 5", True, (255, 255, 255))
+
+        text_rect = location_text.get_rect()
+        text_rect.topleft = (10, 10)
+
+        # Draw text background
+        bg_rect = text_rect.inflate(10, 5)
+        pygame.draw.rect(surface, (0, 0, 0, 128), bg_rect)
+        surface.blit(location_text, text_rect)
+
+    def render(self, screen):
+        # Draw background and labels
+        self.background_layer.draw(screen)
 
         # Draw protagonist
         protagonist_sprite = self.protagonist_animation.get_current_frame()
@@ -401,22 +386,10 @@ class Scene5State(GameState):
             screen.blit(protagonist_sprite, (int(self.protagonist_x), int(self.protagonist_y)))
 
         # Draw splash effect
-        self.draw_splash_effect(screen)
-
-        # Draw location text
-        font = pygame.font.Font(None, 24)
-        if self.is_falling:
-            location_text = font.render("Falling into the bunker - SCENE 5", True, (255, 255, 255))
-        else:
-            location_text = font.render("Inside the bunker - SCENE 5", True, (255, 255, 255))
-
-        text_rect = location_text.get_rect()
-        text_rect.topleft = (10, 10)
+        self.splash_particles.draw(screen)
 
-        # Draw text background
-        bg_rect = text_rect.inflate(10, 5)
-        pygame.draw.rect(screen, (0, 0, 0, 128), bg_rect)
-        screen.blit(location_text, text_rect)
+        # Draw labels
+        self.hud_layer.draw(screen)
 
         # Draw quit overlay
         self.quit_overlay.render(screen)
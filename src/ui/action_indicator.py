@@ -2,6 +2,7 @@
 
 import pygame
 import math
+from .font_registry import get_font
 
 class ActionIndicator:
     def __init__(self, x, y):
@@ -9,19 +10,8 @@ class ActionIndicator:
         self.y = y
         self.visible = False
 
-        # Try to load a system font, fallback to default
-        try:
-            self.font = pygame.font.SysFont('Arial', 48, bold=True)
-            print("ActionIndicator: Using Arial font")
-        except:
-            try:
-                self.font = pygame.font.Font(None, 48)
-                print("ActionIndicator: Using default pygame font")
-            except Exception as e:
-                print(f"ActionIndicator: Font loading failed: {e}")
-                # Last resort - use get_default_font
-                self.font = pygame.font.Font(pygame.font.get_default_font(), 48)
-                print("ActionIndicator: Using system default font")
+        # Arial if installed, otherwise the default font (shared between scenes)
+        self.font = get_font(48, 'Arial', bold=True)
 
         self.pulse_timer = 0
         self.pulse_speed = 3.0  # Speed of pulsing animation
@@ -0,0 +1,117 @@
+"""Bitmap fonts - glyphs are rasterized once into an atlas and strings are drawn with one blits() call"""
+
+import pygame
+
+# Printable ASCII is rasterized up front, anything else is added on first use
+DEFAULT_CHARSET = ''.join(chr(code) for code in range(32, 127))
+
+
+class BitmapFont:
+    def __init__(self, font, color, antialias=True, charset=DEFAULT_CHARSET):
+        """
+        Glyph atlas for drawing frequently changing text (HP counters, damage numbers, logs)
+
+        Layout is kerning-free: each glyph advances by its own rendered width.
+
+        Args:
+            font: pygame Font to rasterize glyphs from
+            color: Text color baked into the atlas
+            antialias: Whether to antialias the glyphs
+            charset: Characters rasterized up front
+        """
+        self.font = font
+        self.color = tuple(color)
+        self.antialias = antialias
+        self.height = font.get_height()
+
+        # char -> (atlas area, advance)
+        self.glyphs = {}
+        self.charset = ''.join(dict.fromkeys(charset))
+        self.atlas = None
+        self.alpha = None
+        self.build_atlas()
+
+    def build_atlas(self):
+        """Rasterize every glyph in the charset into a single-row atlas"""
+        glyph_surfaces = [(char, self.font.render(char, self.antialias, self.color)) for char in self.charset]
+        atlas_width = max(1, sum(surface.get_width() for _, surface in glyph_surfaces))
+
+        atlas = pygame.Surface((atlas_width, self.height), pygame.SRCALPHA)
+        self.glyphs = {}
+        x = 0
+        for char, surface in glyph_surfaces:
+            width = surface.get_width()
+            # Glyphs never overlap, so MAX copies them without darkening the edges
+            atlas.blit(surface, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self.glyphs[char] = (pygame.Rect(x, 0, width, self.height), width)
+            x += width
+
+        if pygame.display.get_surface() is not None:
+            atlas = atlas.convert_alpha()
+
+        self.atlas = atlas
+        if self.alpha is not None:
+            self.atlas.set_alpha(self.alpha)
+
+    def get_glyph(self, char):
+        """Get (area, advance) for a character, growing the atlas for new characters"""
+        glyph = self.glyphs.get(char)
+        if glyph is None:
+            self.charset += char
+            self.build_atlas()
+            glyph = self.glyphs[char]
+        return glyph
+
+    def size(self, text):
+        """Width and height of a string, like Font.size()"""
+        return sum(self.get_glyph(char)[1] for char in text), self.height
+
+    def get_rect(self, text, **kwargs):
+        """Rect of a string positioned with Rect keyword arguments (center=, topleft=, ...)"""
+        rect = pygame.Rect((0, 0), self.size(text))
+        for name, value in kwargs.items():
+            setattr(rect, name, value)
+        return rect
+
+    def draw(self, surface, text, pos, alpha=None):
+        """
+        Draw a string with a single blits() call
+
+        Args:
+            surface: Surface to draw on
+            text: String to draw
+            pos: Top-left position
+            alpha: Optional surface alpha (0-255) for fading text
+
+        Returns:
+            Rect covering the drawn string
+        """
+        # Look glyphs up first - a new character rebuilds the atlas
+        glyphs = [self.get_glyph(char) for char in text]
+
+        if alpha != self.alpha:
+            self.alpha = alpha
+            self.atlas.set_alpha(alpha)
+
+        x, y = pos
+        start_x = x
+        sequence = []
+        for area, advance in glyphs:
+            sequence.append((self.atlas, (x, y), area))
+            x += advance
+
+        surface.blits(sequence, doreturn=False)
+        return pygame.Rect(start_x, y, x - start_x, self.height)
+
+
+# Atlases already built, by (font, color, antialias)
+_bitmap_fonts = {}
+
+def get_bitmap_font(font, color, antialias=True):
+    """Get a shared BitmapFont for a font and color"""
+    key = (font, tuple(color), antialias)
+    bitmap_font = _bitmap_fonts.get(key)
+    if bitmap_font is None:
+        bitmap_font = BitmapFont(font, color, antialias)
+        _bitmap_fonts[key] = bitmap_font
+    return bitmap_font
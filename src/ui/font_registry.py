@@ -0,0 +1,180 @@
+"""Shared fonts - system font names are resolved once and Font objects are reused"""
+
+import pygame
+import pygame.sysfont
+import os
+import json
+
+# Serif faces tried in order for story text
+STORY_FONT_CANDIDATES = (
+    'Times New Roman',  # Classic serif
+    'Georgia',          # Web-safe serif
+    'Garamond',         # Classic book font
+    'Book Antiqua',     # Victorian-style
+    'Palatino',         # Elegant serif
+)
+
+def get_cache_path():
+    """File holding system font lookups that survive between runs"""
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    return os.path.join(project_root, "cache", "font_paths.json")
+
+def match_face(name, bold=False, italic=False):
+    """
+    Find a system font file the way SysFont does, along with the style that file really has
+
+    Args:
+        name: System font name
+        bold: Prefer a bold face
+        italic: Prefer an italic face
+
+    Returns:
+        (path, face_bold, face_italic), path None when the font isn't installed
+    """
+    pygame.sysfont.initsysfonts()
+    simple_name = ''.join(char for char in name.lower() if char.isalnum())
+    styles = pygame.sysfont.Sysfonts.get(simple_name) or pygame.sysfont.Sysalias.get(simple_name)
+    if not styles:
+        return None, False, False
+
+    if (bold, italic) in styles:
+        return styles[(bold, italic)], bold, italic
+    if (False, False) in styles:
+        return styles[(False, False)], False, False
+
+    # Neither the requested style nor a regular face - take any installed style
+    (face_bold, face_italic), path = next(iter(styles.items()))
+    return path, face_bold, face_italic
+
+
+class FontRegistry:
+    def __init__(self, persist=True, cache_path=None):
+        """
+        Hands out shared Font instances by (family, size, style)
+
+        Args:
+            persist: Save system font lookups to disk so later runs skip them
+            cache_path: Lookup cache file (defaults to cache/font_paths.json)
+        """
+        self.persist = persist
+        self.cache_path = cache_path or get_cache_path()
+
+        # (family, bold, italic) -> (font file path, face bold, face italic), path None for the default font
+        self.resolved = {}
+        self.fonts = {}
+        self.cache_loaded = False
+
+    def load_cache(self):
+        """Read font lookups saved by an earlier run"""
+        self.cache_loaded = True
+        if not self.persist or not os.path.exists(self.cache_path):
+            return
+
+        try:
+            with open(self.cache_path) as cache_file:
+                saved = json.load(cache_file)
+        except (OSError, ValueError) as e:
+            print(f"Could not read font cache {self.cache_path}: {e}")
+            return
+
+        for entry in saved:
+            path = entry['path']
+            # Fonts can be uninstalled between runs - look those up again
+            # (as are entries saved before the face style was recorded)
+            if 'face_bold' in entry and (path is None or os.path.exists(path)):
+                key = (entry['family'], entry['bold'], entry['italic'])
+                self.resolved[key] = (path, entry['face_bold'], entry['face_italic'])
+
+    def save_cache(self):
+        """Write font lookups so the next run does not have to scan system fonts"""
+        if not self.persist:
+            return
+
+        saved = [{'family': family, 'bold': bold, 'italic': italic,
+                  'path': path, 'face_bold': face_bold, 'face_italic': face_italic}
+                 for (family, bold, italic), (path, face_bold, face_italic) in self.resolved.items()]
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(self.cache_path, 'w') as cache_file:
+                json.dump(saved, cache_file, indent=1)
+        except OSError as e:
+            print(f"Could not save font cache {self.cache_path}: {e}")
+
+    def resolve(self, family, bold=False, italic=False):
+        """
+        Find the font file for a system font name, scanning system fonts at most once
+
+        Args:
+            family: System font name, or a sequence of names tried in order
+            bold: Prefer a bold face
+            italic: Prefer an italic face
+
+        Returns:
+            (path, face_bold, face_italic) - the font file and the style it really has,
+            path None when only pygame's default font is available
+        """
+        if not self.cache_loaded:
+            self.load_cache()
+
+        names = [family] if isinstance(family, str) else list(family)
+        changed = False
+        face = (None, False, False)
+        for name in names:
+            key = (name, bold, italic)
+            if key not in self.resolved:
+                self.resolved[key] = match_face(name, bold, italic)
+                changed = True
+            face = self.resolved[key]
+            if face[0]:
+                break
+
+        if changed:
+            self.save_cache()
+        return face
+
+    def get_font(self, size, family=None, bold=False, italic=False):
+        """
+        Get a shared Font - created on first request, reused afterwards
+
+        Args:
+            size: Font size in pixels
+            family: System font name or sequence of names (None = pygame default font)
+            bold: Bold style
+            italic: Italic style
+        """
+        family_key = family if family is None or isinstance(family, str) else tuple(family)
+        key = (family_key, size, bold, italic)
+
+        font = self.fonts.get(key)
+        if font is not None:
+            return font
+
+        path, face_bold, face_italic = self.resolve(family_key, bold, italic) if family_key else (None, False, False)
+        if path:
+            font = pygame.font.Font(path, size)
+            # Synthesize the styles the matched face lacks, like SysFont
+            font.set_bold(bold and not face_bold)
+            font.set_italic(italic and not face_italic)
+            print(f"Using font: {os.path.basename(path)} ({size}px)")
+        else:
+            # Same fallback as SysFont - default font with synthetic styles
+            font = pygame.font.Font(None, size)
+            font.set_bold(bold)
+            font.set_italic(italic)
+            if family_key:
+                print(f"Font {family_key} not found, using default pygame font ({size}px)")
+
+        self.fonts[key] = font
+        return font
+
+    def clear(self):
+        """Drop shared Font objects (e.g. after pygame.font.quit)"""
+        self.fonts.clear()
+
+
+# Shared registry used by all game states
+font_registry = FontRegistry()
+
+def get_font(size, family=None, bold=False, italic=False):
+    """Get a shared Font from the game's font registry"""
+    return font_registry.get_font(size, family, bold, italic)
@@ -1,11 +1,15 @@
 import pygame
+from .text_cache import text_cache
+from .font_registry import get_font
+from ..rendering.compositor import compositor
 
 class QuitOverlay:
     def __init__(self):
         self.visible = False
         self.selected_option = 0  # 0 = Resume, 1 = Quit
-        self.font_large = pygame.font.Font(None, 48)
-        self.font_medium = pygame.font.Font(None, 36)
+        self.font_large = get_font(48)
+        self.font_medium = get_font(36)
+        self.font_small = get_font(24)
 
         # Colors
         self.overlay_color = (0, 0, 0, 180)  # Semi-transparent black
@@ -26,6 +30,13 @@ class QuitOverlay:
         """Check if overlay is visible"""
         return self.visible
 
+    def get_panel_rect(self, screen_width, screen_height):
+        """Screen area covered by the pause panel (changes when the selection moves)"""
+        panel_width = 400
+        panel_height = 250
+        return pygame.Rect((screen_width - panel_width) // 2, (screen_height - panel_height) // 2,
+                           panel_width, panel_height)
+
     def handle_input(self, event):
         """Handle input events for the overlay"""
         if not self.visible:
@@ -57,10 +68,7 @@ class QuitOverlay:
         screen_height = screen.get_height()
 
         # Draw semi-transparent overlay
-        overlay = pygame.Surface((screen_width, screen_height))
-        overlay.set_alpha(180)
-        overlay.fill((0, 0, 0))
-        screen.blit(overlay, (0, 0))
+        compositor.dim(screen, 180)
 
         # Main panel dimensions
         panel_width = 400
@@ -112,11 +120,10 @@ class QuitOverlay:
             "ESC - Resume"
         ]
 
-        instruction_font = pygame.font.Font(None, 24)
         instruction_y = panel_y + panel_height + 20
 
         for i, instruction in enumerate(instructions):
-            instruction_text = instruction_font.render(instruction, True, (200, 200, 200))
+            instruction_text = text_cache.render(self.font_small, instruction, True, (200, 200, 200))
             instruction_rect = instruction_text.get_rect()
             instruction_rect.centerx = panel_x + panel_width // 2
             instruction_rect.y = instruction_y + i * 25
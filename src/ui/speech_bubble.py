@@ -1,4 +1,5 @@
 import pygame
+from .font_registry import get_font
 
 class SpeechBubble:
     def __init__(self, x, y, width=200, height=60):
@@ -8,7 +9,7 @@ class SpeechBubble:
         self.height = height
         self.visible = False
         self.text = ""
-        self.font = pygame.font.Font(None, 24)  # Smaller font for longer text
+        self.font = get_font(24)  # Smaller font for longer text
 
     def show(self, text="!", x=None, y=None):
         """Show speech bubble with text at position"""
@@ -81,7 +82,7 @@ class SpeechBubble:
 class InteractionPrompt:
     def __init__(self):
         self.visible = False
-        self.font = pygame.font.Font(None, 28)
+        self.font = get_font(28)
 
     def show(self):
         self.visible = True
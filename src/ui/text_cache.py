@@ -0,0 +1,80 @@
+"""Cache for rendered text surfaces so unchanged text is not rasterized every frame"""
+from collections import OrderedDict
+
+
+class TextCache:
+    def __init__(self, max_entries=256):
+        """
+        Bounded least-recently-used cache of font.render() output
+
+        render() takes the same arguments as font.render(), plus the font first.
+
+        Args:
+            max_entries: Number of rendered surfaces kept before the oldest is evicted
+        """
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, antialias, color, background=None):
+        """
+        Get a rendered text surface, rasterizing it only on a cache miss
+
+        The returned surface is shared - do not draw on it or change its alpha.
+
+        Args:
+            font: pygame Font used to render the text
+            text: String to render
+            antialias: Whether to antialias the text
+            color: Text color
+            background: Optional background color
+        """
+        key = (font, text, tuple(color), antialias,
+               tuple(background) if background is not None else None)
+
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        if background is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = font.render(text, antialias, color, background)
+
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+            self.evictions += 1
+
+        return surface
+
+    def get_hit_rate(self):
+        """Fraction of lookups served from the cache"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get_stats(self):
+        """Get cache statistics"""
+        return {
+            'entries': len(self.surfaces),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.get_hit_rate()
+        }
+
+    def clear(self):
+        """Drop all cached surfaces (statistics are kept)"""
+        self.surfaces.clear()
+
+
+# Shared cache used by all game states
+text_cache = TextCache()